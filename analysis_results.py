@@ -0,0 +1,342 @@
+"""
+Analysis Results Module
+Typed manufacturer analysis results and the long-form manufacturer table built from them
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from search_index import SearchIndex
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# One row per (part, candidate manufacturer)
+MANUFACTURER_TABLE_COLUMNS = ['part_id', 'rank', 'manufacturer', 'score', 'strengths', 'considerations']
+
+# Score distribution bands (lower bound inclusive)
+SCORE_BAND_EDGES = [-np.inf, 60, 70, 80, 90, np.inf]
+SCORE_BAND_LABELS = ['<60', '60-69', '70-79', '80-89', '90-100']
+
+# Quality tiers used by the dashboard filters and metrics
+QUALITY_EDGES = [-np.inf, 60, 80, np.inf]
+QUALITY_LABELS = ['Low', 'Medium', 'High']
+
+# Manufacturers value of a part whose analysis failed
+ERROR_MARKER = 'Error'
+
+
+def _to_score(value) -> float:
+    """Read a credibility score from a response, treating anything non-numeric as 0"""
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return score if score == score else 0.0
+
+
+@dataclass
+class ManufacturerCandidate:
+    """One manufacturer suggested for a part"""
+    
+    rank: int
+    name: str
+    score: float
+    strengths: List[str] = field(default_factory=list)
+    considerations: str = ''
+    
+    def detail_text(self) -> str:
+        """Render the candidate as it appears in the Detailed_Analysis column"""
+        return (f"{self.name} (Score: {self.score:g})\n"
+                f"Strengths: {', '.join(self.strengths)}\n"
+                f"Notes: {self.considerations}")
+
+
+@dataclass
+class PartAnalysis:
+    """Manufacturer analysis of one part, or the error that prevented it"""
+    
+    candidates: List[ManufacturerCandidate] = field(default_factory=list)
+    recommendation: str = ''
+    additional_info: str = ''
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_response(cls, result: Dict) -> 'PartAnalysis':
+        """
+        Build an analysis from a parsed API response
+        
+        Args:
+            result (Dict): Parsed JSON response with manufacturers, overall_recommendation
+                and additional_info
+        
+        Returns:
+            PartAnalysis: The typed result
+        """
+        candidates = []
+        for rank, manufacturer in enumerate(result.get('manufacturers', []), 1):
+            strengths = manufacturer.get('strengths', [])
+            candidates.append(ManufacturerCandidate(
+                rank=rank,
+                name=str(manufacturer.get('name') or 'Unknown'),
+                score=_to_score(manufacturer.get('credibility_score', 0)),
+                strengths=[strengths] if isinstance(strengths, str) else [str(s) for s in strengths],
+                considerations=str(manufacturer.get('considerations') or '')
+            ))
+        
+        return cls(
+            candidates=candidates,
+            recommendation=result.get('overall_recommendation', 'No recommendation available'),
+            additional_info=result.get('additional_info', '')
+        )
+    
+    @classmethod
+    def from_error(cls, error: Exception) -> 'PartAnalysis':
+        """Record a part whose analysis failed"""
+        return cls(error=str(error))
+    
+    @property
+    def top_manufacturer(self) -> str:
+        """Name of the highest ranked candidate"""
+        return self.candidates[0].name if self.candidates else 'Not Found'
+    
+    @property
+    def avg_score(self) -> float:
+        """Average credibility score of the candidates (0 if there are none)"""
+        if not self.candidates:
+            return 0
+        return round(sum(c.score for c in self.candidates) / len(self.candidates), 2)
+    
+    def to_columns(self) -> Dict:
+        """
+        Render the analysis as the flat result columns used by the Excel report
+        
+        Returns:
+            Dict: Result columns, or the error columns for a failed part
+        """
+        if self.error is not None:
+            return {
+                'Manufacturers': ERROR_MARKER,
+                'Credibility_Score': 0,
+                'Recommendation': f'Error: {self.error}',
+                'Details': ''
+            }
+        
+        return {
+            'Top_Manufacturer': self.top_manufacturer,
+            'All_Manufacturers': ' | '.join(c.name for c in self.candidates),
+            'Avg_Credibility_Score': self.avg_score,
+            'Recommendation': self.recommendation,
+            'Detailed_Analysis': '\n\n'.join(c.detail_text() for c in self.candidates),
+            'Additional_Info': self.additional_info
+        }
+
+
+def manufacturer_table(analyses: Iterable[Tuple[int, PartAnalysis]]) -> pd.DataFrame:
+    """
+    Build the long-form manufacturer table
+    
+    Args:
+        analyses (Iterable[Tuple[int, PartAnalysis]]): (part ID, analysis) pairs
+    
+    Returns:
+        pd.DataFrame: One row per candidate with MANUFACTURER_TABLE_COLUMNS;
+            failed parts contribute no rows
+    """
+    columns = {column: [] for column in MANUFACTURER_TABLE_COLUMNS}
+    for part_id, analysis in analyses:
+        for candidate in analysis.candidates:
+            columns['part_id'].append(part_id)
+            columns['rank'].append(candidate.rank)
+            columns['manufacturer'].append(candidate.name)
+            columns['score'].append(candidate.score)
+            columns['strengths'].append(', '.join(candidate.strengths))
+            columns['considerations'].append(candidate.considerations)
+    
+    return pd.DataFrame(columns).astype({
+        'part_id': 'int64', 'rank': 'int64', 'manufacturer': str,
+        'score': 'float64', 'strengths': str, 'considerations': str
+    })
+
+
+def manufacturer_summary(table: pd.DataFrame, results_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate the manufacturer table per manufacturer
+    
+    Rows are grouped by canonical_manufacturer when the table has been
+    canonicalized (see manufacturer_names.canonicalize_table), by the raw
+    name otherwise.
+    
+    Args:
+        table (pd.DataFrame): Long-form manufacturer table
+        results_df (pd.DataFrame): Results with ID and Quantity, to weight scores by quantity
+    
+    Returns:
+        pd.DataFrame: Parts, top picks, average score and quantity-weighted score per
+            manufacturer, most frequent first
+    """
+    quantities = results_df.set_index('ID')['Quantity'] if 'Quantity' in results_df.columns else None
+    weights = table['part_id'].map(quantities).fillna(1) if quantities is not None else 1
+    
+    weighted = table.assign(
+        quantity=weights,
+        weighted_score=table['score'] * weights,
+        top_pick=table['rank'] == 1
+    )
+    by = 'canonical_manufacturer' if 'canonical_manufacturer' in table.columns else 'manufacturer'
+    summary = weighted.groupby(by).agg(
+        parts=('part_id', 'nunique'),
+        top_picks=('top_pick', 'sum'),
+        avg_score=('score', 'mean'),
+        quantity=('quantity', 'sum'),
+        weighted_score=('weighted_score', 'sum')
+    )
+    summary['weighted_score'] = summary['weighted_score'] / summary['quantity'].where(summary['quantity'] > 0)
+    return summary.sort_values(['parts', 'avg_score'], ascending=False)
+
+
+def score_bands(scores: pd.Series, edges: List[float], labels: List[str]) -> pd.Series:
+    """
+    Bin scores into labelled bands in one pass
+    
+    Args:
+        scores (pd.Series): Credibility scores
+        edges (List[float]): Band edges, lower bound inclusive
+        labels (List[str]): One label per band
+    
+    Returns:
+        pd.Series: Categorical band label per score (missing for missing scores)
+    """
+    return pd.cut(pd.to_numeric(scores, errors='coerce'), bins=edges, labels=labels, right=False)
+
+
+@dataclass
+class ResultsViews:
+    """
+    Views of a results table that the dashboard derives from it
+    
+    Built once per analysis so that filtering, sorting and paging only index
+    into precomputed arrays instead of rescanning the results.
+    """
+    
+    display: pd.DataFrame
+    quality_rows: Dict[str, np.ndarray]
+    search_index: SearchIndex
+    band_counts: pd.Series
+    quality_counts: pd.Series
+    manufacturer_counts: pd.Series
+    summary: pd.DataFrame
+    avg_score: float
+    best_score: float
+    best_mpn: Optional[str]
+    sort_orders: Dict[Tuple[str, bool], np.ndarray] = field(default_factory=dict, repr=False)
+    
+    @classmethod
+    def build(cls, results_df: pd.DataFrame, table: pd.DataFrame, display_columns: List[str]) -> 'ResultsViews':
+        """
+        Derive the dashboard views of a results table
+        
+        Args:
+            results_df (pd.DataFrame): Results with ID, MPN, Model_Description and Avg_Credibility_Score
+            table (pd.DataFrame): Long-form manufacturer table
+            display_columns (List[str]): Result columns shown in the results table
+        
+        Returns:
+            ResultsViews: The derived views
+        """
+        scores = pd.to_numeric(results_df['Avg_Credibility_Score'], errors='coerce')
+        display = results_df[display_columns].reset_index(drop=True)
+        display['Avg_Credibility_Score'] = scores.round(2).to_numpy()
+        
+        quality = score_bands(scores, QUALITY_EDGES, QUALITY_LABELS)
+        bands = score_bands(scores, SCORE_BAND_EDGES, SCORE_BAND_LABELS)
+        
+        # Row positions of each quality tier, ascending
+        codes = quality.cat.codes.to_numpy()
+        quality_rows = {label: np.flatnonzero(codes == code) for code, label in enumerate(QUALITY_LABELS)}
+        
+        by = 'canonical_manufacturer' if 'canonical_manufacturer' in table.columns else 'manufacturer'
+        best = scores.idxmax() if scores.notna().any() else None
+        
+        return cls(
+            display=display,
+            quality_rows=quality_rows,
+            search_index=SearchIndex.from_frame(results_df),
+            band_counts=bands.value_counts(sort=False).iloc[::-1],
+            quality_counts=quality.value_counts(sort=False),
+            manufacturer_counts=table[by].value_counts(),
+            summary=manufacturer_summary(table, results_df),
+            avg_score=scores.mean(),
+            best_score=scores.max(),
+            best_mpn=results_df.loc[best, 'MPN'] if best is not None else None
+        )
+    
+    def select(self, quality: Optional[str] = None, search: str = '') -> Optional[np.ndarray]:
+        """
+        Select results rows by quality tier and search text
+        
+        Args:
+            quality (str, optional): One of QUALITY_LABELS; all tiers if not provided
+            search (str): Case-insensitive text to find in the MPN or description
+        
+        Returns:
+            np.ndarray: Selected row positions, ascending, or None when every row is selected
+        """
+        if not search:
+            return self.quality_rows[quality] if quality else None
+        
+        rows = self.search_index.search(search)
+        if quality:
+            in_tier = np.zeros(len(self.display), dtype=bool)
+            in_tier[self.quality_rows[quality]] = True
+            rows = rows[in_tier[rows]]
+        return rows
+    
+    def count(self, rows: Optional[np.ndarray]) -> int:
+        """Number of rows in a selection from select()"""
+        return len(self.display) if rows is None else len(rows)
+    
+    def page(self, rows: Optional[np.ndarray], number: int, size: int,
+             sort_by: Optional[str] = None, descending: bool = False) -> pd.DataFrame:
+        """
+        Get one page of a selection of the display table
+        
+        Only the rows of the page are copied out of the display table. Sort
+        orders are computed once per column and direction.
+        
+        Args:
+            rows (np.ndarray, optional): Selection from select() (None for every row)
+            number (int): Page number, from 0
+            size (int): Rows per page
+            sort_by (str, optional): Display column to sort by. Input order if not provided
+            descending (bool): Sort in descending order (missing values stay last)
+        
+        Returns:
+            pd.DataFrame: The page's rows
+        """
+        start = number * size
+        if sort_by is None:
+            ordered = rows
+        else:
+            order = self._sort_order(sort_by, descending)
+            if rows is None:
+                ordered = order
+            else:
+                selected = np.zeros(len(self.display), dtype=bool)
+                selected[rows] = True
+                ordered = order[selected[order]]
+        
+        if ordered is None:
+            return self.display.iloc[start:start + size]
+        return self.display.take(ordered[start:start + size])
+    
+    def _sort_order(self, column: str, descending: bool) -> np.ndarray:
+        """Row positions of the display table sorted by a column (memoized)"""
+        key = (column, descending)
+        if key not in self.sort_orders:
+            ordered = self.display[column].sort_values(ascending=not descending, kind='stable', na_position='last')
+            self.sort_orders[key] = ordered.index.to_numpy()
+        return self.sort_orders[key]
@@ -0,0 +1,170 @@
+"""
+Analysis Worker Module
+Runs a manufacturer analysis on a background thread so a UI can poll its progress,
+show partial results and cancel it
+"""
+
+import time
+import queue
+import logging
+import threading
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+from manufacturer_finder import ManufacturerFinder
+from analysis_results import PartAnalysis
+from tracing import NullTracer, profiled
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+COMPLETED = 'completed'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+
+class AnalysisJob:
+    """
+    One analysis run on a background thread
+    
+    The job owns its ManufacturerFinder and the query engine behind it. The
+    worker thread pushes each completed row onto a progress queue; the UI
+    thread calls poll() to collect them, so the job survives (and keeps
+    running across) UI reruns as long as the job object is kept.
+    """
+    
+    def __init__(self, df: pd.DataFrame, finder: ManufacturerFinder, max_manufacturers: int = 5,
+                 dedupe: bool = True, dedupe_on_description: bool = False,
+                 tracer: Optional[NullTracer] = None, profile_path: Optional[str] = None):
+        """
+        Initialize AnalysisJob
+        
+        Args:
+            df (pd.DataFrame): DataFrame with ID, MPN, Model_Description, Quantity
+            finder (ManufacturerFinder): Finder used only by this job from now on
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            tracer (Tracer, optional): Times the worker's run as a 'query' span
+            profile_path (str, optional): Write a cProfile dump of the worker thread here
+        """
+        self.df = df
+        self.finder = finder
+        self.max_manufacturers = max_manufacturers
+        self.dedupe = dedupe
+        self.dedupe_on_description = dedupe_on_description
+        self.tracer = tracer or NullTracer()
+        self.profile_path = profile_path
+        
+        self.total = len(df)
+        self.status = PENDING
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        
+        # Rows collected by poll(), in completion order
+        self.rows: List[Dict] = []
+        self.analyses: List[Tuple[int, PartAnalysis]] = []
+        
+        self._progress = queue.Queue()
+        self._cancel = threading.Event()
+        self._finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='analysis-worker', daemon=True)
+    
+    def start(self) -> 'AnalysisJob':
+        """Start the worker thread"""
+        self.status = RUNNING
+        self.started_at = time.time()
+        self._thread.start()
+        return self
+    
+    def cancel(self):
+        """
+        Ask the worker to stop
+        
+        Queued requests are dropped straight away; requests already sent finish
+        in the background but their rows are discarded.
+        """
+        if not self.done:
+            logger.info("Cancelling analysis job")
+            self._cancel.set()
+    
+    @property
+    def done(self) -> bool:
+        """True once the worker has finished, been cancelled or failed"""
+        return self._finished.is_set()
+    
+    @property
+    def completed(self) -> int:
+        """Number of rows collected so far"""
+        return len(self.rows)
+    
+    def poll(self) -> List[Dict]:
+        """
+        Collect the rows completed since the last poll (call from the UI thread)
+        
+        Returns:
+            List[Dict]: Newly completed rows
+        """
+        new_rows = []
+        while True:
+            try:
+                result_row, analysis = self._progress.get_nowait()
+            except queue.Empty:
+                break
+            new_rows.append(result_row)
+            self.analyses.append((result_row['ID'], analysis))
+        
+        self.rows.extend(new_rows)
+        return new_rows
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the worker finishes
+        
+        Args:
+            timeout (float, optional): Maximum seconds to wait
+        
+        Returns:
+            bool: True if the worker has finished
+        """
+        return self._finished.wait(timeout)
+    
+    def _run(self):
+        """Worker thread: run the analysis, timed and profiled if requested"""
+        try:
+            with profiled(self.profile_path), self.tracer.span('query', rows=self.total):
+                self._stream()
+        finally:
+            # Set only after the span and profile are written, so waiters see them
+            self.finished_at = time.time()
+            self._finished.set()
+            logger.info(f"Analysis job {self.status}")
+    
+    def _stream(self):
+        """Stream rows from the finder onto the progress queue"""
+        results = self.finder.iter_analyses(
+            self.df,
+            max_manufacturers=self.max_manufacturers,
+            dedupe=self.dedupe,
+            dedupe_on_description=self.dedupe_on_description
+        )
+        try:
+            cancelled = False
+            for item in results:
+                if self._cancel.is_set():
+                    cancelled = True
+                    break
+                self._progress.put(item)
+            
+            self.status = CANCELLED if cancelled else COMPLETED
+        except Exception as e:
+            logger.error(f"Analysis job failed: {str(e)}", exc_info=True)
+            self.error = str(e)
+            self.status = FAILED
+        finally:
+            # Closing the generator cancels any requests still queued in the engine
+            results.close()
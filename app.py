@@ -6,16 +6,67 @@ Corporate-friendly interface for finding credible manufacturers
 import streamlit as st
 import pandas as pd
 import os
+import io
 import sys
+import math
+import time
+import hashlib
 from datetime import datetime
 import logging
+from typing import Dict, List
 from manufacturer_finder import ManufacturerFinder
+from analysis_worker import AnalysisJob, COMPLETED, CANCELLED
+from tracing import Tracer
 from excel_exporter import ExcelExporter
+from data_loader import DataLoader
+from analysis_results import manufacturer_table, ResultsViews, ERROR_MARKER
+from manufacturer_names import canonicalize_table
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds between progress refreshes while an analysis runs
+POLL_INTERVAL = 1.0
+
+# Most recent rows shown while an analysis runs
+PARTIAL_ROWS = 20
+
+# Parsed uploads kept in the cache, keyed by content hash
+UPLOAD_CACHE_ENTRIES = 16
+
+# Results table columns
+DISPLAY_COLUMNS = ['ID', 'MPN', 'Model_Description', 'Top_Manufacturer', 'Avg_Credibility_Score', 'Recommendation']
+
+# Score filter options and the quality tier each one selects
+SCORE_FILTERS = {
+    "All Parts": None,
+    "High Quality (≥80)": 'High',
+    "Medium Quality (60-79)": 'Medium',
+    "Low Quality (<60)": 'Low'
+}
+
+# Results table sort options (display column) and page sizes
+SORT_OPTIONS = {
+    "Input Order": None,
+    "Credibility Score": 'Avg_Credibility_Score',
+    "MPN": 'MPN',
+    "Top Manufacturer": 'Top_Manufacturer'
+}
+PAGE_SIZES = [50, 100, 250, 500]
+
+# Widgets inside a fragment rerun only that fragment (Streamlit 1.37+, experimental
+# from 1.33); older versions fall back to rerunning the whole page
+FRAGMENT = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+fragment = FRAGMENT or (lambda func: func)
+
+
+def polling_fragment(func):
+    """Run a function as a fragment that reruns itself every POLL_INTERVAL seconds (if fragments are supported)"""
+    if FRAGMENT is None:
+        return func
+    return FRAGMENT(run_every=POLL_INTERVAL)(func)
+
 # Page configuration
 st.set_page_config(
     page_title="Manufacturer Credibility Analyzer | DynaPrice",
@@ -158,6 +209,362 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_data(show_spinner="Reading file...", max_entries=UPLOAD_CACHE_ENTRIES)
+def parse_upload(digest: str, extension: str, _data: bytes) -> pd.DataFrame:
+    """
+    Parse an uploaded file in memory, cached by its content hash
+    
+    Args:
+        digest (str): SHA-256 of the file contents
+        extension (str): File extension, used to recognise the format
+        _data (bytes): File contents (left out of the cache key, which the digest already covers)
+    
+    Returns:
+        pd.DataFrame: Cleaned data with ID, MPN, Model_Description and Quantity
+    """
+    return DataLoader(io.BytesIO(_data), file_name=f"upload{extension}").load()
+
+
+def load_upload(uploaded_file) -> pd.DataFrame:
+    """
+    Get the cleaned data of the current upload
+    
+    Reruns with the same upload reuse the frame kept in session state without
+    touching the file; a new upload is hashed once, and a file uploaded before
+    (by this or another session) comes from the parse cache.
+    
+    Args:
+        uploaded_file: File from st.file_uploader
+    
+    Returns:
+        pd.DataFrame: Cleaned data with ID, MPN, Model_Description and Quantity
+    """
+    cached = st.session_state.get('upload')
+    if cached is not None and cached[0] == uploaded_file.file_id:
+        return cached[1]
+    
+    data = uploaded_file.getvalue()
+    digest = hashlib.sha256(data).hexdigest()
+    extension = os.path.splitext(uploaded_file.name)[1].lower()
+    df = parse_upload(digest, extension, data)
+    
+    st.session_state['upload'] = (uploaded_file.file_id, df)
+    return df
+
+
+def results_views() -> ResultsViews:
+    """
+    Get the dashboard views of the current results, building them once per analysis
+    
+    Returns:
+        ResultsViews: Views of st.session_state['results_df']
+    """
+    version = st.session_state.get('results_version', 0)
+    cached = st.session_state.get('results_views')
+    if cached is None or cached[0] != version:
+        views = ResultsViews.build(
+            st.session_state['results_df'],
+            st.session_state['manufacturers_df'],
+            DISPLAY_COLUMNS
+        )
+        cached = (version, views)
+        st.session_state['results_views'] = cached
+    return cached[1]
+
+
+@fragment
+def render_results_table(views: ResultsViews):
+    """
+    Show the filter widgets and one page of the filtered, sorted results
+    
+    Runs as a fragment, so changing a filter or page redraws only this section.
+    
+    Args:
+        views (ResultsViews): Views of the current results
+    """
+    st.markdown("### 🔍 Filter Results")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        score_filter = st.selectbox(
+            "Filter by Credibility Score",
+            list(SCORE_FILTERS)
+        )
+    
+    with col2:
+        search_term = st.text_input("Search by MPN or Description", "")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        sort_label = st.selectbox("Sort by", list(SORT_OPTIONS))
+    
+    with col2:
+        descending = st.checkbox("Descending", value=True)
+    
+    with col3:
+        page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1)
+    
+    # Apply filters; counts come from the precomputed selections
+    rows = views.select(SCORE_FILTERS[score_filter], search_term)
+    total = views.count(rows)
+    pages = max(1, math.ceil(total / page_size))
+    
+    # Back to the first page whenever the selection or its order changes
+    view_state = (st.session_state.get('results_version'), score_filter, search_term,
+                  sort_label, descending, page_size)
+    if st.session_state.get('results_view_state') != view_state:
+        st.session_state['results_view_state'] = view_state
+        st.session_state['results_page'] = 1
+    st.session_state['results_page'] = min(st.session_state.get('results_page', 1), pages)
+    
+    st.markdown(f"### 📋 Results ({total} parts)")
+    
+    # Only the visible page is sliced out and sent to the browser
+    page = st.session_state['results_page']
+    display_df = views.page(rows, page - 1, page_size, SORT_OPTIONS[sort_label], descending)
+    
+    # Display results
+    st.dataframe(
+        display_df,
+        use_container_width=True,
+        height=500,
+        column_config={
+            "ID": st.column_config.NumberColumn("ID", width="small"),
+            "MPN": st.column_config.TextColumn("MPN", width="medium"),
+            "Model_Description": st.column_config.TextColumn("Description", width="large"),
+            "Top_Manufacturer": st.column_config.TextColumn("Top Manufacturer", width="medium"),
+            "Avg_Credibility_Score": st.column_config.ProgressColumn(
+                "Score",
+                format="%.1f",
+                min_value=0,
+                max_value=100,
+                width="small"
+            ),
+            "Recommendation": st.column_config.TextColumn("Recommendation", width="large")
+        }
+    )
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        first = (page - 1) * page_size
+        st.caption(f"Showing {min(first + 1, total)}-{first + len(display_df)} of {total} parts")
+    
+    with col2:
+        st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key='results_page')
+
+
+def dashboard_row(result_row: Dict, input_columns: List[str]) -> Dict:
+    """
+    Give a failed part the dashboard's error row layout
+    
+    Args:
+        result_row (Dict): Row from the analysis
+        input_columns (List[str]): Columns of the uploaded data
+    
+    Returns:
+        Dict: The row unchanged, or its error layout
+    """
+    if result_row.get('Manufacturers') != ERROR_MARKER:
+        return result_row
+    
+    error_row = {col: result_row[col] for col in input_columns}
+    error_row.update({
+        'Top_Manufacturer': 'Analysis Error',
+        'All_Manufacturers': '',
+        'Avg_Credibility_Score': 0,
+        'Recommendation': result_row['Recommendation'],
+        'Detailed_Analysis': '',
+        'Additional_Info': ''
+    })
+    return error_row
+
+
+def finish_analysis(job: AnalysisJob):
+    """
+    Store a finished job's results in session state and export them to Excel
+    
+    A cancelled job keeps the rows completed before it stopped.
+    
+    Args:
+        job (AnalysisJob): Finished job
+    """
+    job.poll()
+    if not job.rows:
+        return
+    
+    # Rows arrive in completion order; restore input order
+    results = [dashboard_row(row, list(job.df.columns)) for row in job.rows]
+    results_df = pd.DataFrame(results).sort_values('ID', kind='stable').reset_index(drop=True)
+    
+    st.session_state['results_df'] = results_df
+    st.session_state['manufacturers_df'] = canonicalize_table(manufacturer_table(job.analyses))
+    st.session_state['results_version'] = st.session_state.get('results_version', 0) + 1
+    st.session_state['analysis_complete'] = True
+    st.session_state['analysis_timestamp'] = datetime.now()
+    
+    # Export to Excel
+    output_path = f"manufacturer_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    exporter = ExcelExporter(output_path=output_path)
+    with job.tracer.span('export', formats='xlsx'):
+        st.session_state['output_file'] = exporter.create_summary_sheet(results_df)
+    
+    # Profiled runs keep their trace and profile next to the report
+    st.session_state['trace_file'] = None
+    if job.tracer.enabled:
+        job.tracer.log_summary()
+        st.session_state['trace_file'] = job.tracer.write(os.path.splitext(output_path)[0] + '.trace.json')
+
+
+@polling_fragment
+def render_job_progress(job: AnalysisJob):
+    """
+    Show a running job's progress, cancel button and latest rows
+    
+    Runs as a fragment on a timer, so each poll redraws only this section.
+    Once the job has finished, one full rerun shows its summary and fills
+    the results tabs.
+    
+    Args:
+        job (AnalysisJob): Running job kept in session state
+    """
+    job.poll()
+    if job.done:
+        st.rerun()
+    
+    st.markdown("### 🔍 Analysis in Progress")
+    st.progress(job.completed / job.total if job.total else 1.0)
+    
+    latest = f": <strong>{job.rows[-1]['MPN']}</strong>" if job.rows else ''
+    st.markdown(f"""
+    <div class="status-info">
+        Completed {job.completed}/{job.total}{latest}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if st.button("⏹️ Cancel Analysis", use_container_width=True):
+        job.cancel()
+    
+    if job.rows:
+        partial = [dashboard_row(row, list(job.df.columns)) for row in job.rows[-PARTIAL_ROWS:]]
+        st.dataframe(pd.DataFrame(partial), use_container_width=True, height=300)
+
+
+def render_analysis_job(job: AnalysisJob):
+    """
+    Show a background analysis: progress and partial results while it runs,
+    the summary and download once it has finished
+    
+    Args:
+        job (AnalysisJob): Job kept in session state
+    """
+    job.poll()
+    
+    if not job.done:
+        render_job_progress(job)
+        return
+    
+    # Finish each job once, however many reruns show it
+    if st.session_state.get('finished_job') is not job:
+        finish_analysis(job)
+        st.session_state['finished_job'] = job
+    
+    if job.status == COMPLETED:
+        st.markdown("""
+        <div class="status-success">
+            ✅ <strong>Analysis Completed Successfully!</strong><br>
+            All parts have been analyzed and results are ready for review.
+        </div>
+        """, unsafe_allow_html=True)
+    elif job.status == CANCELLED:
+        st.warning(f"⏹️ Analysis cancelled after {job.completed} of {job.total} parts")
+    else:
+        st.error(f"❌ Error during analysis: {job.error}")
+    
+    if not job.rows:
+        return
+    
+    results_df = st.session_state['results_df']
+    views = results_views()
+    output_file = st.session_state['output_file']
+    
+    # Display summary metrics
+    st.markdown("### 📊 Analysis Summary")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <div class="metric-label">Total Parts</div>
+            <div class="metric-value">{}</div>
+        </div>
+        """.format(len(results_df)), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <div class="metric-label">Avg Score</div>
+            <div class="metric-value">{:.1f}</div>
+        </div>
+        """.format(views.avg_score), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <div class="metric-label">High Quality</div>
+            <div class="metric-value">{}</div>
+        </div>
+        """.format(views.quality_counts['High']), unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown("""
+        <div class="metric-card">
+            <div class="metric-label">Need Review</div>
+            <div class="metric-value">{}</div>
+        </div>
+        """.format(views.quality_counts['Low']), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Download button
+    with open(output_file, 'rb') as f:
+        st.download_button(
+            label="📥 Download Complete Report (Excel)",
+            data=f,
+            file_name=os.path.basename(output_file),
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True
+        )
+    
+    # Timing trace and profile of a profiled run
+    if st.session_state.get('trace_file'):
+        col1, col2 = st.columns(2)
+        with col1:
+            with open(st.session_state['trace_file'], 'rb') as f:
+                st.download_button(
+                    label="⏱️ Download Timing Trace",
+                    data=f,
+                    file_name=os.path.basename(st.session_state['trace_file']),
+                    mime="application/json",
+                    help="Open in chrome://tracing, Perfetto or speedscope",
+                    use_container_width=True
+                )
+        with col2:
+            if job.profile_path and os.path.exists(job.profile_path):
+                with open(job.profile_path, 'rb') as f:
+                    st.download_button(
+                        label="🔬 Download Profile",
+                        data=f,
+                        file_name=os.path.basename(job.profile_path),
+                        help="cProfile dump of the analysis thread (snakeviz or python -m pstats)",
+                        use_container_width=True
+                    )
+    
+    # Redirect to results tab
+    st.info("💡 Switch to the 'Results Dashboard' tab to explore detailed findings")
+
 def main():
     """Main application function"""
     
@@ -207,6 +614,12 @@ def main():
             help="Number of manufacturer recommendations"
         )
         
+        profile_analysis = st.checkbox(
+            "Profile Analysis",
+            value=False,
+            help="Record a timing trace and a cProfile dump of the next analysis"
+        )
+        
         st.markdown("---")
         
         # Information Panel
@@ -256,7 +669,7 @@ def main():
         
         with col1:
             st.markdown("### Upload Manufacturing Parts Data")
-            st.markdown("Upload your Excel file containing manufacturing part information for AI-powered analysis.")
+            st.markdown("Upload your Excel, CSV or Parquet file containing manufacturing part information for AI-powered analysis.")
         
         with col2:
             st.markdown("### Quick Stats")
@@ -267,51 +680,15 @@ def main():
         
         # File Upload Section
         uploaded_file = st.file_uploader(
-            "Choose Excel File (.xlsx, .xls)",
-            type=['xlsx', 'xls'],
-            help="Upload an Excel file with MPN, Description, and Quantity columns"
+            "Choose Parts File (.xlsx, .xls, .csv, .tsv, .parquet)",
+            type=['xlsx', 'xls', 'csv', 'tsv', 'parquet'],
+            help="Upload an Excel, CSV/TSV or Parquet file with MPN, Description, and Quantity columns"
         )
         
         if uploaded_file is not None:
             try:
-                # Save uploaded file temporarily
-                temp_path = f"temp_upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                with open(temp_path, 'wb') as f:
-                    f.write(uploaded_file.getbuffer())
-                
-                # Load and preview data
-                df = pd.read_excel(temp_path)
-                
-                # Clean column names
-                df = df.rename(columns={
-                    'Oracle MPN': 'MPN',
-                    'description': 'Model_Description',
-                    'Qty On Hand': 'Quantity'
-                })
-                
-                # Handle missing columns
-                if 'MPN' not in df.columns:
-                    possible_mpn_cols = [col for col in df.columns if 'mpn' in col.lower() or 'part' in col.lower()]
-                    if possible_mpn_cols:
-                        df['MPN'] = df[possible_mpn_cols[0]]
-                
-                if 'Model_Description' not in df.columns:
-                    possible_desc_cols = [col for col in df.columns if 'desc' in col.lower() or 'model' in col.lower()]
-                    if possible_desc_cols:
-                        df['Model_Description'] = df[possible_desc_cols[0]]
-                
-                if 'Quantity' not in df.columns:
-                    possible_qty_cols = [col for col in df.columns if 'qty' in col.lower() or 'quant' in col.lower()]
-                    if possible_qty_cols:
-                        df['Quantity'] = df[possible_qty_cols[0]]
-                    else:
-                        df['Quantity'] = 1
-                
-                # Filter required columns
-                df = df[['MPN', 'Model_Description', 'Quantity']].copy()
-                df = df.dropna(subset=['MPN', 'Model_Description'])
-                df['Quantity'] = df['Quantity'].fillna(1).astype(int)
-                df.insert(0, 'ID', range(1, len(df) + 1))
+                # Load, clean and preview data (parsed in memory, once per distinct file)
+                df = load_upload(uploaded_file)
                 
                 # Display success message
                 st.markdown(f"""
@@ -341,154 +718,43 @@ def main():
                     )
                 
                 if analyze_button:
+                    job = st.session_state.get('analysis_job')
                     if not api_key:
                         st.error("⚠️ Please provide an OpenAI API key in the sidebar")
+                    elif job is not None and not job.done:
+                        st.warning("⚠️ An analysis is already running. Cancel it before starting another one")
                     else:
-                        # Run analysis
-                        st.markdown("### 🔍 Analysis in Progress")
-                        
-                        with st.spinner("Initializing AI analysis engine..."):
-                            try:
-                                finder = ManufacturerFinder(api_key=api_key)
-                                
-                                # Progress tracking
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-                                results_container = st.container()
-                                
-                                # Process items
-                                results = []
-                                for idx, row in df.iterrows():
-                                    progress = (idx + 1) / len(df)
-                                    progress_bar.progress(progress)
-                                    status_text.markdown(f"""
-                                    <div class="status-info">
-                                        Processing {idx + 1}/{len(df)}: <strong>{row['MPN']}</strong>
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    try:
-                                        manufacturer_info = finder._query_manufacturers(
-                                            mpn=row['MPN'],
-                                            description=row['Model_Description'],
-                                            quantity=row['Quantity'],
-                                            max_results=max_manufacturers
-                                        )
-                                        
-                                        result_row = row.to_dict()
-                                        result_row.update(manufacturer_info)
-                                        results.append(result_row)
-                                        
-                                    except Exception as e:
-                                        logger.error(f"Error processing {row['MPN']}: {str(e)}")
-                                        result_row = row.to_dict()
-                                        result_row.update({
-                                            'Top_Manufacturer': 'Analysis Error',
-                                            'All_Manufacturers': '',
-                                            'Avg_Credibility_Score': 0,
-                                            'Recommendation': f'Error: {str(e)}',
-                                            'Detailed_Analysis': '',
-                                            'Additional_Info': ''
-                                        })
-                                        results.append(result_row)
-                                
-                                results_df = pd.DataFrame(results)
-                                
-                                # Clear progress indicators
-                                progress_bar.empty()
-                                status_text.empty()
-                                
-                                # Store results in session state
-                                st.session_state['results_df'] = results_df
-                                st.session_state['analysis_complete'] = True
-                                st.session_state['analysis_timestamp'] = datetime.now()
-                                
-                                # Export to Excel
-                                output_path = f"manufacturer_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                                exporter = ExcelExporter(output_path=output_path)
-                                output_file = exporter.create_summary_sheet(results_df)
-                                st.session_state['output_file'] = output_file
-                                
-                                # Success message
-                                st.markdown("""
-                                <div class="status-success">
-                                    ✅ <strong>Analysis Completed Successfully!</strong><br>
-                                    All parts have been analyzed and results are ready for review.
-                                </div>
-                                """, unsafe_allow_html=True)
-                                
-                                # Display summary metrics
-                                st.markdown("### 📊 Analysis Summary")
-                                
-                                col1, col2, col3, col4 = st.columns(4)
-                                
-                                with col1:
-                                    st.markdown("""
-                                    <div class="metric-card">
-                                        <div class="metric-label">Total Parts</div>
-                                        <div class="metric-value">{}</div>
-                                    </div>
-                                    """.format(len(results_df)), unsafe_allow_html=True)
-                                
-                                with col2:
-                                    avg_score = results_df['Avg_Credibility_Score'].mean()
-                                    st.markdown("""
-                                    <div class="metric-card">
-                                        <div class="metric-label">Avg Score</div>
-                                        <div class="metric-value">{:.1f}</div>
-                                    </div>
-                                    """.format(avg_score), unsafe_allow_html=True)
-                                
-                                with col3:
-                                    high_cred = len(results_df[results_df['Avg_Credibility_Score'] >= 80])
-                                    st.markdown("""
-                                    <div class="metric-card">
-                                        <div class="metric-label">High Quality</div>
-                                        <div class="metric-value">{}</div>
-                                    </div>
-                                    """.format(high_cred), unsafe_allow_html=True)
-                                
-                                with col4:
-                                    low_cred = len(results_df[results_df['Avg_Credibility_Score'] < 60])
-                                    st.markdown("""
-                                    <div class="metric-card">
-                                        <div class="metric-label">Need Review</div>
-                                        <div class="metric-value">{}</div>
-                                    </div>
-                                    """.format(low_cred), unsafe_allow_html=True)
-                                
-                                st.markdown("---")
-                                
-                                # Download button
-                                with open(output_file, 'rb') as f:
-                                    st.download_button(
-                                        label="📥 Download Complete Report (Excel)",
-                                        data=f,
-                                        file_name=os.path.basename(output_file),
-                                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                        use_container_width=True
-                                    )
-                                
-                                # Redirect to results tab
-                                st.info("💡 Switch to the 'Results Dashboard' tab to explore detailed findings")
-                                
-                            except Exception as e:
-                                st.error(f"❌ Error during analysis: {str(e)}")
-                                logger.error(f"Analysis error: {str(e)}", exc_info=True)
-                            
-                            finally:
-                                # Cleanup temp file
-                                if os.path.exists(temp_path):
-                                    os.remove(temp_path)
+                        try:
+                            # The worker owns the finder; the page only polls it
+                            tracer = Tracer() if profile_analysis else None
+                            profile_path = None
+                            if profile_analysis:
+                                profile_path = f"manufacturer_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+                            finder = ManufacturerFinder(api_key=api_key, tracer=tracer)
+                            st.session_state['analysis_job'] = AnalysisJob(
+                                df,
+                                finder,
+                                max_manufacturers=max_manufacturers,
+                                tracer=tracer,
+                                profile_path=profile_path
+                            ).start()
+                        except Exception as e:
+                            st.error(f"❌ Error during analysis: {str(e)}")
+                            logger.error(f"Analysis error: {str(e)}", exc_info=True)
                 
             except Exception as e:
                 st.error(f"❌ Error loading file: {str(e)}")
                 logger.error(f"File loading error: {str(e)}", exc_info=True)
+        
+        # The job lives in session state, so it keeps running across reruns
+        if 'analysis_job' in st.session_state:
+            render_analysis_job(st.session_state['analysis_job'])
     
     # TAB 2: Results Dashboard
     with tab2:
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
             results_df = st.session_state['results_df']
+            views = results_views()
             
             # Header with timestamp
             col1, col2 = st.columns([3, 1])
@@ -508,79 +774,21 @@ def main():
                 st.metric("Total Parts", len(results_df))
             
             with col2:
-                avg_score = results_df['Avg_Credibility_Score'].mean()
-                st.metric("Avg Credibility", f"{avg_score:.1f}/100")
+                st.metric("Avg Credibility", f"{views.avg_score:.1f}/100")
             
             with col3:
-                high_cred = len(results_df[results_df['Avg_Credibility_Score'] >= 80])
-                st.metric("High Quality (≥80)", high_cred)
+                st.metric("High Quality (≥80)", int(views.quality_counts['High']))
             
             with col4:
-                medium_cred = len(results_df[(results_df['Avg_Credibility_Score'] >= 60) & 
-                                             (results_df['Avg_Credibility_Score'] < 80)])
-                st.metric("Medium (60-79)", medium_cred)
+                st.metric("Medium (60-79)", int(views.quality_counts['Medium']))
             
             with col5:
-                low_cred = len(results_df[results_df['Avg_Credibility_Score'] < 60])
-                st.metric("Need Review (<60)", low_cred)
+                st.metric("Need Review (<60)", int(views.quality_counts['Low']))
             
             st.markdown("---")
             
-            # Filters
-            st.markdown("### 🔍 Filter Results")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                score_filter = st.selectbox(
-                    "Filter by Credibility Score",
-                    ["All Parts", "High Quality (≥80)", "Medium Quality (60-79)", "Low Quality (<60)"]
-                )
-            
-            with col2:
-                search_term = st.text_input("Search by MPN or Description", "")
-            
-            # Apply filters
-            filtered_df = results_df.copy()
-            
-            if score_filter == "High Quality (≥80)":
-                filtered_df = filtered_df[filtered_df['Avg_Credibility_Score'] >= 80]
-            elif score_filter == "Medium Quality (60-79)":
-                filtered_df = filtered_df[(filtered_df['Avg_Credibility_Score'] >= 60) & 
-                                          (filtered_df['Avg_Credibility_Score'] < 80)]
-            elif score_filter == "Low Quality (<60)":
-                filtered_df = filtered_df[filtered_df['Avg_Credibility_Score'] < 60]
-            
-            if search_term:
-                mask = filtered_df['MPN'].astype(str).str.contains(search_term, case=False) | \
-                       filtered_df['Model_Description'].astype(str).str.contains(search_term, case=False)
-                filtered_df = filtered_df[mask]
-            
-            st.markdown(f"### 📋 Results ({len(filtered_df)} parts)")
-            
-            # Display results
-            display_cols = ['ID', 'MPN', 'Model_Description', 'Top_Manufacturer', 'Avg_Credibility_Score', 'Recommendation']
-            display_df = filtered_df[display_cols].copy()
-            display_df['Avg_Credibility_Score'] = display_df['Avg_Credibility_Score'].round(2)
-            
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                height=500,
-                column_config={
-                    "ID": st.column_config.NumberColumn("ID", width="small"),
-                    "MPN": st.column_config.TextColumn("MPN", width="medium"),
-                    "Model_Description": st.column_config.TextColumn("Description", width="large"),
-                    "Top_Manufacturer": st.column_config.TextColumn("Top Manufacturer", width="medium"),
-                    "Avg_Credibility_Score": st.column_config.ProgressColumn(
-                        "Score",
-                        format="%.1f",
-                        min_value=0,
-                        max_value=100,
-                        width="small"
-                    ),
-                    "Recommendation": st.column_config.TextColumn("Recommendation", width="large")
-                }
-            )
+            # Filters and table rerun on their own
+            render_results_table(views)
             
             # Download filtered results
             if 'output_file' in st.session_state:
@@ -599,7 +807,7 @@ def main():
     # TAB 3: Analytics
     with tab3:
         if 'analysis_complete' in st.session_state and st.session_state['analysis_complete']:
-            results_df = st.session_state['results_df']
+            views = results_views()
             
             st.markdown("### 📈 Analytics & Insights")
             st.markdown("---")
@@ -609,28 +817,26 @@ def main():
             
             with col1:
                 st.markdown("#### Credibility Score Distribution")
-                score_ranges = {
-                    '90-100': len(results_df[results_df['Avg_Credibility_Score'] >= 90]),
-                    '80-89': len(results_df[(results_df['Avg_Credibility_Score'] >= 80) & 
-                                           (results_df['Avg_Credibility_Score'] < 90)]),
-                    '70-79': len(results_df[(results_df['Avg_Credibility_Score'] >= 70) & 
-                                           (results_df['Avg_Credibility_Score'] < 80)]),
-                    '60-69': len(results_df[(results_df['Avg_Credibility_Score'] >= 60) & 
-                                           (results_df['Avg_Credibility_Score'] < 70)]),
-                    '<60': len(results_df[results_df['Avg_Credibility_Score'] < 60])
-                }
-                st.bar_chart(score_ranges)
+                st.bar_chart(views.band_counts.to_dict())
             
             with col2:
                 st.markdown("#### Top 10 Manufacturers by Frequency")
-                # Extract all manufacturers
-                all_manufacturers = []
-                for mfrs in results_df['All_Manufacturers']:
-                    all_manufacturers.extend([m.strip() for m in str(mfrs).split('|')])
-                
-                mfr_counts = pd.Series(all_manufacturers).value_counts().head(10)
+                mfr_counts = views.manufacturer_counts.head(10)
                 st.bar_chart(mfr_counts)
             
+            st.markdown("#### Manufacturer Scores")
+            st.dataframe(
+                views.summary.head(25),
+                use_container_width=True,
+                column_config={
+                    "parts": "Parts",
+                    "top_picks": "Top Pick",
+                    "avg_score": st.column_config.NumberColumn("Avg Score", format="%.1f"),
+                    "quantity": "Total Quantity",
+                    "weighted_score": st.column_config.NumberColumn("Quantity-Weighted Score", format="%.1f")
+                }
+            )
+            
             st.markdown("---")
             
             # Key insights
@@ -646,8 +852,8 @@ def main():
                     <p><strong>MPN:</strong> {}</p>
                 </div>
                 """.format(
-                    results_df['Avg_Credibility_Score'].max(),
-                    results_df.loc[results_df['Avg_Credibility_Score'].idxmax(), 'MPN']
+                    views.best_score,
+                    views.best_mpn
                 ), unsafe_allow_html=True)
             
             with col2:
@@ -669,7 +875,7 @@ def main():
                     <p><strong>{:.1f}/100</strong></p>
                     <p>Across all parts</p>
                 </div>
-                """.format(results_df['Avg_Credibility_Score'].mean()), unsafe_allow_html=True)
+                """.format(views.avg_score), unsafe_allow_html=True)
         else:
             st.info("👈 Upload and analyze an Excel file to see analytics")
     
@@ -681,6 +887,13 @@ def main():
         <p>DynaPrice © 2025 | Manufacturing Intelligence Solutions</p>
     </div>
     """, unsafe_allow_html=True)
+    
+    # Without fragments, rerun the whole page until the background analysis
+    # finishes; otherwise render_job_progress polls it on its own
+    job = st.session_state.get('analysis_job')
+    if FRAGMENT is None and job is not None and not job.done:
+        time.sleep(POLL_INTERVAL)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
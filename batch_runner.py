@@ -0,0 +1,214 @@
+"""
+Batch Runner Module
+Runs manufacturer analysis offline through the OpenAI Batch API
+"""
+
+import os
+import json
+import time
+import logging
+import pandas as pd
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from openai import OpenAI
+from manufacturer_finder import ManufacturerFinder
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = '/v1/chat/completions'
+DEFAULT_POLL_INTERVAL = 60
+TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+
+class BatchRunner:
+    """Submits every part as one Batch API job and merges the results back by custom ID"""
+    
+    def __init__(self, finder: ManufacturerFinder, client: Optional[OpenAI] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, work_dir: str = '.'):
+        """
+        Initialize BatchRunner
+        
+        Args:
+            finder (ManufacturerFinder): Finder whose prompts, cache and result formatting are used
+            client (OpenAI, optional): Client for the Files and Batches endpoints. Pass one built with
+                a custom base_url or http_client to run against another (e.g. local fake) server.
+                Defaults to the finder's client
+            poll_interval (float): Seconds between batch status checks
+            work_dir (str): Directory for the rendered JSONL batch file
+        """
+        self.finder = finder
+        self.client = client or finder.client
+        self.poll_interval = poll_interval
+        self.work_dir = work_dir
+    
+    def run(self, df: pd.DataFrame, max_manufacturers: int = 5, dedupe: bool = True,
+            dedupe_on_description: bool = False, on_result: Optional[Callable[[Dict], None]] = None) -> pd.DataFrame:
+        """
+        Analyse every part in the DataFrame with a single batch job
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Submit each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            on_result (Callable, optional): Called with each enriched row once the batch results are merged
+        
+        Returns:
+            pd.DataFrame: Enhanced DataFrame with manufacturer information
+        """
+        rows, row_keys, unique_rows = self.finder.group_parts(df, dedupe, dedupe_on_description)
+        
+        # Answer cached parts straight away and only submit the rest
+        info_by_key = {}
+        pending = {}
+        for position, (key, (idx, row)) in enumerate(unique_rows.items()):
+            cached = self.finder.cached_analysis(row['MPN'], row['Model_Description'], max_manufacturers)
+            if cached is not None:
+                info_by_key[key] = cached
+            else:
+                pending[f'part-{position}'] = (key, row)
+        
+        if pending:
+            input_path = self.write_batch_file(pending, max_manufacturers)
+            try:
+                batch_id = self.submit(input_path)
+            finally:
+                # The uploaded copy is all the job needs
+                os.remove(input_path)
+            batch = self.wait(batch_id)
+            responses = self.download(batch)
+            
+            for custom_id, (key, row) in pending.items():
+                response = responses.get(custom_id)
+                try:
+                    if response is None:
+                        raise RuntimeError(f"No result returned for {custom_id} (batch status: {batch.status})")
+                    if 'error' in response:
+                        raise RuntimeError(response['error'])
+                    
+                    info_by_key[key] = self.finder.parse_analysis(
+                        row['MPN'], row['Model_Description'], max_manufacturers, response['content']
+                    )
+                
+                except Exception as e:
+                    logger.error(f"Error processing {row['MPN']}: {str(e)}")
+                    info_by_key[key] = self.finder.failed_analysis(e)
+        
+        results = self.finder.merge_results(rows, row_keys, info_by_key)
+        if on_result is not None:
+            for result_row in results:
+                on_result(result_row)
+        
+        return pd.DataFrame(results)
+    
+    def write_batch_file(self, pending: Dict, max_manufacturers: int) -> str:
+        """
+        Render one chat completion request per part into a JSONL batch file
+        
+        Args:
+            pending (Dict): (key, row) tuples by custom ID
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+        
+        Returns:
+            str: Path to the batch input file
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        input_path = os.path.join(self.work_dir, f"manufacturer_batch_{timestamp}.jsonl")
+        
+        with open(input_path, 'w', encoding='utf-8') as f:
+            for custom_id, (key, row) in pending.items():
+                line = {
+                    'custom_id': custom_id,
+                    'method': 'POST',
+                    'url': BATCH_ENDPOINT,
+                    'body': self.finder.request_body(
+                        row['MPN'], row['Model_Description'], row['Quantity'], max_manufacturers
+                    )
+                }
+                f.write(json.dumps(line) + '\n')
+        
+        logger.info(f"Wrote {len(pending)} batch requests to {input_path}")
+        return input_path
+    
+    def submit(self, input_path: str) -> str:
+        """
+        Upload the batch file and start the batch job
+        
+        Args:
+            input_path (str): Path to the JSONL batch file
+        
+        Returns:
+            str: Batch ID
+        """
+        with open(input_path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose='batch')
+        
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window='24h'
+        )
+        logger.info(f"Submitted batch {batch.id}")
+        return batch.id
+    
+    def wait(self, batch_id: str):
+        """
+        Poll the batch until it reaches a terminal status
+        
+        Args:
+            batch_id (str): Batch ID
+        
+        Returns:
+            The final batch object
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            if counts is not None:
+                logger.info(
+                    f"Batch {batch_id}: {batch.status} "
+                    f"({counts.completed}/{counts.total} completed, {counts.failed} failed)"
+                )
+            else:
+                logger.info(f"Batch {batch_id}: {batch.status}")
+            
+            if batch.status in TERMINAL_STATUSES:
+                return batch
+            
+            time.sleep(self.poll_interval)
+    
+    def download(self, batch) -> Dict[str, Dict]:
+        """
+        Download batch output and error files
+        
+        Args:
+            batch: Finished batch object
+        
+        Returns:
+            Dict[str, Dict]: Per custom ID, either {'content': ...} or {'error': ...}
+        """
+        responses = {}
+        
+        for line in self._read_lines(batch.error_file_id):
+            responses[line['custom_id']] = {'error': line.get('error') or line.get('response')}
+        
+        for line in self._read_lines(batch.output_file_id):
+            response = line.get('response') or {}
+            if line.get('error') or response.get('status_code') != 200:
+                responses[line['custom_id']] = {'error': line.get('error') or response.get('body')}
+                continue
+            
+            body = response['body']
+            responses[line['custom_id']] = {'content': body['choices'][0]['message']['content']}
+        
+        return responses
+    
+    def _read_lines(self, file_id: Optional[str]) -> List[Dict]:
+        """Download a JSONL file and parse its lines"""
+        if not file_id:
+            return []
+        
+        content = self.client.files.content(file_id).text
+        return [json.loads(line) for line in content.splitlines() if line.strip()]
@@ -0,0 +1,128 @@
+"""
+Formatting Benchmark
+Compares the old per-cell worksheet formatting with the named-style /
+conditional-formatting exporter on synthetic results
+
+Usage:
+    python benchmark_formatting.py
+    python benchmark_formatting.py --rows 10000 100000
+"""
+
+import os
+import time
+import random
+import argparse
+import tempfile
+import pandas as pd
+import openpyxl
+from openpyxl.utils import get_column_letter
+from excel_exporter import (
+    ExcelExporter, COLUMN_WIDTHS, HEADER_FILL, HEADER_FONT, HEADER_ALIGNMENT, THIN_BORDER,
+    HIGH_SCORE_FILL, MEDIUM_SCORE_FILL, LOW_SCORE_FILL
+)
+from openpyxl.styles import Alignment
+
+
+def make_results(rows: int) -> pd.DataFrame:
+    """Build a results DataFrame shaped like ManufacturerFinder output"""
+    rng = random.Random(0)
+    return pd.DataFrame({
+        'ID': range(1, rows + 1),
+        'MPN': [f"MPN-{i:07d}" for i in range(rows)],
+        'Model_Description': [f"Industrial component model {i % 977}" for i in range(rows)],
+        'Quantity': [rng.randint(1, 500) for _ in range(rows)],
+        'Top_Manufacturer': [f"Manufacturer {i % 113}" for i in range(rows)],
+        'All_Manufacturers': ["Manufacturer A, Manufacturer B, Manufacturer C"] * rows,
+        'Avg_Credibility_Score': [round(rng.uniform(30, 100), 1) for _ in range(rows)],
+        'Recommendation': ["Manufacturer A is recommended for its track record"] * rows,
+        'Detailed_Analysis': ["1. Manufacturer A (Score: 90/100)\n   Strengths: quality"] * rows,
+        'Additional_Info': ["Check lead times before ordering"] * rows
+    })
+
+
+def legacy_format_worksheet(worksheet, df: pd.DataFrame):
+    """The previous _format_worksheet: a new style object for every cell and row"""
+    for col_num, column in enumerate(df.columns, 1):
+        cell = worksheet.cell(row=1, column=col_num)
+        cell.fill = HEADER_FILL
+        cell.font = HEADER_FONT
+        cell.alignment = HEADER_ALIGNMENT
+        cell.border = THIN_BORDER
+    
+    for row_num in range(2, len(df) + 2):
+        for col_num in range(1, len(df.columns) + 1):
+            cell = worksheet.cell(row=row_num, column=col_num)
+            cell.alignment = Alignment(vertical='top', wrap_text=True)
+            cell.border = THIN_BORDER
+            
+            if df.columns[col_num - 1] == 'Avg_Credibility_Score':
+                try:
+                    score = float(cell.value)
+                    if score >= 80:
+                        cell.fill = HIGH_SCORE_FILL
+                    elif score >= 60:
+                        cell.fill = MEDIUM_SCORE_FILL
+                    else:
+                        cell.fill = LOW_SCORE_FILL
+                except (ValueError, TypeError):
+                    pass
+    
+    for col_num, column in enumerate(df.columns, 1):
+        worksheet.column_dimensions[get_column_letter(col_num)].width = COLUMN_WIDTHS.get(column, 15)
+    
+    worksheet.row_dimensions[1].height = 30
+    for row_num in range(2, len(df) + 2):
+        worksheet.row_dimensions[row_num].height = 60
+    
+    worksheet.freeze_panes = 'A2'
+
+
+def legacy_export(df: pd.DataFrame, path: str, formatted: bool = True):
+    """pandas to_excel followed (optionally) by the per-cell formatting pass"""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Manufacturer Analysis', index=False)
+        if formatted:
+            legacy_format_worksheet(writer.sheets['Manufacturer Analysis'], df)
+
+
+def plain_export(df: pd.DataFrame, path: str):
+    """Unstyled write-only export, the baseline for the new exporter"""
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet('Manufacturer Analysis')
+    worksheet.append(list(df.columns))
+    for values in df.itertuples(index=False, name=None):
+        worksheet.append(list(values))
+    workbook.save(path)
+
+
+def timed(func, *args) -> float:
+    """Run a function once and return the elapsed seconds"""
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Excel formatting cost')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000],
+                        help='Row counts to benchmark (default: 10000 100000)')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, 'benchmark.xlsx')
+        
+        print(f"{'rows':>8} | {'old total':>10} {'old fmt':>10} | {'new total':>10} {'new fmt':>10}")
+        for rows in args.rows:
+            df = make_results(rows)
+            
+            old_plain = timed(legacy_export, df, path, False)
+            old_total = timed(legacy_export, df, path)
+            new_plain = timed(plain_export, df, path)
+            new_total = timed(ExcelExporter(output_path=path).export, df)
+            
+            print(f"{rows:>8} | {old_total:>9.2f}s {old_total - old_plain:>9.2f}s | "
+                  f"{new_total:>9.2f}s {new_total - new_plain:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Checkpoint Module
+Append-only JSONL journal of completed rows so interrupted runs can resume
+"""
+
+import os
+import json
+import logging
+import threading
+from typing import Dict
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = '.journal.jsonl'
+
+
+def journal_path_for(output_path: str) -> str:
+    """
+    Default journal location for an output file
+    
+    Args:
+        output_path (str): Output Excel file path
+    
+    Returns:
+        str: Journal path next to the output file
+    """
+    return output_path + JOURNAL_SUFFIX
+
+
+def _to_json(value):
+    """Convert numpy scalars and other non-JSON values for serialization"""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class CheckpointJournal:
+    """
+    Records each completed row as one JSON line, flushed to disk immediately
+    
+    The journal only matters until a run finishes: a run that exports every
+    row successfully removes it, and one with failed rows keeps it so that
+    --resume retries just those rows.
+    """
+    
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Initialize CheckpointJournal
+        
+        Args:
+            path (str): Journal file path
+            resume (bool): Keep existing entries. A fresh journal is started otherwise
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        
+        if not resume and os.path.exists(path) and os.path.getsize(path) > 0:
+            logger.warning(f"Overwriting checkpoint journal {path} left by an earlier run "
+                           f"(run with --resume to continue it instead)")
+        
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        
+        # Terminate a line left half-written by a crash so new entries start cleanly
+        if resume and self._file.tell() > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+        
+        logger.info(f"Checkpoint journal: {path}")
+    
+    def load(self) -> Dict[int, Dict]:
+        """
+        Read completed rows from the journal
+        
+        A partially written last line (from a crash mid-write) is ignored.
+        
+        Returns:
+            Dict[int, Dict]: Completed rows by ID
+        """
+        completed = {}
+        if not os.path.exists(self.path):
+            return completed
+        
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping incomplete journal line {line_number} in {self.path}")
+                    continue
+                completed[row['ID']] = row
+        
+        logger.info(f"Loaded {len(completed)} completed rows from {self.path}")
+        return completed
+    
+    def append(self, row: Dict):
+        """
+        Record a completed row and flush it to disk
+        
+        Args:
+            row (Dict): Enriched result row (must contain ID)
+        """
+        line = json.dumps(row, default=_to_json)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            self._file.close()
+    
+    def remove(self):
+        """Close and delete the journal once its run has completed"""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError as e:
+            logger.warning(f"Could not remove checkpoint journal {self.path}: {str(e)}")
+            return
+        logger.info(f"Run complete; removed checkpoint journal {self.path}")
@@ -1,108 +1,795 @@
 """
 Data Loader Module
-Handles reading Excel files with Oracle MPN, Model Description, and Quantity
+Handles reading Excel, CSV, TSV and Parquet files with Oracle MPN, Model Description, and Quantity
 """
 
+import os
 import pandas as pd
 import logging
-from typing import List, Dict, Optional
+import importlib.util
+import openpyxl
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Dict, Optional, Union
+from tracing import NullTracer
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+REQUIRED_COLUMNS = ['MPN', 'Model_Description', 'Quantity']
+# Read as text rather than letting pandas guess numbers
+TEXT_COLUMNS = ['MPN', 'Model_Description']
+# Files openpyxl can open directly
+OPENPYXL_EXTENSIONS = ('.xlsx', '.xlsm')
+DEFAULT_CHUNK_ROWS = 5000
+
+# Input formats by file extension, and by leading bytes for files without a known extension
+FORMAT_EXTENSIONS = {
+    '.xlsx': 'excel',
+    '.xlsm': 'excel',
+    '.xls': 'excel',
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.tab': 'tsv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet'
+}
+MAGIC_BYTES = [
+    (b'PAR1', 'parquet'),
+    (b'PK\x03\x04', 'excel'),                    # .xlsx (zip container)
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'excel')  # .xls (OLE2 container)
+]
+DELIMITERS = {'csv': ',', 'tsv': '\t'}
+SUPPORTED_EXTENSIONS = sorted(FORMAT_EXTENSIONS)
+
+
+def _is_path(source) -> bool:
+    """True for a file path, False for a file object"""
+    return isinstance(source, (str, os.PathLike))
+
+
+def detect_format(file_path: Union[str, BinaryIO], file_name: Optional[str] = None) -> str:
+    """
+    Work out the input format of a file
+    
+    The extension is used when it is known. Otherwise the first bytes are
+    checked for a Parquet or Excel signature, and anything else is treated as
+    delimited text (TSV if the first line contains a tab, CSV otherwise).
+    
+    Args:
+        file_path (str or file-like): Input file path, or a binary file object
+        file_name (str, optional): Name to take the extension from. Defaults to the path
+        
+    Returns:
+        str: 'excel', 'csv', 'tsv' or 'parquet'
+    """
+    name = file_name or (os.fspath(file_path) if _is_path(file_path) else '')
+    extension = os.path.splitext(name)[1].lower()
+    if extension in FORMAT_EXTENSIONS:
+        return FORMAT_EXTENSIONS[extension]
+    
+    if _is_path(file_path):
+        with open(file_path, 'rb') as f:
+            head = f.read(4096)
+    else:
+        file_path.seek(0)
+        head = file_path.read(4096)
+        file_path.seek(0)
+    
+    for magic, file_format in MAGIC_BYTES:
+        if head.startswith(magic):
+            return file_format
+    
+    first_line = head.split(b'\n', 1)[0]
+    return 'tsv' if b'\t' in first_line else 'csv'
+
+
+def _has_pyarrow() -> bool:
+    """True if the optional pyarrow package is installed"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def _to_text(value) -> Optional[str]:
+    """Convert a cell value to text the way pandas does for str columns (None stays None)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+class _SharedWorkbook:
+    """
+    An Excel file opened once and shared by the loaders of its sheets
+    
+    The openpyxl and python-calamine workbooks are each opened on first use
+    and kept until close().
+    """
+    
+    def __init__(self, loader: 'DataLoader'):
+        """
+        Initialize _SharedWorkbook
+        
+        Args:
+            loader (DataLoader): Loader of the file, used to open it
+        """
+        self._loader = loader
+        self._openpyxl = None
+        self._calamine = None
+    
+    def openpyxl(self):
+        """The file opened with openpyxl's read-only mode"""
+        if self._openpyxl is None:
+            self._openpyxl = openpyxl.load_workbook(self._loader._source(), read_only=True, data_only=True)
+        return self._openpyxl
+    
+    def calamine(self):
+        """The file opened with python-calamine"""
+        if self._calamine is None:
+            from python_calamine import CalamineWorkbook
+            
+            self._calamine = CalamineWorkbook.from_object(self._loader._source())
+        return self._calamine
+    
+    def sheet_names(self, streaming: bool = False) -> List[str]:
+        """
+        List the worksheets, from the handle the sheets will be read with
+        
+        Args:
+            streaming (bool): The sheets will be read with iter_chunks()
+        
+        Returns:
+            List[str]: Worksheet names
+        """
+        if self._loader._reads_with_openpyxl(streaming):
+            return list(self.openpyxl().sheetnames)
+        
+        if self._loader._reader_engine() == 'calamine':
+            from python_calamine import SheetTypeEnum
+            
+            # Chart and dialog sheets are left out, as pandas does
+            return [sheet.name for sheet in self.calamine().sheets_metadata
+                    if sheet.typ == SheetTypeEnum.WorkSheet]
+        
+        return self._loader.sheet_names()
+    
+    def close(self):
+        """Close the open workbooks"""
+        if self._openpyxl is not None:
+            self._openpyxl.close()
+        # Older python-calamine releases have no close()
+        if self._calamine is not None and hasattr(self._calamine, 'close'):
+            self._calamine.close()
+        self._openpyxl = self._calamine = None
+
+
 class DataLoader:
-    """Handles loading Excel data with manufacturing part information"""
+    """Handles loading Excel, CSV, TSV and Parquet data with manufacturing part information"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: Union[str, BinaryIO], sheet_name: Optional[str] = None,
+                 file_name: Optional[str] = None, tracer: Optional[NullTracer] = None):
         """
         Initialize DataLoader with file path
         
         Args:
-            file_path (str): Path to the Excel file
+            file_path (str or file-like): Path to the input file (.xlsx, .xls, .csv, .tsv or .parquet),
+                or a seekable binary file object such as an in-memory upload
+            sheet_name (str, optional): Excel sheet to read. Defaults to the first sheet
+            file_name (str, optional): Original file name, used to recognise the format of a
+                file object. Defaults to its name attribute
+            tracer (Tracer, optional): Times load() as 'read' and 'clean' spans,
+                and the cleaning of each iter_chunks() chunk as a 'clean' span
         """
         self.file_path = file_path
-        
-    def load_excel(self) -> pd.DataFrame:
+        self.sheet_name = sheet_name
+        if file_name is None:
+            file_name = os.fspath(file_path) if _is_path(file_path) else getattr(file_path, 'name', '')
+        self.file_name = str(file_name or '')
+        self.tracer = tracer or NullTracer()
+        self._format = None
+        # Sheet parsed by python-calamine, shared by the header and data reads of one load
+        self._calamine_sheet = None
+        # Workbook shared with the other sheets of the file (see open_sheets)
+        self._workbook = None
+    
+    @property
+    def file_format(self) -> str:
+        """Input format ('excel', 'csv', 'tsv' or 'parquet'), detected on first use"""
+        if self._format is None:
+            self._format = detect_format(self.file_path, self.file_name)
+        return self._format
+    
+    def load(self) -> pd.DataFrame:
         """
-        Load Excel file and extract MPN, model description, and quantity
+        Load the input file and extract MPN, model description, and quantity
+        
+        The header row is read first to work out which columns are needed, then
+        only those columns are parsed.
         
         Returns:
             pd.DataFrame: DataFrame with manufacturing part information
         """
         try:
-            logger.info(f"Loading Excel file: {self.file_path}")
+            logger.info(f"Loading {self.file_format} file: {self.file_name or 'in-memory data'}")
             
-            # Read the Excel file
-            df = pd.read_excel(self.file_path)
+            with self.tracer.span('read', format=self.file_format):
+                header, positions, mapping, text_columns = self._plan_columns()
+                df = self._read_columns(header, positions, text_columns)
             
-            logger.info(f"Loaded Excel with {len(df)} rows and {len(df.columns)} columns")
-            logger.info(f"Columns found: {list(df.columns)}")
+            logger.info(f"Loaded {len(df)} rows, reading {len(positions)} of {len(header)} columns")
             
             # Clean and standardize the data
-            cleaned_df = self._clean_data(df)
+            with self.tracer.span('clean', rows=len(df)):
+                cleaned_df = self._clean_data(df, mapping)
             
             logger.info(f"Cleaned data: {len(cleaned_df)} valid rows")
             return cleaned_df
             
         except Exception as e:
-            logger.error(f"Error loading Excel file: {str(e)}")
+            logger.error(f"Error loading {self.file_format} file: {str(e)}")
             raise
+        
+        finally:
+            self._calamine_sheet = None
     
-    def _clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def load_excel(self) -> pd.DataFrame:
         """
-        Clean and standardize the DataFrame
+        Load the input file (kept for existing callers; accepts every format load() does)
+        
+        Returns:
+            pd.DataFrame: DataFrame with manufacturing part information
+        """
+        return self.load()
+    
+    def sheet_names(self) -> List[Optional[str]]:
+        """
+        List the sheets in the input file
+        
+        Returns:
+            List[Optional[str]]: Sheet names for Excel files, [None] for single-table formats
+        """
+        if self.file_format != 'excel':
+            return [None]
+        
+        if self._reader_engine() == 'openpyxl':
+            workbook = openpyxl.load_workbook(self._source(), read_only=True)
+            try:
+                return list(workbook.sheetnames)
+            finally:
+                workbook.close()
+        
+        with pd.ExcelFile(self._source(), engine=self._reader_engine()) as excel_file:
+            return list(excel_file.sheet_names)
+    
+    @contextmanager
+    def open_sheets(self, streaming: bool = False):
+        """
+        Open the file once and give a loader for each of its sheets
+        
+        The loaders share the open workbook, so it is read and parsed once for
+        the whole file rather than once per sheet (the pandas fallback for
+        .xls files without python-calamine still parses each sheet separately).
+        The workbook is closed when the block ends.
         
         Args:
-            df (pd.DataFrame): Original DataFrame
+            streaming (bool): The sheets will be read with iter_chunks()
+        
+        Yields:
+            List[DataLoader]: One loader per sheet; just this loader for single-table formats
+        """
+        if self.file_format != 'excel':
+            yield [self]
+            return
+        
+        workbook = _SharedWorkbook(self)
+        try:
+            loaders = []
+            for sheet_name in workbook.sheet_names(streaming):
+                loader = DataLoader(self.file_path, sheet_name=sheet_name, file_name=self.file_name, tracer=self.tracer)
+                loader._workbook = workbook
+                loaders.append(loader)
+            yield loaders
+        finally:
+            workbook.close()
+    
+    def iter_chunks(self, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Load the input file in chunks, yielding each one as soon as it is parsed
+        
+        Chunks are cleaned exactly like load() and IDs continue across chunks,
+        so concatenating them gives the same result. .xlsx/.xlsm files are
+        always streamed with openpyxl's read-only mode (whichever engine load()
+        would use), and CSV/TSV and (with pyarrow) Parquet files are read in
+        chunks, keeping about one chunk of rows in memory. Other formats (.xls)
+        are parsed whole and converted chunk by chunk, so chunking does not
+        bound their memory.
+        
+        Args:
+            chunk_rows (int): Maximum number of input rows per chunk
+            
+        Yields:
+            pd.DataFrame: Cleaned chunk with ID, MPN, Model_Description and Quantity
+        """
+        try:
+            logger.info(f"Streaming {self.file_format} file in chunks of {chunk_rows} rows: {self.file_name or 'in-memory data'}")
+            
+            header, positions, mapping, text_columns = self._plan_columns(streaming=True)
+            
+            next_id = 1
+            for frame in self._iter_column_frames(header, positions, text_columns, chunk_rows):
+                with self.tracer.span('clean', rows=len(frame)):
+                    chunk = self._clean_data(frame, mapping, first_id=next_id)
+                next_id += len(chunk)
+                if len(chunk):
+                    yield chunk
+            
+            logger.info(f"Cleaned data: {next_id - 1} valid rows")
+            
+        except Exception as e:
+            logger.error(f"Error loading {self.file_format} file: {str(e)}")
+            raise
+        
+        finally:
+            self._calamine_sheet = None
+    
+    def _read_columns(self, header: List, positions: List[int], text_columns: List) -> pd.DataFrame:
+        """
+        Read the selected columns of the whole file
+        
+        Part numbers and descriptions are read as text, so codes like 00123 keep
+        their leading zeros.
+        
+        Args:
+            header (List): Header row
+            positions (List[int]): Column positions to read, in order
+            text_columns (List): Names of columns to read as text
+            
+        Returns:
+            pd.DataFrame: The selected columns, named as in the header
+        """
+        if self.file_format == 'parquet':
+            return self._read_parquet(header, positions, text_columns)
+        
+        if self.file_format in DELIMITERS:
+            return self._read_delimited(header, positions, text_columns)
+        
+        engine = self._reader_engine()
+        if engine == 'openpyxl':
+            rows = [row for batch in self._iter_row_batches(positions) for row in batch]
+            return self._build_frame(rows, header, positions, text_columns)
+        
+        if engine == 'calamine':
+            rows = [row for batch in self._iter_calamine_batches(positions) for row in batch]
+            return self._build_frame(rows, header, positions, text_columns)
+        
+        return pd.read_excel(
+            self._source(),
+            sheet_name=self._sheet_key(),
+            engine=engine,
+            usecols=positions,
+            dtype={name: str for name in text_columns if name is not None}
+        )
+    
+    def _iter_column_frames(self, header: List, positions: List[int], text_columns: List,
+                            chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Read the selected columns in frames of at most ``chunk_rows`` rows
+        
+        Args:
+            header (List): Header row
+            positions (List[int]): Column positions to read, in order
+            text_columns (List): Names of columns to read as text
+            chunk_rows (int): Maximum rows per frame
+            
+        Yields:
+            pd.DataFrame: The selected columns of the next rows
+        """
+        if self._is_openpyxl_file():
+            for rows in self._iter_row_batches(positions, chunk_rows):
+                yield self._build_frame(rows, header, positions, text_columns)
+        
+        elif self.file_format == 'excel' and self._reader_engine() == 'calamine':
+            for rows in self._iter_calamine_batches(positions, chunk_rows):
+                yield self._build_frame(rows, header, positions, text_columns)
+        
+        elif self.file_format in DELIMITERS:
+            yield from pd.read_csv(
+                self._source(),
+                sep=DELIMITERS[self.file_format],
+                usecols=positions,
+                dtype={name: str for name in text_columns},
+                chunksize=chunk_rows
+            )
+        
+        elif self.file_format == 'parquet' and _has_pyarrow():
+            import pyarrow.parquet as pq
+            
+            names = [header[position] for position in positions]
+            for batch in pq.ParquetFile(self._source()).iter_batches(batch_size=chunk_rows, columns=names):
+                yield self._as_text(batch.to_pandas(), text_columns)
+        
+        else:
+            df = self._read_columns(header, positions, text_columns)
+            for start in range(0, len(df), chunk_rows):
+                yield df.iloc[start:start + chunk_rows]
+    
+    def _read_delimited(self, header: List, positions: List[int], text_columns: List) -> pd.DataFrame:
+        """
+        Read selected columns of a CSV or TSV file
+        
+        Uses pyarrow's multithreaded CSV reader when installed, pandas otherwise.
+        
+        Args:
+            header (List): Header row
+            positions (List[int]): Column positions to read, in order
+            text_columns (List): Names of columns to read as text
+            
+        Returns:
+            pd.DataFrame: The selected columns, named as in the header
+        """
+        delimiter = DELIMITERS[self.file_format]
+        
+        if _has_pyarrow():
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            
+            table = pa_csv.read_csv(
+                self._source(),
+                parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[header[position] for position in positions],
+                    column_types={name: pa.string() for name in text_columns},
+                    strings_can_be_null=True
+                )
+            )
+            return table.to_pandas()
+        
+        return pd.read_csv(
+            self._source(),
+            sep=delimiter,
+            usecols=positions,
+            dtype={name: str for name in text_columns}
+        )
+    
+    def _read_parquet(self, header: List, positions: List[int], text_columns: List) -> pd.DataFrame:
+        """
+        Read selected columns of a Parquet file
+        
+        Args:
+            header (List): Header row (column names)
+            positions (List[int]): Column positions to read, in order
+            text_columns (List): Names of columns to read as text
+            
+        Returns:
+            pd.DataFrame: The selected columns
+        """
+        df = pd.read_parquet(self._source(), columns=[header[position] for position in positions])
+        return self._as_text(df, text_columns)
+    
+    def _as_text(self, df: pd.DataFrame, text_columns: List) -> pd.DataFrame:
+        """
+        Convert typed (e.g. Parquet integer) columns to text
+        
+        Missing values stay missing and empty strings become missing, as they
+        do when reading Excel and CSV files.
+        """
+        for name in text_columns:
+            df[name] = df[name].map(lambda value: _to_text(value) or None, na_action='ignore')
+        return df
+    
+    def _plan_columns(self, streaming: bool = False):
+        """
+        Read the header row and work out which columns to load
+        
+        Args:
+            streaming (bool): The rows will be streamed by iter_chunks()
+        
+        Returns:
+            Tuple of (header, positions, mapping, text_columns): the header row,
+            the sheet positions to read in order, the standard name to position
+            mapping within those columns, and the header names to read as text
+        """
+        header = self._read_header(streaming)
+        logger.info(f"Columns found: {header}")
+        
+        sheet_mapping = self._map_columns(header)
+        if 'MPN' not in sheet_mapping or 'Model_Description' not in sheet_mapping:
+            raise ValueError(f"No MPN and Model Description columns found in {header}")
+        
+        positions = sorted(sheet_mapping.values())
+        text_columns = [header[sheet_mapping[col]] for col in TEXT_COLUMNS if col in sheet_mapping]
+        
+        # Positions within the pruned columns, which is what _clean_data sees
+        mapping = {col: positions.index(position) for col, position in sheet_mapping.items()}
+        return header, positions, mapping, text_columns
+    
+    def _reader_engine(self) -> Optional[str]:
+        """
+        Pick the fastest available pandas engine for an Excel file
+        
+        Returns:
+            str: 'calamine' if python-calamine is installed, 'openpyxl' for .xlsx/.xlsm,
+                otherwise None (pandas chooses)
+        """
+        if importlib.util.find_spec('python_calamine') is not None:
+            return 'calamine'
+        if self.file_name.lower().endswith(OPENPYXL_EXTENSIONS):
+            return 'openpyxl'
+        return None
+    
+    def _is_openpyxl_file(self) -> bool:
+        """True for an Excel file openpyxl can stream (.xlsx/.xlsm)"""
+        return self.file_format == 'excel' and self.file_name.lower().endswith(OPENPYXL_EXTENSIONS)
+    
+    def _reads_with_openpyxl(self, streaming: bool = False) -> bool:
+        """
+        True if the sheet is read with openpyxl
+        
+        Args:
+            streaming (bool): The rows will be streamed by iter_chunks(), which
+                always uses openpyxl for .xlsx/.xlsm files
+        """
+        return self._reader_engine() == 'openpyxl' or (streaming and self._is_openpyxl_file())
+    
+    def _iter_row_batches(self, positions: List[int], batch_rows: Optional[int] = None) -> Iterator[List[tuple]]:
+        """
+        Stream selected columns of the sheet with openpyxl's read-only mode
+        
+        Only the requested cells of each row are kept, so the other columns of a
+        wide sheet are never turned into Python objects.
+        
+        Args:
+            positions (List[int]): Column positions to keep, in order
+            batch_rows (int, optional): Rows per batch. All rows in one batch if not provided
+            
+        Yields:
+            List[tuple]: Batch of rows, each holding the selected values
+        """
+        workbook = self._open_openpyxl()
+        try:
+            rows = self._worksheet(workbook).iter_rows(min_row=2, max_col=max(positions) + 1, values_only=True)
+            batch = []
+            for row in rows:
+                batch.append(tuple(row[position] if position < len(row) else None for position in positions))
+                if batch_rows and len(batch) >= batch_rows:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+        finally:
+            self._close_openpyxl(workbook)
+    
+    def _open_openpyxl(self):
+        """The file in openpyxl's read-only mode: the shared workbook, or a newly opened one"""
+        if self._workbook is not None:
+            return self._workbook.openpyxl()
+        return openpyxl.load_workbook(self._source(), read_only=True, data_only=True)
+    
+    def _close_openpyxl(self, workbook):
+        """Close a workbook from _open_openpyxl, unless it is shared with other sheets"""
+        if self._workbook is None:
+            workbook.close()
+    
+    def _open_calamine_sheet(self):
+        """
+        Parse the selected sheet with python-calamine, once per load
+        
+        The header and the data rows are read from the same parsed sheet, so
+        the workbook is only opened and parsed once.
+        
+        Returns:
+            CalamineSheet: The selected sheet (the first one by default)
+        """
+        if self._calamine_sheet is None:
+            if self._workbook is not None:
+                workbook = self._workbook.calamine()
+            else:
+                from python_calamine import CalamineWorkbook
+                
+                workbook = CalamineWorkbook.from_object(self._source())
+            if self.sheet_name is not None:
+                self._calamine_sheet = workbook.get_sheet_by_name(self.sheet_name)
+            else:
+                self._calamine_sheet = workbook.get_sheet_by_index(0)
+        return self._calamine_sheet
+    
+    def _iter_calamine_rows(self) -> Iterator[List]:
+        """
+        Rows of the selected sheet from python-calamine, aligned to sheet columns
+        
+        calamine leaves out empty leading columns and returns empty cells as '';
+        both are put back as None, as openpyxl returns them.
+        
+        Yields:
+            List: Cell values of each row, header row first
+        """
+        sheet = self._open_calamine_sheet()
+        padding = [None] * (sheet.start[1] if sheet.start else 0)
+        for row in sheet.iter_rows():
+            yield padding + [None if value == '' else value for value in row]
+    
+    def _iter_calamine_batches(self, positions: List[int], batch_rows: Optional[int] = None) -> Iterator[List[tuple]]:
+        """
+        Selected columns of the data rows parsed by python-calamine
+        
+        Args:
+            positions (List[int]): Column positions to keep, in order
+            batch_rows (int, optional): Rows per batch. All rows in one batch if not provided
             
+        Yields:
+            List[tuple]: Batch of rows, each holding the selected values
+        """
+        rows = self._iter_calamine_rows()
+        next(rows, None)
+        
+        batch = []
+        for row in rows:
+            batch.append(tuple(row[position] if position < len(row) else None for position in positions))
+            if batch_rows and len(batch) >= batch_rows:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _build_frame(self, rows: List[tuple], header: List, positions: List[int],
+                     text_columns: List) -> pd.DataFrame:
+        """
+        Turn streamed rows into a DataFrame, converting text columns like pandas' dtype=str
+        
+        Args:
+            rows (List[tuple]): Selected values of each row
+            header (List): Header row
+            positions (List[int]): Sheet positions of the selected columns
+            text_columns (List): Names of columns to read as text
+            
+        Returns:
+            pd.DataFrame: The selected columns, named as in the header
+        """
+        columns = list(zip(*rows)) if rows else [()] * len(positions)
+        
+        values = {}
+        for index, (position, column) in enumerate(zip(positions, columns)):
+            if header[position] in text_columns:
+                values[index] = [_to_text(v) for v in column]
+            else:
+                values[index] = list(column)
+        
+        df = pd.DataFrame(values)
+        df.columns = [header[position] for position in positions]
+        return df
+    
+    def _read_header(self, streaming: bool = False) -> List[str]:
+        """
+        Read just the header row (of the selected sheet for Excel files)
+        
+        openpyxl stops after the first row in read-only mode. calamine parses
+        the whole sheet, so the parsed sheet is kept for the data read that
+        follows. Parquet column names come from the file schema.
+        
+        Args:
+            streaming (bool): Read an .xlsx/.xlsm header with openpyxl, which
+                streams the rows that follow
+        
         Returns:
-            pd.DataFrame: Cleaned DataFrame
+            List[str]: Column names, in order
+        """
+        if self.file_format in DELIMITERS:
+            return list(pd.read_csv(self._source(), sep=DELIMITERS[self.file_format], nrows=0).columns)
+        
+        if self.file_format == 'parquet':
+            if _has_pyarrow():
+                import pyarrow.parquet as pq
+                # Leave out the index pandas stores alongside the data
+                return [name for name in pq.read_schema(self._source()).names
+                        if not name.startswith('__index_level_')]
+            return list(pd.read_parquet(self._source()).columns)
+        
+        engine = self._reader_engine()
+        if self._reads_with_openpyxl(streaming):
+            workbook = self._open_openpyxl()
+            try:
+                first_row = next(self._worksheet(workbook).iter_rows(max_row=1, values_only=True), ())
+            finally:
+                self._close_openpyxl(workbook)
+        elif engine == 'calamine':
+            first_row = next(self._iter_calamine_rows(), [])
+        else:
+            return list(pd.read_excel(self._source(), sheet_name=self._sheet_key(), engine=engine, nrows=0).columns)
+        
+        # Trailing empty cells are not part of the header (pandas ignores them too)
+        header = list(first_row)
+        while header and header[-1] is None:
+            header.pop()
+        return header
+    
+    def _source(self):
+        """The file path, or the file object rewound so each read starts at the beginning"""
+        if not _is_path(self.file_path):
+            self.file_path.seek(0)
+        return self.file_path
+    
+    def _sheet_key(self):
+        """Sheet argument for pd.read_excel: the sheet name, or 0 for the first sheet"""
+        return self.sheet_name if self.sheet_name is not None else 0
+    
+    def _worksheet(self, workbook):
+        """The selected sheet of an openpyxl workbook (the first one by default)"""
+        if self.sheet_name is not None:
+            return workbook[self.sheet_name]
+        return workbook.worksheets[0]
+    
+    def _map_columns(self, columns: List) -> Dict[str, int]:
         """
-        # Try to identify columns automatically
-        df_clean = df.copy()
+        Work out which columns hold the MPN, model description and quantity
+        
+        Column names are matched case-insensitively against known keywords. If
+        any required column is not found, the first three columns are used.
         
+        Args:
+            columns (List): Column names, in order
+        
+        Returns:
+            Dict[str, int]: Column position by standard name (Quantity may be absent)
+        """
         # Standardize column names (case-insensitive matching)
-        column_mapping = {}
-        for col in df.columns:
+        mapping = {}
+        for position, col in enumerate(columns):
             col_lower = str(col).lower().strip()
             if any(x in col_lower for x in ['mpn', 'part number', 'part_number', 'partnumber']):
-                column_mapping[col] = 'MPN'
+                mapping.setdefault('MPN', position)
             elif any(x in col_lower for x in ['model', 'description', 'product']):
-                column_mapping[col] = 'Model_Description'
+                mapping.setdefault('Model_Description', position)
             elif any(x in col_lower for x in ['quantity', 'qty', 'amount']):
-                column_mapping[col] = 'Quantity'
+                mapping.setdefault('Quantity', position)
         
-        # Rename columns if mapping found
-        if column_mapping:
-            df_clean = df_clean.rename(columns=column_mapping)
-            logger.info(f"Mapped columns: {column_mapping}")
+        if mapping:
+            mapped = {columns[position]: name for name, position in mapping.items()}
+            logger.info(f"Mapped columns: {mapped}")
         
         # Ensure required columns exist
-        required_cols = ['MPN', 'Model_Description', 'Quantity']
-        missing_cols = [col for col in required_cols if col not in df_clean.columns]
+        missing_cols = [col for col in REQUIRED_COLUMNS if col not in mapping]
         
         if missing_cols:
             logger.warning(f"Missing columns: {missing_cols}")
             # Use first three columns as fallback
-            if len(df_clean.columns) >= 3:
+            if len(columns) >= 3:
                 logger.info("Using first 3 columns as MPN, Model_Description, Quantity")
-                df_clean.columns = required_cols + list(df_clean.columns[3:])
+                mapping = {col: position for position, col in enumerate(REQUIRED_COLUMNS)}
+        
+        return mapping
+    
+    def _clean_data(self, df: pd.DataFrame, mapping: Optional[Dict[str, int]] = None,
+                    first_id: int = 1) -> pd.DataFrame:
+        """
+        Clean and standardize the DataFrame
+        
+        Args:
+            df (pd.DataFrame): Original DataFrame
+            mapping (Dict[str, int], optional): Column position by standard name.
+                Worked out from the column names if not provided
+            first_id (int): ID given to the first cleaned row
+        
+        Returns:
+            pd.DataFrame: Cleaned DataFrame with ID, MPN, Model_Description and Quantity
+        """
+        # Keep only the mapped columns under their standard names
+        if mapping is None:
+            mapping = self._map_columns(list(df.columns))
+        df_clean = df.iloc[:, list(mapping.values())]
+        df_clean.columns = list(mapping.keys())
         
         # Remove rows with missing critical data
         df_clean = df_clean.dropna(subset=['MPN', 'Model_Description'])
         
-        # Fill missing quantities with 1
+        # Fill missing quantities with 1, then convert quantity to integer
         if 'Quantity' in df_clean.columns:
-            df_clean['Quantity'] = df_clean['Quantity'].fillna(1)
+            quantity = pd.to_numeric(df_clean['Quantity'], errors='coerce').fillna(1).astype(int)
         else:
-            df_clean['Quantity'] = 1
-        
-        # Convert quantity to integer
-        df_clean['Quantity'] = pd.to_numeric(df_clean['Quantity'], errors='coerce').fillna(1).astype(int)
+            quantity = 1
+        df_clean = df_clean.assign(Quantity=quantity)[REQUIRED_COLUMNS]
         
         # Add ID column
-        df_clean.insert(0, 'ID', range(1, len(df_clean) + 1))
+        df_clean.insert(0, 'ID', range(first_id, first_id + len(df_clean)))
         
         return df_clean
     
@@ -116,9 +803,7 @@ class DataLoader:
         Returns:
             bool: True if valid, False otherwise
         """
-        required_columns = ['MPN', 'Model_Description', 'Quantity']
-        
-        for col in required_columns:
+        for col in REQUIRED_COLUMNS:
             if col not in df.columns:
                 logger.error(f"Missing required column: {col}")
                 return False
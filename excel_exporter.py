@@ -5,16 +5,197 @@ Handles exporting manufacturer analysis results to Excel with formatting
 
 import pandas as pd
 import logging
+import itertools
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.formatting.rule import FormulaRule
 from openpyxl.utils import get_column_letter
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Columns added by ManufacturerFinder, and the ones it adds instead for failed rows
+RESULT_COLUMNS = ['Top_Manufacturer', 'All_Manufacturers', 'Avg_Credibility_Score',
+                  'Recommendation', 'Detailed_Analysis', 'Additional_Info']
+ERROR_COLUMNS = ['Manufacturers', 'Credibility_Score', 'Details']
+SUMMARY_COLUMNS = ['ID', 'MPN', 'Model_Description', 'Top_Manufacturer', 'Avg_Credibility_Score']
+
+# Column widths by column name (other columns default to 15)
+COLUMN_WIDTHS = {
+    'ID': 8,
+    'MPN': 20,
+    'Model_Description': 40,
+    'Quantity': 12,
+    'Top_Manufacturer': 25,
+    'All_Manufacturers': 35,
+    'Avg_Credibility_Score': 18,
+    'Recommendation': 45,
+    'Detailed_Analysis': 50,
+    'Additional_Info': 35
+}
+
+# Named styles, registered once per workbook and shared by every cell
+HEADER_STYLE = 'Analysis Header'
+BODY_STYLE = 'Analysis Body'
+
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center', wrap_text=True)
+BODY_ALIGNMENT = Alignment(vertical='top', wrap_text=True)
+
+THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# Credibility score bands, applied by Excel through conditional formatting rules
+HIGH_SCORE_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+MEDIUM_SCORE_FILL = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+LOW_SCORE_FILL = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+SCORE_BANDS = [
+    ('AND(ISNUMBER({cell}),{cell}>=80)', HIGH_SCORE_FILL),
+    ('AND(ISNUMBER({cell}),{cell}>=60,{cell}<80)', MEDIUM_SCORE_FILL),
+    ('AND(ISNUMBER({cell}),{cell}<60)', LOW_SCORE_FILL)
+]
+
+HEADER_HEIGHT = 30
+ROW_HEIGHT = 60
+MAX_EXCEL_ROW = 1048576
+
+
+def stream_columns(first_row: Optional[Dict]) -> List[str]:
+    """
+    Work out the header for a streamed export before all rows are known
+    
+    The header only depends on the input columns, so it is the same whether
+    the first row succeeded or failed, and the same for chunked and whole-file
+    runs. The error columns are always included, since a failed row may
+    still follow.
+    
+    Args:
+        first_row (Dict, optional): First row to be written
+    
+    Returns:
+        List[str]: The input columns of the first row, then RESULT_COLUMNS and ERROR_COLUMNS
+    """
+    added = RESULT_COLUMNS + ERROR_COLUMNS
+    if first_row:
+        columns = [column for column in first_row if column not in added]
+    else:
+        columns = ['ID', 'MPN', 'Model_Description', 'Quantity']
+    return columns + added
+
+
+def _register_styles(workbook):
+    """
+    Add the header and body named styles to a new workbook
+    
+    Args:
+        workbook: openpyxl workbook without the analysis styles
+    
+    Returns:
+        StyleArray: The body style's resolved style ids, shared by every body cell
+    """
+    workbook.add_named_style(NamedStyle(
+        name=HEADER_STYLE, fill=HEADER_FILL, font=HEADER_FONT,
+        alignment=HEADER_ALIGNMENT, border=THIN_BORDER
+    ))
+    body_style = NamedStyle(name=BODY_STYLE, alignment=BODY_ALIGNMENT, border=THIN_BORDER)
+    workbook.add_named_style(body_style)
+    return body_style.as_tuple()
+
+
+def _format_worksheet(worksheet, columns: List[str]):
+    """
+    Lay out a worksheet before any rows are written
+    
+    Everything here is per column, not per cell: widths, the default row
+    height and the score band rules, which cover the whole column so rows
+    appended later pick them up without further work.
+    
+    Args:
+        worksheet: openpyxl worksheet object
+        columns (List[str]): Column names, in order
+    """
+    for col_num, column in enumerate(columns, 1):
+        col_letter = get_column_letter(col_num)
+        worksheet.column_dimensions[col_letter].width = COLUMN_WIDTHS.get(column, 15)
+        
+        if column == 'Avg_Credibility_Score':
+            cell_range = f"{col_letter}2:{col_letter}{MAX_EXCEL_ROW}"
+            for formula, fill in SCORE_BANDS:
+                rule = FormulaRule(formula=[formula.format(cell=f"{col_letter}2")], fill=fill)
+                worksheet.conditional_formatting.add(cell_range, rule)
+    
+    # Set row heights
+    worksheet.row_dimensions[1].height = HEADER_HEIGHT
+    worksheet.sheet_format.defaultRowHeight = ROW_HEIGHT
+    worksheet.sheet_format.customHeight = True
+    
+    # Freeze the header row
+    worksheet.freeze_panes = 'A2'
+
+
+class _SheetWriter:
+    """
+    Write-only worksheet that gives every body cell the shared body style
+    
+    The body style is resolved once per workbook; each cell is created with
+    those style ids instead of looking the named style up again.
+    """
+    
+    def __init__(self, workbook, title: str, columns: List[str], body_style):
+        """
+        Create the sheet, lay it out and write the header row
+        
+        Args:
+            workbook: openpyxl write-only workbook
+            title (str): Sheet name
+            columns (List[str]): Column names, in order
+            body_style (StyleArray): Body style ids returned by _register_styles
+        """
+        self.worksheet = workbook.create_sheet(title)
+        self.columns = columns
+        self.rows_written = 0
+        
+        # Layout must be set before any row is written in write-only mode
+        _format_worksheet(self.worksheet, columns)
+        
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(self.worksheet, value=column)
+            cell.style = HEADER_STYLE
+            header.append(cell)
+        self.worksheet.append(header)
+        self._body_style = body_style
+    
+    def append(self, row: Dict):
+        """
+        Write one row; columns missing from the row are left blank
+        
+        Args:
+            row (Dict): Values by column name
+        """
+        cells = []
+        for column in self.columns:
+            value = row.get(column)
+            if isinstance(value, float) and value != value:
+                value = None
+            
+            # Empty cells are written too, so every row keeps its borders. Like
+            # WriteOnlyCell, the position is a placeholder set by append()
+            cells.append(Cell(self.worksheet, row=1, column=1, value=value, style_array=self._body_style))
+        
+        self.worksheet.append(cells)
+        self.rows_written += 1
+
+
 class ExcelExporter:
     """Exports manufacturer analysis results to formatted Excel files"""
     
@@ -30,6 +211,9 @@ class ExcelExporter:
         else:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             self.output_path = f"manufacturer_analysis_{timestamp}.xlsx"
+        self.rows_written = 0
+        self._workbook = None
+        self._sheets = []
     
     def export(self, df: pd.DataFrame) -> str:
         """
@@ -37,109 +221,11 @@ class ExcelExporter:
         
         Args:
             df (pd.DataFrame): DataFrame to export
-            
+        
         Returns:
             str: Path to the exported file
         """
-        try:
-            logger.info(f"Exporting results to {self.output_path}")
-            
-            # Write to Excel
-            with pd.ExcelWriter(self.output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name='Manufacturer Analysis', index=False)
-                
-                # Get the workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Manufacturer Analysis']
-                
-                # Apply formatting
-                self._format_worksheet(worksheet, df)
-            
-            logger.info(f"Successfully exported to {self.output_path}")
-            return self.output_path
-            
-        except Exception as e:
-            logger.error(f"Error exporting to Excel: {str(e)}")
-            raise
-    
-    def _format_worksheet(self, worksheet, df: pd.DataFrame):
-        """
-        Apply formatting to the worksheet
-        
-        Args:
-            worksheet: openpyxl worksheet object
-            df (pd.DataFrame): Source DataFrame
-        """
-        # Define styles
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=11)
-        
-        # Credibility score fills
-        high_score_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-        medium_score_fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
-        low_score_fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
-        
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        # Format header row
-        for col_num, column in enumerate(df.columns, 1):
-            cell = worksheet.cell(row=1, column=col_num)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-            cell.border = border
-        
-        # Format data rows
-        for row_num in range(2, len(df) + 2):
-            for col_num in range(1, len(df.columns) + 1):
-                cell = worksheet.cell(row=row_num, column=col_num)
-                cell.alignment = Alignment(vertical='top', wrap_text=True)
-                cell.border = border
-                
-                # Apply conditional formatting for credibility scores
-                if df.columns[col_num - 1] == 'Avg_Credibility_Score':
-                    try:
-                        score = float(cell.value)
-                        if score >= 80:
-                            cell.fill = high_score_fill
-                        elif score >= 60:
-                            cell.fill = medium_score_fill
-                        else:
-                            cell.fill = low_score_fill
-                    except (ValueError, TypeError):
-                        pass
-        
-        # Adjust column widths
-        column_widths = {
-            'ID': 8,
-            'MPN': 20,
-            'Model_Description': 40,
-            'Quantity': 12,
-            'Top_Manufacturer': 25,
-            'All_Manufacturers': 35,
-            'Avg_Credibility_Score': 18,
-            'Recommendation': 45,
-            'Detailed_Analysis': 50,
-            'Additional_Info': 35
-        }
-        
-        for col_num, column in enumerate(df.columns, 1):
-            col_letter = get_column_letter(col_num)
-            width = column_widths.get(column, 15)
-            worksheet.column_dimensions[col_letter].width = width
-        
-        # Set row heights
-        worksheet.row_dimensions[1].height = 30
-        for row_num in range(2, len(df) + 2):
-            worksheet.row_dimensions[row_num].height = 60
-        
-        # Freeze the header row
-        worksheet.freeze_panes = 'A2'
+        return self.export_rows(self._iter_records(df), columns=list(df.columns))
     
     def create_summary_sheet(self, df: pd.DataFrame, output_path: Optional[str] = None) -> str:
         """
@@ -148,32 +234,137 @@ class ExcelExporter:
         Args:
             df (pd.DataFrame): DataFrame with manufacturer analysis
             output_path (str, optional): Output file path
-            
+        
         Returns:
             str: Path to the exported file
         """
         if output_path:
             self.output_path = output_path
         
+        return self.export_frame(df)
+    
+    def export_report(self, rows: Iterable[Dict], columns: Optional[List[str]] = None) -> str:
+        """
+        Write the detailed and summary sheets in a single pass over the results
+        
+        Each row is appended to both sheets as it is read, so the summary is
+        never built as a separate table and the results are traversed once.
+        
+        Args:
+            rows (Iterable[Dict]): Result rows (e.g. from ManufacturerFinder.find_manufacturers_iter)
+            columns (List[str], optional): Detailed sheet column order. Defaults to the first
+                row's input columns followed by the result and error columns
+        
+        Returns:
+            str: Path to the exported file
+        """
         try:
             logger.info(f"Creating summary report at {self.output_path}")
             
-            with pd.ExcelWriter(self.output_path, engine='openpyxl') as writer:
-                # Write detailed analysis
-                df.to_excel(writer, sheet_name='Detailed Analysis', index=False)
-                
-                # Create summary DataFrame
-                summary_df = df[['ID', 'MPN', 'Model_Description', 'Top_Manufacturer', 'Avg_Credibility_Score']].copy()
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Format both sheets
-                self._format_worksheet(writer.sheets['Detailed Analysis'], df)
-                self._format_worksheet(writer.sheets['Summary'], summary_df)
+            rows = iter(rows)
+            first = next(rows, None)
+            if columns is None:
+                columns = stream_columns(first)
+            
+            self.open(columns)
+            if first is not None:
+                for row in itertools.chain([first], rows):
+                    self.write_row(row)
+            self.close()
             
             logger.info(f"Successfully created summary report at {self.output_path}")
             return self.output_path
-            
+        
         except Exception as e:
             logger.error(f"Error creating summary report: {str(e)}")
             raise
-
+    
+    def export_rows(self, rows: Iterable[Dict], columns: Optional[List[str]] = None,
+                    sheet_name: str = 'Manufacturer Analysis') -> str:
+        """
+        Stream rows into a formatted Excel file as they arrive
+        
+        Rows are styled and flushed to disk one at a time, so memory use does
+        not grow with the number of rows.
+        
+        Args:
+            rows (Iterable[Dict]): Result rows (e.g. from ManufacturerFinder.find_manufacturers_iter)
+            columns (List[str], optional): Column order. Defaults to the first row's input
+                columns followed by the result and error columns
+            sheet_name (str): Worksheet name
+        
+        Returns:
+            str: Path to the exported file
+        """
+        try:
+            logger.info(f"Streaming results to {self.output_path}")
+            
+            rows = iter(rows)
+            first = next(rows, None)
+            if columns is None:
+                columns = stream_columns(first)
+            
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = _SheetWriter(workbook, sheet_name, columns, _register_styles(workbook))
+            if first is not None:
+                sheet.append(first)
+                for row in rows:
+                    sheet.append(row)
+            workbook.save(self.output_path)
+            
+            logger.info(f"Successfully exported {sheet.rows_written} rows to {self.output_path}")
+            return self.output_path
+        
+        except Exception as e:
+            logger.error(f"Error exporting to Excel: {str(e)}")
+            raise
+    
+    def open(self, columns: List[str]):
+        """
+        Start the detailed and summary report (row-by-row exporter protocol)
+        
+        Args:
+            columns (List[str]): Detailed sheet column order
+        """
+        self.rows_written = 0
+        self._workbook = openpyxl.Workbook(write_only=True)
+        body_style = _register_styles(self._workbook)
+        self._sheets = [
+            _SheetWriter(self._workbook, 'Detailed Analysis', columns, body_style),
+            _SheetWriter(self._workbook, 'Summary', SUMMARY_COLUMNS, body_style)
+        ]
+    
+    def write_row(self, row: Dict):
+        """
+        Append one result row to both sheets of the report
+        
+        Args:
+            row (Dict): Values by column name
+        """
+        for sheet in self._sheets:
+            sheet.append(row)
+        self.rows_written += 1
+    
+    def close(self):
+        """Save the report opened with open()"""
+        self._workbook.save(self.output_path)
+        self._workbook = None
+        self._sheets = []
+    
+    def export_frame(self, df: pd.DataFrame) -> str:
+        """
+        Write a results DataFrame as the detailed and summary report
+        
+        Args:
+            df (pd.DataFrame): DataFrame with manufacturer analysis
+        
+        Returns:
+            str: Path to the exported file
+        """
+        return self.export_report(self._iter_records(df), columns=list(df.columns))
+    
+    def _iter_records(self, df: pd.DataFrame) -> Iterator[Dict]:
+        """Yield DataFrame rows as dicts one at a time"""
+        columns = list(df.columns)
+        for values in df.itertuples(index=False, name=None):
+            yield dict(zip(columns, values))
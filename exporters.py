@@ -0,0 +1,365 @@
+"""
+Exporters Module
+Writes analysis results as Parquet, Arrow, NDJSON or CSV for downstream tools,
+alongside the formatted Excel report
+"""
+
+import sys
+import csv
+import json
+import logging
+import itertools
+import pandas as pd
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from excel_exporter import ExcelExporter, stream_columns
+from tracing import NullTracer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Output path that sends NDJSON to standard output
+STDOUT = '-'
+
+# Typed result columns; every other column is written as text
+INTEGER_COLUMNS = ['ID', 'Quantity']
+FLOAT_COLUMNS = ['Avg_Credibility_Score', 'Credibility_Score']
+
+# Rows buffered per Parquet row group / Arrow record batch when streaming
+DEFAULT_BATCH_ROWS = 10000
+
+
+def _require_pyarrow():
+    """Import pyarrow, explaining what needs it if it is missing"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow output require pyarrow (pip install pyarrow)")
+    return pyarrow
+
+
+def _cell_value(value, column: str):
+    """
+    Convert one result value to its column's output type
+    
+    Args:
+        value: Value from a result row
+        column (str): Column name
+    
+    Returns:
+        int, float, str or None (for missing values)
+    """
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    
+    if column in INTEGER_COLUMNS or column in FLOAT_COLUMNS:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        if number != number:
+            return None
+        return int(number) if column in INTEGER_COLUMNS else number
+    
+    return str(value)
+
+
+def _typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give a results DataFrame the same column types as streamed rows
+    
+    Args:
+        df (pd.DataFrame): Results DataFrame
+    
+    Returns:
+        pd.DataFrame: Nullable integer, float and string columns, with a default index
+    """
+    columns = {}
+    for column in df.columns:
+        if column in INTEGER_COLUMNS:
+            columns[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
+        elif column in FLOAT_COLUMNS:
+            columns[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+        else:
+            columns[column] = df[column].astype('string')
+    return pd.DataFrame(columns).reset_index(drop=True)
+
+
+class RowExporter(ABC):
+    """
+    Base class for exporters that can write a whole results DataFrame at once
+    or stream rows one at a time: open(columns), write_row(row)..., close()
+    """
+    
+    def __init__(self, output_path: str):
+        """
+        Initialize the exporter
+        
+        Args:
+            output_path (str): Output file path
+        """
+        self.output_path = output_path
+        self.columns = []
+        self.rows_written = 0
+    
+    def open(self, columns: List[str]):
+        """
+        Start the output file
+        
+        Args:
+            columns (List[str]): Column order
+        """
+        self.columns = list(columns)
+        self.rows_written = 0
+    
+    @abstractmethod
+    def write_row(self, row: Dict):
+        """
+        Write one result row; columns missing from the row are left empty
+        
+        Args:
+            row (Dict): Values by column name
+        """
+    
+    def close(self):
+        """Finish and close the output file"""
+    
+    def export_frame(self, df: pd.DataFrame) -> str:
+        """
+        Write a results DataFrame
+        
+        Args:
+            df (pd.DataFrame): DataFrame with manufacturer analysis
+        
+        Returns:
+            str: Path to the exported file
+        """
+        self.open(list(df.columns))
+        for values in df.itertuples(index=False, name=None):
+            self.write_row(dict(zip(self.columns, values)))
+        self.close()
+        return self.output_path
+
+
+class _ArrowBatchExporter(RowExporter):
+    """Streams rows into Arrow record batches of a fixed schema"""
+    
+    def __init__(self, output_path: str, batch_rows: int = DEFAULT_BATCH_ROWS):
+        """
+        Initialize the exporter
+        
+        Args:
+            output_path (str): Output file path
+            batch_rows (int): Rows buffered before each batch is written
+        """
+        super().__init__(output_path)
+        self.batch_rows = batch_rows
+        self._writer = None
+        self._schema = None
+        self._buffer = {}
+    
+    def open(self, columns: List[str]):
+        pa = _require_pyarrow()
+        super().open(columns)
+        self._schema = pa.schema([(column, self._arrow_type(pa, column)) for column in self.columns])
+        self._writer = self._new_writer(self._schema)
+        self._buffer = {column: [] for column in self.columns}
+    
+    def write_row(self, row: Dict):
+        for column, values in self._buffer.items():
+            values.append(_cell_value(row.get(column), column))
+        self.rows_written += 1
+        
+        if self.rows_written % self.batch_rows == 0:
+            self._flush()
+    
+    def close(self):
+        self._flush()
+        self._writer.close()
+        self._writer = None
+        logger.info(f"Successfully exported {self.rows_written} rows to {self.output_path}")
+    
+    def export_frame(self, df: pd.DataFrame) -> str:
+        pa = _require_pyarrow()
+        self.open(list(df.columns))
+        
+        # Converted column by column, with the same schema as streamed rows
+        table = pa.Table.from_pandas(_typed_frame(df), schema=self._schema, preserve_index=False)
+        self._writer.write_table(table.replace_schema_metadata(None))
+        self.rows_written = len(df)
+        
+        self.close()
+        return self.output_path
+    
+    def _flush(self):
+        """Write the buffered rows as one record batch"""
+        import pyarrow as pa
+        
+        if self._buffer and self._buffer[self.columns[0]]:
+            self._writer.write_batch(pa.RecordBatch.from_pydict(self._buffer, schema=self._schema))
+            self._buffer = {column: [] for column in self.columns}
+    
+    def _arrow_type(self, pa, column: str):
+        """Arrow type of a result column"""
+        if column in INTEGER_COLUMNS:
+            return pa.int64()
+        if column in FLOAT_COLUMNS:
+            return pa.float64()
+        return pa.string()
+    
+    @abstractmethod
+    def _new_writer(self, schema):
+        """Open the format's batch writer"""
+
+
+class ParquetExporter(_ArrowBatchExporter):
+    """Writes results as a Parquet file (one row group per batch when streaming)"""
+    
+    def _new_writer(self, schema):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.output_path, schema)
+
+
+class ArrowExporter(_ArrowBatchExporter):
+    """Writes results as an Arrow IPC (Feather v2) file"""
+    
+    def _new_writer(self, schema):
+        import pyarrow as pa
+        return pa.ipc.new_file(self.output_path, schema)
+
+
+class NdjsonExporter(RowExporter):
+    """Writes one JSON object per line, to a file or (path '-') standard output"""
+    
+    def open(self, columns: List[str]):
+        super().open(columns)
+        self._to_stdout = self.output_path == STDOUT
+        self._file = sys.stdout if self._to_stdout else open(self.output_path, 'w', encoding='utf-8')
+    
+    def write_row(self, row: Dict):
+        record = {column: _cell_value(row.get(column), column) for column in self.columns}
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.rows_written += 1
+        
+        # Hand each row on immediately when piping
+        if self._to_stdout:
+            self._file.flush()
+    
+    def close(self):
+        if not self._to_stdout:
+            self._file.close()
+        logger.info(f"Successfully exported {self.rows_written} rows to {self.output_path}")
+
+
+class CsvExporter(RowExporter):
+    """Writes results as a plain CSV file"""
+    
+    def open(self, columns: List[str]):
+        super().open(columns)
+        self._file = open(self.output_path, 'w', encoding='utf-8', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+    
+    def write_row(self, row: Dict):
+        self._writer.writerow([_cell_value(row.get(column), column) for column in self.columns])
+        self.rows_written += 1
+    
+    def close(self):
+        self._file.close()
+        logger.info(f"Successfully exported {self.rows_written} rows to {self.output_path}")
+    
+    def export_frame(self, df: pd.DataFrame) -> str:
+        _typed_frame(df).to_csv(self.output_path, index=False)
+        logger.info(f"Successfully exported {len(df)} rows to {self.output_path}")
+        return self.output_path
+
+
+# Exporter class and file extension by --format name
+EXPORTERS = {
+    'xlsx': (ExcelExporter, '.xlsx'),
+    'parquet': (ParquetExporter, '.parquet'),
+    'arrow': (ArrowExporter, '.arrow'),
+    'ndjson': (NdjsonExporter, '.ndjson'),
+    'csv': (CsvExporter, '.csv')
+}
+EXPORT_FORMATS = list(EXPORTERS)
+
+
+def create_exporters(formats: List[str], output_path: Optional[str] = None) -> List:
+    """
+    Create one exporter per output format
+    
+    Each format is written next to the others under the same base name, with
+    its own extension (an output path that already has the format's extension
+    is used as is). '-' streams NDJSON to standard output.
+    
+    Args:
+        formats (List[str]): Format names from EXPORT_FORMATS
+        output_path (str, optional): Output path or base name. Timestamped if not provided
+    
+    Returns:
+        List: Exporters, in the order of formats
+    """
+    unknown = [fmt for fmt in formats if fmt not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown output format(s) {unknown}. Choose from {EXPORT_FORMATS}")
+    
+    if output_path == STDOUT:
+        if list(formats) != ['ndjson']:
+            raise ValueError("Only ndjson output can be streamed to standard output ('-')")
+        return [NdjsonExporter(STDOUT)]
+    
+    if output_path:
+        base = output_path
+        for _, extension in EXPORTERS.values():
+            if output_path.lower().endswith(extension):
+                base = output_path[:-len(extension)]
+                break
+    else:
+        base = f"manufacturer_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
+    exporters = []
+    for fmt in dict.fromkeys(formats):
+        exporter_class, extension = EXPORTERS[fmt]
+        exporters.append(exporter_class(output_path=base + extension))
+    return exporters
+
+
+def write_rows(exporters: List, rows: Iterable[Dict], columns: Optional[List[str]] = None,
+               tracer: Optional[NullTracer] = None) -> List[str]:
+    """
+    Stream result rows into several exporters in a single pass
+    
+    Args:
+        exporters (List): Exporters implementing open / write_row / close
+        rows (Iterable[Dict]): Result rows (e.g. from ManufacturerFinder.find_manufacturers_iter)
+        columns (List[str], optional): Column order. Defaults to the first row's input
+            columns followed by the result and error columns
+        tracer (Tracer, optional): Times opening, each row's writes and closing as
+            'export' spans, leaving out the time spent waiting for rows
+    
+    Returns:
+        List[str]: Paths of the exported files
+    """
+    tracer = tracer or NullTracer()
+    rows = iter(rows)
+    first = next(rows, None)
+    if columns is None:
+        columns = stream_columns(first)
+    
+    with tracer.span('export', step='open'):
+        for exporter in exporters:
+            exporter.open(columns)
+    
+    if first is not None:
+        for row in itertools.chain([first], rows):
+            with tracer.span('export', row=row.get('ID')):
+                for exporter in exporters:
+                    exporter.write_row(row)
+    
+    with tracer.span('export', step='close'):
+        for exporter in exporters:
+            exporter.close()
+    return [exporter.output_path for exporter in exporters]
@@ -0,0 +1,280 @@
+"""
+Instrumentation Module
+Records latency, token usage, retries and outcome of every OpenAI request, and
+reports run-level percentiles, throughput and estimated spend as JSON or
+Prometheus text
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import numpy as np
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# USD per million (prompt, completion) tokens, for the spend estimate
+MODEL_PRICING = {
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'gpt-4-turbo': (10.00, 30.00),
+    'gpt-3.5-turbo': (0.50, 1.50)
+}
+
+# Latency quantiles reported
+QUANTILES = [0.5, 0.95, 0.99]
+
+# Prefix of every Prometheus metric name
+METRIC_PREFIX = 'manufacturer_finder'
+
+# Status recorded for a successful request
+STATUS_OK = 'ok'
+
+
+@dataclass
+class CallRecord:
+    """One API request, including all of its retries"""
+    
+    kind: str
+    started_at: float
+    latency: float
+    retries: int
+    status: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost: float = 0.0
+
+
+class NullRecorder:
+    """Recorder that keeps nothing; the finder skips all timing when it is used"""
+    
+    enabled = False
+    
+    def record_call(self, kind: str, started_at: float, latency: float, retries: int,
+                    usage=None, error: Optional[Exception] = None):
+        """Ignore a request"""
+    
+    def record_cache_hit(self):
+        """Ignore a cache hit"""
+
+
+class RunRecorder(NullRecorder):
+    """
+    Collects one CallRecord per API request of a run (thread-safe)
+    
+    The finder's worker threads call record_call() as requests finish;
+    summary() turns the records into run-level statistics.
+    """
+    
+    enabled = True
+    
+    def __init__(self, model: str, pricing: Optional[Dict[str, tuple]] = None):
+        """
+        Initialize RunRecorder
+        
+        Args:
+            model (str): Model the requests go to, for the spend estimate
+            pricing (Dict[str, tuple], optional): USD per million (prompt, completion) tokens
+                by model. Defaults to MODEL_PRICING
+        """
+        self.model = model
+        prices = (pricing or MODEL_PRICING).get(model)
+        if prices is None:
+            logger.warning(f"No pricing known for {model}; spend will be reported as 0")
+            prices = (0.0, 0.0)
+        self.prompt_price, self.completion_price = prices
+        
+        self.records: List[CallRecord] = []
+        self.cache_hits = 0
+        self.run_started_at = time.time()
+        self._lock = threading.Lock()
+    
+    def record_call(self, kind: str, started_at: float, latency: float, retries: int,
+                    usage=None, error: Optional[Exception] = None):
+        """
+        Record one finished request
+        
+        Args:
+            kind (str): 'single' or 'packed'
+            started_at (float): Wall-clock start time (time.time())
+            latency (float): Seconds from the first attempt to the response or final error
+            retries (int): Attempts made after the first
+            usage: The response's usage object (prompt_tokens / completion_tokens), if any
+            error (Exception, optional): Error the request finally failed with
+        """
+        prompt_tokens = int(getattr(usage, 'prompt_tokens', 0) or 0)
+        completion_tokens = int(getattr(usage, 'completion_tokens', 0) or 0)
+        cost = (prompt_tokens * self.prompt_price + completion_tokens * self.completion_price) / 1_000_000
+        
+        record = CallRecord(
+            kind=kind,
+            started_at=started_at,
+            latency=latency,
+            retries=retries,
+            status=STATUS_OK if error is None else type(error).__name__,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost
+        )
+        with self._lock:
+            self.records.append(record)
+    
+    def record_cache_hit(self):
+        """Count a part answered from the response cache"""
+        with self._lock:
+            self.cache_hits += 1
+    
+    def summary(self) -> Dict:
+        """
+        Aggregate the records into run-level statistics
+        
+        Returns:
+            Dict: Request counts by status, latency quantiles, token totals,
+                throughput and estimated spend
+        """
+        with self._lock:
+            records = list(self.records)
+            cache_hits = self.cache_hits
+        
+        latencies = np.array([r.latency for r in records], dtype=float)
+        statuses = {}
+        for r in records:
+            statuses[r.status] = statuses.get(r.status, 0) + 1
+        
+        prompt_tokens = sum(r.prompt_tokens for r in records)
+        completion_tokens = sum(r.completion_tokens for r in records)
+        
+        # Throughput over the span the requests were actually running
+        if records:
+            span = max(r.started_at + r.latency for r in records) - min(r.started_at for r in records)
+        else:
+            span = 0.0
+        
+        return {
+            'model': self.model,
+            'run_started_at': datetime.fromtimestamp(self.run_started_at).isoformat(timespec='seconds'),
+            'run_seconds': round(time.time() - self.run_started_at, 3),
+            'requests': len(records),
+            'requests_by_status': statuses,
+            'requests_by_kind': {kind: sum(1 for r in records if r.kind == kind)
+                                 for kind in sorted({r.kind for r in records})},
+            'retries': sum(r.retries for r in records),
+            'cache_hits': cache_hits,
+            'latency_seconds': {
+                **{f'p{round(q * 100)}': (round(float(np.quantile(latencies, q)), 4) if len(latencies) else None)
+                   for q in QUANTILES},
+                'mean': round(float(latencies.mean()), 4) if len(latencies) else None,
+                'max': round(float(latencies.max()), 4) if len(latencies) else None,
+                'sum': round(float(latencies.sum()), 4)
+            },
+            'tokens': {
+                'prompt': prompt_tokens,
+                'completion': completion_tokens,
+                'total': prompt_tokens + completion_tokens
+            },
+            'throughput': {
+                'requests_per_second': round(len(records) / span, 3) if span > 0 else None,
+                'tokens_per_second': round((prompt_tokens + completion_tokens) / span, 1) if span > 0 else None
+            },
+            'estimated_cost_usd': round(sum(r.cost for r in records), 6)
+        }
+    
+    def write_json(self, path: str, include_calls: bool = False) -> str:
+        """
+        Write the run report as JSON
+        
+        Args:
+            path (str): Output file
+            include_calls (bool): Also include every request's record
+        
+        Returns:
+            str: The path written
+        """
+        report = self.summary()
+        if include_calls:
+            with self._lock:
+                report['calls'] = [asdict(r) for r in self.records]
+        
+        _write_atomic(path, json.dumps(report, indent=2))
+        logger.info(f"Run report written to {path}")
+        return path
+    
+    def write_prometheus(self, path: str) -> str:
+        """
+        Write the run statistics in the Prometheus text exposition format
+        
+        The file is replaced atomically, so it can be picked up by the node
+        exporter's textfile collector.
+        
+        Args:
+            path (str): Output file (conventionally *.prom)
+        
+        Returns:
+            str: The path written
+        """
+        summary = self.summary()
+        latency = summary['latency_seconds']
+        lines = []
+        
+        def metric(name: str, metric_type: str, help_text: str, samples: List[tuple]):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{_label(val)}"' for key, val in [('model', summary['model'])] + labels)
+                lines.append(f"{METRIC_PREFIX}_{name}{suffix}{{{label_text}}} {_number(value)}")
+        
+        metric('requests_total', 'counter', 'OpenAI requests by final status',
+               [('', [('status', status)], count) for status, count in sorted(summary['requests_by_status'].items())]
+               or [('', [('status', STATUS_OK)], 0)])
+        metric('retries_total', 'counter', 'Retried OpenAI request attempts',
+               [('', [], summary['retries'])])
+        metric('cache_hits_total', 'counter', 'Parts answered from the response cache',
+               [('', [], summary['cache_hits'])])
+        metric('request_latency_seconds', 'summary', 'OpenAI request latency including retries',
+               [('', [('quantile', str(q))], latency[f'p{round(q * 100)}']) for q in QUANTILES] +
+               [('_sum', [], latency['sum']), ('_count', [], summary['requests'])])
+        metric('tokens_total', 'counter', 'Tokens used by type',
+               [('', [('type', kind)], summary['tokens'][kind]) for kind in ('prompt', 'completion')])
+        metric('estimated_cost_usd', 'gauge', 'Estimated spend of the run in USD',
+               [('', [], summary['estimated_cost_usd'])])
+        metric('run_duration_seconds', 'gauge', 'Wall time of the run so far',
+               [('', [], summary['run_seconds'])])
+        
+        _write_atomic(path, '\n'.join(lines) + '\n')
+        logger.info(f"Prometheus metrics written to {path}")
+        return path
+    
+    def log_summary(self):
+        """Log a one-line digest of the run's requests"""
+        summary = self.summary()
+        latency = summary['latency_seconds']
+        logger.info(
+            f"API requests: {summary['requests']} ({summary['retries']} retries, "
+            f"{summary['cache_hits']} cache hits), latency p50/p95/p99: "
+            f"{latency['p50']}/{latency['p95']}/{latency['p99']}s, "
+            f"tokens: {summary['tokens']['total']}, est. cost: ${summary['estimated_cost_usd']:.4f}"
+        )
+
+
+def _label(value) -> str:
+    """Escape a Prometheus label value"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    """Format a Prometheus sample value (NaN when there is no data)"""
+    return 'NaN' if value is None else repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _write_atomic(path: str, text: str):
+    """Write a file via a temporary file and rename, so readers never see it half-written"""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
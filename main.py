@@ -5,12 +5,26 @@ Orchestrates the complete workflow
 
 import os
 import sys
+import numbers
 import logging
 import argparse
+import itertools
+from collections import deque
 from pathlib import Path
-from data_loader import DataLoader
-from manufacturer_finder import ManufacturerFinder
-from excel_exporter import ExcelExporter
+from typing import Dict, Iterable, Iterator, List
+import pandas as pd
+from data_loader import DataLoader, REQUIRED_COLUMNS
+from multi_loader import is_multi_input, resolve_inputs, load_many, iter_many_chunks
+from manufacturer_finder import ManufacturerFinder, DEFAULT_CONCURRENCY, MODEL
+from instrumentation import RunRecorder
+from analysis_results import ERROR_MARKER
+from tracing import Tracer, profiled
+from exporters import create_exporters, write_rows, EXPORT_FORMATS, STDOUT
+from rate_limiter import RateLimiter
+from checkpoint import CheckpointJournal, journal_path_for
+from batch_runner import BatchRunner, DEFAULT_POLL_INTERVAL
+from openai import OpenAI
+from response_cache import ResponseCache, DEFAULT_CACHE_PATH, DEFAULT_TTL_DAYS, DEFAULT_MAX_SIZE_MB
 
 # Set up logging
 logging.basicConfig(
@@ -23,29 +37,147 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Journal location when results are streamed to standard output
+STDOUT_JOURNAL = journal_path_for('stdout.ndjson')
+
+class SummaryStats:
+    """Running totals for the analysis summary, collected while rows are exported"""
+    
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.scored = 0
+        self.score_sum = 0.0
+        self.high = 0
+        self.medium = 0
+        self.low = 0
+    
+    def track(self, rows: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Pass rows through unchanged, counting each one
+        
+        Args:
+            rows (Iterable[Dict]): Result rows
+            
+        Yields:
+            Dict: The same rows
+        """
+        for row in rows:
+            self.add(row)
+            yield row
+    
+    def add(self, row: Dict):
+        """
+        Count one result row
+        
+        Args:
+            row (Dict): Result row; failed rows have no Avg_Credibility_Score
+        """
+        self.total += 1
+        if row.get('Manufacturers') == ERROR_MARKER:
+            self.failed += 1
+        
+        score = row.get('Avg_Credibility_Score')
+        if not isinstance(score, numbers.Real) or score != score:
+            return
+        
+        self.scored += 1
+        self.score_sum += score
+        if score >= 80:
+            self.high += 1
+        elif score >= 60:
+            self.medium += 1
+        else:
+            self.low += 1
+
+
 class ManufacturerFinderApp:
     """Main application orchestrator"""
     
-    def __init__(self, excel_path: str, api_key: str = None, output_path: str = None):
+    def __init__(self, excel_path: str, api_key: str = None, output_path: str = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, requests_per_minute: int = None,
+                 tokens_per_minute: int = None, cache: ResponseCache = None, dedupe: bool = True,
+                 dedupe_on_description: bool = False, pack_size: int = 1, batch_mode: bool = False,
+                 batch_base_url: str = None, batch_poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 resume: bool = False, journal_path: str = None, chunk_rows: int = None,
+                 workers: int = None, formats: List[str] = None, metrics_json: str = None,
+                 metrics_prom: str = None, profile_path: str = None, trace_path: str = None):
         """
         Initialize the application
         
         Args:
-            excel_path (str): Path to input Excel file
+            excel_path (str): Path to input file (.xlsx, .xls, .csv, .tsv or .parquet), or a
+                directory or glob pattern to load every sheet of every matching file
             api_key (str, optional): OpenAI API key
-            output_path (str, optional): Output Excel file path
+            output_path (str, optional): Output file path, or base name when writing several
+                formats. '-' streams NDJSON to standard output
+            concurrency (int): Maximum number of API requests in flight at once
+            requests_per_minute (int, optional): Account RPM limit to stay under
+            tokens_per_minute (int, optional): Account TPM limit to stay under
+            cache (ResponseCache, optional): Persistent response cache
+            dedupe (bool): Query each unique MPN once and fan the result out to its rows
+            dedupe_on_description (bool): Only share results between rows whose descriptions also match
+            pack_size (int): Maximum number of parts analysed per API request
+            batch_mode (bool): Submit all parts as one offline Batch API job
+            batch_base_url (str, optional): Alternative API base URL for the batch endpoints
+            batch_poll_interval (float): Seconds between batch status checks
+            resume (bool): Skip rows already recorded in the checkpoint journal
+            journal_path (str, optional): Checkpoint journal path. Defaults to next to the output file
+            chunk_rows (int, optional): Stream the input in chunks of this many rows, querying and
+                exporting as they are parsed. The whole file is loaded first if not provided
+            workers (int, optional): Processes used to parse several input files. Defaults to the CPU count
+            formats (List[str], optional): Output formats from EXPORT_FORMATS. Defaults to ['xlsx']
+            metrics_json (str, optional): Write a JSON run report of API latency, tokens,
+                retries and estimated spend here
+            metrics_prom (str, optional): Write the same statistics here in Prometheus text format
+            profile_path (str, optional): Write a cProfile dump of the run here
+            trace_path (str, optional): Write a Chrome trace (JSON) of the run's stages and
+                API requests here
         """
         self.excel_path = excel_path
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.output_path = output_path
+        self.concurrency = concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.cache = cache
+        self.dedupe = dedupe
+        self.dedupe_on_description = dedupe_on_description
+        self.pack_size = pack_size
+        self.batch_mode = batch_mode
+        self.batch_base_url = batch_base_url
+        self.batch_poll_interval = batch_poll_interval
+        self.resume = resume
+        self.journal_path = journal_path
+        self.chunk_rows = chunk_rows
+        self.workers = workers
+        self.input_paths = resolve_inputs(excel_path)
+        self.formats = formats or ['xlsx']
+        self.exporters = create_exporters(self.formats, output_path)
+        self.metrics_json = metrics_json
+        self.metrics_prom = metrics_prom
+        
+        # API requests are only timed and counted when a report is wanted
+        self.recorder = RunRecorder(MODEL) if (metrics_json or metrics_prom) else None
+        
+        # Stages are always timed; individual requests only when a trace is written
+        self.profile_path = profile_path
+        self.trace_path = trace_path
+        self.tracer = Tracer()
         
         # Validate inputs
-        if not os.path.exists(excel_path):
-            raise FileNotFoundError(f"Excel file not found: {excel_path}")
+        if not self.input_paths:
+            raise FileNotFoundError(f"Input file not found: {excel_path}")
         
         if not self.api_key:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY environment variable or provide via --api-key")
         
+        if resume and not (output_path or journal_path):
+            raise ValueError("Resuming requires the output path (--output) or journal path (--journal) of the interrupted run")
+        
+        if chunk_rows and batch_mode:
+            raise ValueError("Chunked input (--chunk-rows) cannot be combined with --batch-mode, which submits every part at once")
+        
         logger.info(f"Initialized ManufacturerFinderApp with input: {excel_path}")
     
     def run(self, max_manufacturers: int = 5) -> str:
@@ -56,39 +188,23 @@ class ManufacturerFinderApp:
             max_manufacturers (int): Maximum manufacturers to find per item
             
         Returns:
-            str: Path to output Excel file
+            str: Output file path(s), comma-separated
         """
         try:
             logger.info("="*80)
             logger.info("STARTING MANUFACTURER FINDER ANALYSIS")
             logger.info("="*80)
             
-            # Step 1: Load data
-            logger.info("\n[STEP 1/3] Loading Excel data...")
-            loader = DataLoader(self.excel_path)
-            df = loader.load_excel()
-            
-            if not loader.validate_data(df):
-                raise ValueError("Data validation failed. Check Excel file format.")
-            
-            logger.info(f"✓ Loaded {len(df)} items from Excel")
-            
-            # Step 2: Find manufacturers
-            logger.info("\n[STEP 2/3] Finding credible manufacturers using OpenAI...")
-            finder = ManufacturerFinder(api_key=self.api_key)
-            results_df = finder.find_manufacturers(df, max_manufacturers=max_manufacturers)
-            
-            logger.info(f"✓ Analyzed {len(results_df)} items")
-            
-            # Step 3: Export results
-            logger.info("\n[STEP 3/3] Exporting results to Excel...")
-            exporter = ExcelExporter(output_path=self.output_path)
-            output_file = exporter.create_summary_sheet(results_df)
+            with profiled(self.profile_path):
+                if self.chunk_rows:
+                    output_files, stats = self._run_chunked(max_manufacturers)
+                else:
+                    output_files, stats = self._run_loaded(max_manufacturers)
             
-            logger.info(f"✓ Results exported to: {output_file}")
+            output_file = ', '.join(output_files)
             
             # Print summary
-            self._print_summary(results_df, output_file)
+            self._print_summary(stats, output_file)
             
             logger.info("\n" + "="*80)
             logger.info("ANALYSIS COMPLETED SUCCESSFULLY")
@@ -99,25 +215,343 @@ class ManufacturerFinderApp:
         except Exception as e:
             logger.error(f"Error during analysis: {str(e)}", exc_info=True)
             raise
+        
+        finally:
+            # Reports are written for failed runs too
+            self._write_metrics()
+            self._write_trace()
+    
+    def _run_loaded(self, max_manufacturers: int):
+        """
+        Load the whole input, then analyse it and export rows as they complete
+        
+        Result rows go from the query engine and the journal straight into the
+        exporters, so they are never collected in a list or DataFrame.
+        
+        Args:
+            max_manufacturers (int): Maximum manufacturers to find per item
+            
+        Returns:
+            Tuple of (output file path, SummaryStats)
+        """
+        # Step 1: Load data
+        loader = DataLoader(self.excel_path, tracer=self.tracer)
+        with self.tracer.span('load', files=len(self.input_paths)):
+            if is_multi_input(self.excel_path):
+                logger.info(f"\n[STEP 1/3] Loading {len(self.input_paths)} input files...")
+                df = load_many(self.input_paths, workers=self.workers, tracer=self.tracer)
+            else:
+                logger.info("\n[STEP 1/3] Loading input data...")
+                df = loader.load()
+        
+        with self.tracer.span('validate', rows=len(df)):
+            valid = loader.validate_data(df)
+        if not valid:
+            raise ValueError("Data validation failed. Check input file format.")
+        
+        logger.info(f"✓ Loaded {len(df)} items from {len(self.input_paths)} input file(s)")
+        
+        # Steps 2 and 3 overlap: each row is exported as soon as it is analysed
+        logger.info("\n[STEP 2/3] Finding credible manufacturers using OpenAI...")
+        logger.info(f"\n[STEP 3/3] Exporting results ({', '.join(self.formats)}) as they complete...")
+        journal = CheckpointJournal(self._journal_path(), resume=self.resume)
+        
+        try:
+            finder = self._create_finder()
+            completed = self._load_completed(journal, df, finder) if self.resume else {}
+            pending_df = df[~df['ID'].isin(completed)] if completed else df
+            stats = SummaryStats()
+            
+            def new_rows():
+                if self.batch_mode:
+                    # The batch job answers every part at once; its rows are journaled before export
+                    client = OpenAI(api_key=self.api_key, base_url=self.batch_base_url) if self.batch_base_url else None
+                    runner = BatchRunner(finder, client=client, poll_interval=self.batch_poll_interval)
+                    results = []
+                    
+                    def record(row):
+                        journal.append(row)
+                        results.append(row)
+                    
+                    runner.run(
+                        pending_df,
+                        max_manufacturers=max_manufacturers,
+                        dedupe=self.dedupe,
+                        dedupe_on_description=self.dedupe_on_description,
+                        on_result=record
+                    )
+                    yield from results
+                    return
+                
+                # Rows are journaled as soon as they complete and kept in input order
+                progress_step = max(len(pending_df) // 20, 1)
+                results = finder.find_manufacturers_iter(
+                    pending_df,
+                    max_manufacturers=max_manufacturers,
+                    dedupe=self.dedupe,
+                    dedupe_on_description=self.dedupe_on_description,
+                    ordered=True
+                )
+                for count, result_row in enumerate(results, 1):
+                    journal.append(result_row)
+                    yield result_row
+                    if count % progress_step == 0:
+                        logger.info(f"Completed {count}/{len(pending_df)} rows")
+            
+            def result_rows():
+                # Put resumed and new rows back together in input order
+                analysed = new_rows()
+                for row_id in df['ID']:
+                    yield completed[row_id] if row_id in completed else next(analysed)
+            
+            with self.tracer.span('query', exports=','.join(self.formats)):
+                output_files = write_rows(self.exporters, stats.track(result_rows()), tracer=self.tracer)
+            self._finish_journal(journal, stats)
+        finally:
+            journal.close()
+        
+        logger.info(f"✓ Analyzed {stats.total} items")
+        if self.cache is not None:
+            logger.info(f"Cache hits: {self.cache.hits}, misses: {self.cache.misses}")
+        logger.info(f"✓ Results exported to: {', '.join(output_files)}")
+        
+        return output_files, stats
+    
+    def _run_chunked(self, max_manufacturers: int):
+        """
+        Stream the input in chunks, analysing and exporting rows as they are parsed
+        
+        Memory stays bounded by a few chunks: rows go from the loader through
+        the query engine and the journal straight into the workbook.
+        
+        Args:
+            max_manufacturers (int): Maximum manufacturers to find per item
+            
+        Returns:
+            Tuple of (output file path, SummaryStats)
+        """
+        logger.info(f"\n[STEP 1/3] Streaming input data in chunks of {self.chunk_rows} rows...")
+        loader = DataLoader(self.excel_path, tracer=self.tracer)
+        journal = CheckpointJournal(self._journal_path(), resume=self.resume)
+        
+        try:
+            journal_rows = journal.load() if self.resume else {}
+            finder = self._create_finder()
+            journal_parts = self._journaled_parts(journal_rows, finder)
+            stats = SummaryStats()
+            
+            # Rows finished by an interrupted run, queued in input order until their turn
+            resumed = deque()
+            
+            def pending_chunks():
+                if is_multi_input(self.excel_path):
+                    chunks = iter_many_chunks(self.input_paths, self.chunk_rows, tracer=self.tracer)
+                else:
+                    chunks = loader.iter_chunks(self.chunk_rows)
+                
+                # Each chunk's parse and clean is timed as it is pulled, then validated
+                for number in itertools.count(1):
+                    with self.tracer.span('load', chunk=number):
+                        chunk = next(chunks, None)
+                    if chunk is None:
+                        if number > 1:
+                            break
+                        # An input without rows fails validation, as in the loaded path
+                        chunk = pd.DataFrame(columns=['ID'] + REQUIRED_COLUMNS)
+                    
+                    with self.tracer.span('validate', chunk=number, rows=len(chunk)):
+                        valid = loader.validate_data(chunk)
+                    if not valid:
+                        raise ValueError("Data validation failed. Check input file format.")
+                    
+                    completed = self._match_completed(journal_rows, chunk, finder, journal_parts) if journal_rows else {}
+                    resumed.extend(completed[row_id] for row_id in chunk['ID'] if row_id in completed)
+                    pending = chunk[~chunk['ID'].isin(completed)] if completed else chunk
+                    if len(pending):
+                        yield pending
+            
+            def result_rows():
+                results = finder.find_manufacturers_chunks(
+                    pending_chunks(),
+                    max_manufacturers=max_manufacturers,
+                    dedupe=self.dedupe,
+                    dedupe_on_description=self.dedupe_on_description,
+                    ordered=True
+                )
+                for count, result_row in enumerate(results, 1):
+                    journal.append(result_row)
+                    while resumed and resumed[0]['ID'] < result_row['ID']:
+                        yield resumed.popleft()
+                    yield result_row
+                    if count % self.chunk_rows == 0:
+                        logger.info(f"Completed {count} rows")
+                while resumed:
+                    yield resumed.popleft()
+            
+            # Steps 2 and 3 overlap: each row is exported as soon as it is analysed
+            logger.info("\n[STEP 2/3] Finding credible manufacturers using OpenAI...")
+            logger.info(f"\n[STEP 3/3] Exporting results ({', '.join(self.formats)}) as they complete...")
+            with self.tracer.span('query', exports=','.join(self.formats)):
+                output_files = write_rows(self.exporters, stats.track(result_rows()), tracer=self.tracer)
+            self._finish_journal(journal, stats)
+        finally:
+            journal.close()
+        
+        logger.info(f"✓ Analyzed {stats.total} items")
+        if self.cache is not None:
+            logger.info(f"Cache hits: {self.cache.hits}, misses: {self.cache.misses}")
+        logger.info(f"✓ Results exported to: {', '.join(output_files)}")
+        
+        return output_files, stats
+    
+    def _write_metrics(self):
+        """Write the JSON and Prometheus reports of this run's API requests, if requested"""
+        if self.recorder is None:
+            return
+        
+        try:
+            self.recorder.log_summary()
+            if self.metrics_json:
+                self.recorder.write_json(self.metrics_json)
+            if self.metrics_prom:
+                self.recorder.write_prometheus(self.metrics_prom)
+        except OSError as e:
+            logger.error(f"Could not write metrics: {str(e)}")
+    
+    def _write_trace(self):
+        """Log the stage timings and write the Chrome trace, if requested"""
+        self.tracer.log_summary()
+        if not self.trace_path:
+            return
+        
+        try:
+            self.tracer.write(self.trace_path)
+        except OSError as e:
+            logger.error(f"Could not write trace: {str(e)}")
+    
+    def _journal_path(self) -> str:
+        """Checkpoint journal path: --journal, or next to the first output file"""
+        if self.journal_path:
+            return self.journal_path
+        if self.output_path == STDOUT:
+            return STDOUT_JOURNAL
+        return journal_path_for(self.exporters[0].output_path)
+    
+    def _finish_journal(self, journal: CheckpointJournal, stats: SummaryStats):
+        """
+        Remove the journal of a completed run, or keep it if rows failed
+        
+        Args:
+            journal (CheckpointJournal): This run's checkpoint journal
+            stats (SummaryStats): Totals of the exported rows
+        """
+        if stats.failed:
+            logger.warning(f"{stats.failed} rows failed; checkpoint journal kept at {journal.path} "
+                           f"(rerun with --resume to retry only those rows)")
+        else:
+            journal.remove()
+    
+    def _create_finder(self) -> ManufacturerFinder:
+        """Build the ManufacturerFinder with this run's rate limits, cache and packing"""
+        rate_limiter = RateLimiter(
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute
+        )
+        return ManufacturerFinder(
+            api_key=self.api_key,
+            concurrency=self.concurrency,
+            rate_limiter=rate_limiter,
+            cache=self.cache,
+            pack_size=self.pack_size,
+            recorder=self.recorder,
+            tracer=self.tracer if self.trace_path else None
+        )
+    
+    def _load_completed(self, journal: CheckpointJournal, df, finder: ManufacturerFinder) -> dict:
+        """
+        Load rows finished by a previous run that still match the input file
+        
+        Args:
+            journal (CheckpointJournal): Checkpoint journal of the interrupted run
+            df (pd.DataFrame): Loaded input data
+            finder (ManufacturerFinder): Finder whose part keys decide which rows share an analysis
+            
+        Returns:
+            dict: Completed result rows by ID
+        """
+        journal_rows = journal.load()
+        completed = self._match_completed(journal_rows, df, finder, self._journaled_parts(journal_rows, finder))
+        
+        logger.info(f"Resuming: {len(completed)} of {len(df)} rows already completed or analysed")
+        return completed
+    
+    def _journaled_parts(self, journal_rows: dict, finder: ManufacturerFinder) -> dict:
+        """
+        Index the journal's successful results by part key (empty without deduplication)
+        
+        Args:
+            journal_rows (dict): Rows loaded from the checkpoint journal, by ID
+            finder (ManufacturerFinder): Finder whose part keys decide which rows share an analysis
+            
+        Returns:
+            dict: First successful journaled row of each part, by part key
+        """
+        parts = {}
+        if not self.dedupe:
+            return parts
+        
+        for row in journal_rows.values():
+            if row.get('Manufacturers') != ERROR_MARKER:
+                parts.setdefault(finder.part_key(row, self.dedupe_on_description), row)
+        return parts
+    
+    def _match_completed(self, journal_rows: dict, df, finder: ManufacturerFinder, journal_parts: dict) -> dict:
+        """
+        Pick the input rows a resumed run does not need to query
+        
+        Journaled rows whose ID and MPN still match the input are reused. Other
+        rows whose part was already analysed get that analysis, just as
+        deduplication shares one result across rows. Rows that failed are left
+        out, so a resumed run queries them again.
+        
+        Args:
+            journal_rows (dict): Rows loaded from the checkpoint journal, by ID
+            df (pd.DataFrame): Input data (or one chunk of it)
+            finder (ManufacturerFinder): Finder whose part keys decide which rows share an analysis
+            journal_parts (dict): Successful journaled rows by part key, from _journaled_parts
+            
+        Returns:
+            dict: Completed result rows by ID
+        """
+        completed = {}
+        for position, (row_id, mpn) in enumerate(zip(df['ID'], df['MPN'])):
+            row = journal_rows.get(row_id)
+            if row is not None and row.get('Manufacturers') != ERROR_MARKER and str(row.get('MPN')) == str(mpn):
+                completed[row_id] = row
+                continue
+            
+            if journal_parts:
+                input_row = df.iloc[position]
+                analysed = journal_parts.get(finder.part_key(input_row, self.dedupe_on_description))
+                if analysed is not None:
+                    result_row = input_row.to_dict()
+                    result_row.update((column, value) for column, value in analysed.items() if column not in result_row)
+                    completed[row_id] = result_row
+        return completed
     
-    def _print_summary(self, df, output_file):
+    def _print_summary(self, stats: SummaryStats, output_file):
         """Print analysis summary"""
         logger.info("\n" + "="*80)
         logger.info("ANALYSIS SUMMARY")
         logger.info("="*80)
-        logger.info(f"Total items analyzed: {len(df)}")
+        logger.info(f"Total items analyzed: {stats.total}")
         
-        if 'Avg_Credibility_Score' in df.columns:
-            avg_score = df['Avg_Credibility_Score'].mean()
-            logger.info(f"Average credibility score: {avg_score:.2f}")
-            
-            high_credibility = len(df[df['Avg_Credibility_Score'] >= 80])
-            medium_credibility = len(df[(df['Avg_Credibility_Score'] >= 60) & (df['Avg_Credibility_Score'] < 80)])
-            low_credibility = len(df[df['Avg_Credibility_Score'] < 60])
+        if stats.scored:
+            logger.info(f"Average credibility score: {stats.score_sum / stats.scored:.2f}")
             
-            logger.info(f"High credibility (≥80): {high_credibility} items")
-            logger.info(f"Medium credibility (60-79): {medium_credibility} items")
-            logger.info(f"Low credibility (<60): {low_credibility} items")
+            logger.info(f"High credibility (≥80): {stats.high} items")
+            logger.info(f"Medium credibility (60-79): {stats.medium} items")
+            logger.info(f"Low credibility (<60): {stats.low} items")
         
         logger.info(f"\nResults saved to: {output_file}")
 
@@ -137,12 +571,54 @@ Examples:
   
   # Limit number of manufacturers per item
   python main.py input.xlsx --max-manufacturers 3
+  
+  # Run up to 32 API requests in parallel
+  python main.py input.xlsx --concurrency 32
+  
+  # Stay under the account's rate limits
+  python main.py input.xlsx --concurrency 32 --rpm 5000 --tpm 2000000
+  
+  # Ignore cached responses and fetch fresh ones
+  python main.py input.xlsx --refresh-cache
+  
+  # Analyse up to 10 parts per API request
+  python main.py input.xlsx --pack-size 10
+  
+  # Nightly run through the (cheaper, slower) Batch API
+  python main.py input.xlsx --batch-mode
+  
+  # Resume an interrupted run without re-querying finished rows
+  python main.py input.xlsx --output results.xlsx --resume
+  
+  # Read a CSV or Parquet export directly
+  python main.py export.csv
+  python main.py export.parquet
+  
+  # Stream a very large BOM, querying and exporting 5000 rows at a time
+  python main.py input.xlsx --chunk-rows 5000
+  
+  # Parquet and NDJSON for BI jobs, alongside the Excel report
+  python main.py input.xlsx --output results --format xlsx parquet ndjson
+  
+  # Stream NDJSON rows to another program as they complete
+  python main.py input.xlsx --chunk-rows 1000 --format ndjson --output - | jq .Top_Manufacturer
+  
+  # Every sheet of every plant workbook in a directory (or matching a glob), parsed on 8 processes
+  python main.py weekly_boms/ --workers 8
+  python main.py "weekly_boms/**/*.xlsx"
+  
+  # Report API latency percentiles, tokens and estimated spend
+  python main.py input.xlsx --metrics-json run_report.json --metrics-prom manufacturer_finder.prom
+  
+  # Time each stage and request (open run.trace.json in Perfetto or speedscope), and profile the run
+  python main.py input.xlsx --trace-out run.trace.json --profile run.prof
         """
     )
     
     parser.add_argument(
         'excel_file',
-        help='Path to input Excel file with MPN, Model Description, and Quantity'
+        help='Input file (.xlsx, .xls, .csv, .tsv or .parquet) with MPN, Model Description, and Quantity, '
+             'or a directory or quoted glob pattern to load every sheet of every matching file'
     )
     
     parser.add_argument(
@@ -153,7 +629,7 @@ Examples:
     
     parser.add_argument(
         '--output',
-        help='Output Excel file path (auto-generated if not provided)',
+        help="Output file path, or base name for several formats ('-' streams NDJSON to stdout; auto-generated if not provided)",
         default=None
     )
     
@@ -164,23 +640,217 @@ Examples:
         help='Maximum number of manufacturers to find per item (default: 5)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum number of API requests in flight at once (default: {DEFAULT_CONCURRENCY})'
+    )
+    
+    parser.add_argument(
+        '--rpm',
+        type=int,
+        default=None,
+        help='OpenAI requests-per-minute limit to stay under (default: unlimited)'
+    )
+    
+    parser.add_argument(
+        '--tpm',
+        type=int,
+        default=None,
+        help='OpenAI tokens-per-minute limit to stay under (default: unlimited)'
+    )
+    
+    parser.add_argument(
+        '--cache-path',
+        default=DEFAULT_CACHE_PATH,
+        help=f'Response cache database file (default: {DEFAULT_CACHE_PATH})'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl-days',
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help=f'Days before a cached response expires (default: {DEFAULT_TTL_DAYS})'
+    )
+    
+    parser.add_argument(
+        '--cache-max-mb',
+        type=float,
+        default=DEFAULT_MAX_SIZE_MB,
+        help=f'Cache size limit in MB; least recently used entries are evicted (default: {DEFAULT_MAX_SIZE_MB})'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the response cache entirely'
+    )
+    
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Ignore cached responses but store the fresh ones'
+    )
+    
+    parser.add_argument(
+        '--purge-cache',
+        action='store_true',
+        help='Delete every cached response before running'
+    )
+    
+    parser.add_argument(
+        '--no-dedupe',
+        action='store_true',
+        help='Query every row separately, even when MPNs repeat'
+    )
+    
+    parser.add_argument(
+        '--dedupe-description',
+        action='store_true',
+        help='Only share results between repeated MPNs whose descriptions also match'
+    )
+    
+    parser.add_argument(
+        '--pack-size',
+        type=int,
+        default=1,
+        help='Maximum parts analysed per API request; reduced automatically to fit token limits (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--batch-mode',
+        action='store_true',
+        help='Submit all parts as one offline OpenAI Batch API job and wait for the results'
+    )
+    
+    parser.add_argument(
+        '--batch-base-url',
+        default=None,
+        help='Alternative API base URL for batch mode (e.g. a local test server)'
+    )
+    
+    parser.add_argument(
+        '--batch-poll-interval',
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f'Seconds between batch status checks (default: {DEFAULT_POLL_INTERVAL})'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Skip rows, and repeated parts, already analysed in the checkpoint journal of an interrupted run'
+    )
+    
+    parser.add_argument(
+        '--journal',
+        default=None,
+        help='Checkpoint journal path (default: <output>.journal.jsonl; removed once a run completes with no failed rows)'
+    )
+    
+    parser.add_argument(
+        '--chunk-rows',
+        type=int,
+        default=None,
+        help='Stream the input in chunks of this many rows so memory stays bounded (default: load the whole file)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Processes used to parse directory or glob input (default: number of CPUs)'
+    )
+    
+    parser.add_argument(
+        '--format',
+        dest='formats',
+        nargs='+',
+        choices=EXPORT_FORMATS,
+        default=['xlsx'],
+        help='Output format(s); several may be given (default: xlsx)'
+    )
+    
+    parser.add_argument(
+        '--metrics-json',
+        default=None,
+        help='Write a JSON run report of API latency percentiles, tokens, retries and estimated spend'
+    )
+    
+    parser.add_argument(
+        '--metrics-prom',
+        default=None,
+        help='Write the run statistics in Prometheus text format (e.g. for the node exporter textfile collector)'
+    )
+    
+    parser.add_argument(
+        '--trace-out',
+        default=None,
+        help='Write a Chrome trace (JSON) of the load, clean, validate, query and export stages and every '
+             'API request; opens in chrome://tracing, Perfetto or speedscope'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        default=None,
+        help='Write a cProfile dump of the run (inspect with snakeviz or python -m pstats)'
+    )
+    
     args = parser.parse_args()
     
+    if args.no_cache and (args.purge_cache or args.refresh_cache):
+        flag = '--purge-cache' if args.purge_cache else '--refresh-cache'
+        parser.error(f"{flag} cannot be combined with --no-cache, which does not open the cache")
+    
+    # Keep stdout clean for piped NDJSON
+    console = sys.stderr if args.output == STDOUT else sys.stdout
+    
     try:
+        cache = None
+        if not args.no_cache:
+            cache = ResponseCache(
+                path=args.cache_path,
+                ttl_seconds=args.cache_ttl_days * 86400,
+                max_size_bytes=int(args.cache_max_mb * 1024 * 1024),
+                refresh=args.refresh_cache
+            )
+            if args.purge_cache:
+                cache.purge()
+        
         app = ManufacturerFinderApp(
             excel_path=args.excel_file,
             api_key=args.api_key,
-            output_path=args.output
+            output_path=args.output,
+            concurrency=args.concurrency,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            cache=cache,
+            dedupe=not args.no_dedupe,
+            dedupe_on_description=args.dedupe_description,
+            pack_size=args.pack_size,
+            batch_mode=args.batch_mode,
+            batch_base_url=args.batch_base_url,
+            batch_poll_interval=args.batch_poll_interval,
+            resume=args.resume,
+            journal_path=args.journal,
+            chunk_rows=args.chunk_rows,
+            workers=args.workers,
+            formats=args.formats,
+            metrics_json=args.metrics_json,
+            metrics_prom=args.metrics_prom,
+            profile_path=args.profile,
+            trace_path=args.trace_out
         )
         
         output_file = app.run(max_manufacturers=args.max_manufacturers)
         
-        print(f"\n✓ Success! Results saved to: {output_file}")
+        print(f"\n✓ Success! Results saved to: {output_file}", file=console)
         sys.exit(0)
         
     except Exception as e:
         logger.error(f"Application error: {str(e)}")
-        print(f"\n✗ Error: {str(e)}")
+        print(f"\n✗ Error: {str(e)}", file=console)
         sys.exit(1)
 
 
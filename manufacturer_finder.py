@@ -4,10 +4,20 @@ Uses OpenAI API to find credible manufacturers based on MPN and model descriptio
 """
 
 import os
+import queue
 import logging
+import threading
 import pandas as pd
-from typing import List, Dict, Optional
-from openai import OpenAI
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from openai import OpenAI, RateLimitError, APIConnectionError, InternalServerError
+from rate_limiter import RateLimiter, estimate_tokens, parse_retry_after
+from response_cache import ResponseCache, make_cache_key
+from analysis_results import PartAnalysis, manufacturer_table
+from manufacturer_names import ManufacturerCanonicalizer, canonicalize_table
+from instrumentation import NullRecorder
+from tracing import NullTracer
+import hashlib
 import json
 import time
 
@@ -15,70 +25,822 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default number of API requests allowed in flight at once
+DEFAULT_CONCURRENCY = 8
+
+# Default number of retries for rate-limited or failed API requests
+DEFAULT_MAX_RETRIES = 5
+
+MODEL = "gpt-4o-mini"
+MAX_TOKENS = 1500
+PROMPT_TEMPLATE = """Given the following manufacturing part information, identify the most credible manufacturers:
+
+Manufacturing Part Number (MPN): {mpn}
+Model/Product Description: {description}
+Quantity Required: {quantity}
+
+Please provide:
+1. Top {max_results} credible manufacturers for this part
+2. A credibility score (0-100) for each manufacturer based on:
+   - Industry reputation
+   - Product quality
+   - Supply chain reliability
+   - Market presence
+3. Brief reasoning for your recommendation
+4. Any important considerations (minimum order quantities, lead times, certifications)
+
+Format your response as a JSON object with the following structure:
+{{
+    "manufacturers": [
+        {{
+            "name": "Manufacturer Name",
+            "credibility_score": 95,
+            "strengths": ["strength1", "strength2"],
+            "considerations": "Any important notes"
+        }}
+    ],
+    "overall_recommendation": "Your top recommendation and why",
+    "additional_info": "Any other relevant information"
+}}
+"""
+
+SYSTEM_PROMPT = "You are an expert in manufacturing and supply chain management. You have deep knowledge of credible manufacturers across various industries, their reputations, and product quality. Provide accurate, detailed recommendations based on industry standards."
+
+PACKED_PROMPT_TEMPLATE = """Given the following manufacturing parts, identify the most credible manufacturers for each part:
+
+{parts}
+
+For each part please provide:
+1. Top {max_results} credible manufacturers for the part
+2. A credibility score (0-100) for each manufacturer based on:
+   - Industry reputation
+   - Product quality
+   - Supply chain reliability
+   - Market presence
+3. Brief reasoning for your recommendation
+4. Any important considerations (minimum order quantities, lead times, certifications)
+
+Format your response as a JSON object with the following structure, with exactly one entry per Part ID:
+{{
+    "results": [
+        {{
+            "part_id": "Part ID exactly as given above",
+            "manufacturers": [
+                {{
+                    "name": "Manufacturer Name",
+                    "credibility_score": 95,
+                    "strengths": ["strength1", "strength2"],
+                    "considerations": "Any important notes"
+                }}
+            ],
+            "overall_recommendation": "Your top recommendation and why",
+            "additional_info": "Any other relevant information"
+        }}
+    ]
+}}
+"""
+
+PACKED_PART_TEMPLATE = """Part ID: {part_id}
+Manufacturing Part Number (MPN): {mpn}
+Model/Product Description: {description}
+Quantity Required: {quantity}"""
+
+# Completion budget used to size packed requests: a fixed allowance per part
+# plus one per requested manufacturer, capped by the model's output limit
+PACKED_TOKENS_PER_PART = 150
+PACKED_TOKENS_PER_MANUFACTURER = 120
+PACKED_MAX_TOKENS = 16000
+
+# Changes whenever the prompts change, so cached responses from older prompts are not reused
+PROMPT_VERSION = hashlib.sha256(
+    (SYSTEM_PROMPT + PROMPT_TEMPLATE + PACKED_PROMPT_TEMPLATE).encode('utf-8')
+).hexdigest()[:12]
+
+
+def normalize_text(value) -> str:
+    """
+    Normalize an MPN or description for cache keys and duplicate detection
+    
+    Args:
+        value: Raw cell value
+        
+    Returns:
+        str: Upper-cased text with surrounding and repeated whitespace removed
+    """
+    return ' '.join(str(value).split()).upper()
+
+
+def _prefetch(items: Iterable, depth: int = 1) -> Iterator:
+    """
+    Iterate over ``items`` while a background thread reads ahead
+    
+    At most ``depth`` items wait in the buffer, so a slow producer (such as a
+    file being parsed) overlaps with the consumer without reading everything
+    into memory. Errors raised by the producer are re-raised to the consumer.
+    
+    Args:
+        items (Iterable): Items to read ahead
+        depth (int): Maximum number of items read ahead
+        
+    Yields:
+        The items, in order
+    """
+    buffer = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    end = object()
+    
+    def put(entry) -> bool:
+        # Give up once the consumer has gone away, instead of blocking forever
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((end, None))
+        except Exception as e:
+            put((end, e))
+    
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
 class ManufacturerFinder:
     """Finds credible manufacturers using OpenAI API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 rate_limiter: Optional[RateLimiter] = None, max_retries: int = DEFAULT_MAX_RETRIES,
+                 cache: Optional[ResponseCache] = None, pack_size: int = 1,
+                 recorder: Optional[NullRecorder] = None, tracer: Optional[NullTracer] = None):
         """
         Initialize ManufacturerFinder with OpenAI API key
         
         Args:
             api_key (str, optional): OpenAI API key. If not provided, reads from environment
+            concurrency (int): Maximum number of API requests in flight at once
+            rate_limiter (RateLimiter, optional): Shared RPM/TPM limiter. Unlimited if not provided
+            max_retries (int): Retries for rate-limited or failed API requests
+            cache (ResponseCache, optional): Persistent response cache. Disabled if not provided
+            pack_size (int): Maximum number of parts analysed per API request
+            recorder (RunRecorder, optional): Records latency, tokens and retries of every
+                request. Nothing is recorded if not provided
+            tracer (Tracer, optional): Records a timing span per request. Nothing is
+                traced if not provided
         """
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         
         if not self.api_key:
             raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY environment variable or pass api_key parameter")
         
-        self.client = OpenAI(api_key=self.api_key)
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        
+        if pack_size < 1:
+            raise ValueError("pack_size must be at least 1")
+        
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.cache = cache
+        self.pack_size = pack_size
+        self.recorder = recorder or NullRecorder()
+        self.tracer = tracer or NullTracer()
+        
+        # Retries are handled here so 429s go through the shared rate limiter
+        self.client = OpenAI(api_key=self.api_key, max_retries=0)
         logger.info("ManufacturerFinder initialized with OpenAI API")
     
-    def find_manufacturers(self, df: pd.DataFrame, max_manufacturers: int = 5) -> pd.DataFrame:
+    def find_manufacturers(self, df: pd.DataFrame, max_manufacturers: int = 5, dedupe: bool = True,
+                           dedupe_on_description: bool = False,
+                           on_result: Optional[Callable[[Dict], None]] = None) -> pd.DataFrame:
         """
         Find manufacturers for each item in the DataFrame
         
         Args:
             df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
             max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            on_result (Callable, optional): Called with each enriched row as soon as it completes
             
         Returns:
             pd.DataFrame: Enhanced DataFrame with manufacturer information
         """
+        results = [None] * len(df)
+        for position, result_row, analysis in self._iter_results(df, max_manufacturers, dedupe, dedupe_on_description):
+            results[position] = result_row
+            if on_result is not None:
+                on_result(result_row)
+        
+        return pd.DataFrame(results)
+    
+    def find_manufacturers_iter(self, df: pd.DataFrame, max_manufacturers: int = 5, dedupe: bool = True,
+                                dedupe_on_description: bool = False, ordered: bool = False) -> Iterator[Dict]:
+        """
+        Find manufacturers for each item, yielding enriched rows as they complete
+        
+        Only a bounded window of requests is queued at a time, and rows are not
+        retained once yielded. Closing the generator early cancels queued work.
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            ordered (bool): Yield rows in input order instead of completion order
+            
+        Yields:
+            Dict: Original row enriched with manufacturer information
+        """
+        for result_row, analysis in self.iter_analyses(df, max_manufacturers, dedupe,
+                                                       dedupe_on_description, ordered):
+            yield result_row
+    
+    def iter_analyses(self, df: pd.DataFrame, max_manufacturers: int = 5, dedupe: bool = True,
+                      dedupe_on_description: bool = False,
+                      ordered: bool = False) -> Iterator[Tuple[Dict, PartAnalysis]]:
+        """
+        Like find_manufacturers_iter, but also yield each row's typed analysis
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            ordered (bool): Yield rows in input order instead of completion order
+            
+        Yields:
+            Tuple[Dict, PartAnalysis]: Enriched row and the analysis it was rendered from
+                (shared by every row of a deduplicated part)
+        """
+        results = self._iter_results(df, max_manufacturers, dedupe, dedupe_on_description)
+        yield from self._yield_results(results, ordered)
+    
+    def find_manufacturers_table(self, df: pd.DataFrame, max_manufacturers: int = 5, dedupe: bool = True,
+                                 dedupe_on_description: bool = False,
+                                 canonicalizer: Optional[ManufacturerCanonicalizer] = None
+                                 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Find manufacturers for each item, also returning the long-form manufacturer table
+        
+        Args:
+            df (pd.DataFrame): DataFrame with ID, MPN, Model_Description, Quantity
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            canonicalizer (ManufacturerCanonicalizer, optional): Maps raw names to canonical
+                manufacturer IDs. A new one with the default aliases is used if not provided
+            
+        Returns:
+            Tuple of (results_df, table): the enriched rows in input order, and one row per
+            candidate manufacturer (see analysis_results.MANUFACTURER_TABLE_COLUMNS) with
+            manufacturer_id and canonical_manufacturer added
+        """
         results = []
+        analyses = []
+        for result_row, analysis in self.iter_analyses(df, max_manufacturers, dedupe,
+                                                       dedupe_on_description, ordered=True):
+            results.append(result_row)
+            analyses.append((result_row['ID'], analysis))
+        
+        return pd.DataFrame(results), canonicalize_table(manufacturer_table(analyses), canonicalizer)
+    
+    def find_manufacturers_chunks(self, chunks: Iterable[pd.DataFrame], max_manufacturers: int = 5,
+                                  dedupe: bool = True, dedupe_on_description: bool = False,
+                                  ordered: bool = False) -> Iterator[Dict]:
+        """
+        Find manufacturers for a stream of DataFrame chunks, yielding enriched rows as they complete
+        
+        The next chunk is read in the background while the current one is being
+        queried, so work starts before the whole input is loaded. Parts already
+        answered in an earlier chunk reuse that result without a new request.
+        
+        Args:
+            chunks (Iterable[pd.DataFrame]): Chunks with MPN, Model_Description, Quantity
+                (e.g. from DataLoader.iter_chunks)
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            ordered (bool): Yield rows in input order instead of completion order
+            
+        Yields:
+            Dict: Original row enriched with manufacturer information
+        """
+        # Successful results by part key, shared across chunks (keys are row positions without dedupe)
+        memo = {} if dedupe else None
+        
+        for chunk in _prefetch(chunks):
+            results = self._iter_results(chunk, max_manufacturers, dedupe, dedupe_on_description, memo)
+            for result_row, analysis in self._yield_results(results, ordered):
+                yield result_row
+    
+    def group_parts(self, df: pd.DataFrame, dedupe: bool = True, dedupe_on_description: bool = False):
+        """
+        Group rows into the unique parts to analyse (for offline runs such as the Batch API)
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            dedupe (bool): Share one analysis between rows with the same normalized MPN
+            dedupe_on_description (bool): Also require matching normalized descriptions
+            
+        Returns:
+            Tuple of (rows, row_keys, unique_rows) where unique_rows maps each
+            part key to its first (idx, row) in input order
+        """
+        return self._group_parts(df, dedupe, dedupe_on_description)
+    
+    def part_key(self, row, include_description: bool = False):
+        """
+        Deduplication key of a part: rows with equal keys share one analysis
+        
+        Args:
+            row: Row (pd.Series or dict) with MPN and Model_Description
+            include_description (bool): Include the normalized description in the key
+            
+        Returns:
+            Hashable key identifying the part
+        """
+        return self._part_key(row, include_description)
+    
+    def cached_analysis(self, mpn: str, description: str, max_results: int) -> Optional[PartAnalysis]:
+        """
+        Look a part up in the response cache
+        
+        A lookup that fails is logged and treated as a miss.
+        
+        Args:
+            mpn (str): Manufacturing Part Number
+            description (str): Model/product description
+            max_results (int): Maximum manufacturers requested
+            
+        Returns:
+            PartAnalysis: Cached analysis, or None if the part must be queried
+        """
+        try:
+            return self._cache_lookup(mpn, description, max_results)
+        except Exception as e:
+            logger.warning(f"Cache lookup failed for {mpn}: {str(e)}")
+            return None
+    
+    def request_body(self, mpn: str, description: str, quantity: int, max_results: int) -> Dict:
+        """
+        Chat completion request for one part, as sent by the finder
         
-        for idx, row in df.iterrows():
-            logger.info(f"Processing row {idx + 1}/{len(df)}: {row['MPN']}")
+        Args:
+            mpn (str): Manufacturing Part Number
+            description (str): Model/product description
+            quantity (int): Quantity needed
+            max_results (int): Maximum manufacturers to return
             
+        Returns:
+            Dict: Request parameters (usable as a Batch API request body)
+        """
+        return self._request_body(self._build_prompt(mpn, description, quantity, max_results), MAX_TOKENS)
+    
+    def parse_analysis(self, mpn: str, description: str, max_results: int, content: str) -> PartAnalysis:
+        """
+        Turn a completion's message content into an analysis, caching it once it parses
+        
+        Args:
+            mpn (str): Manufacturing Part Number
+            description (str): Model/product description
+            max_results (int): Maximum manufacturers requested
+            content (str): JSON message content of the completion
+            
+        Returns:
+            PartAnalysis: Typed manufacturer analysis (malformed content raises)
+        """
+        result = json.loads(content)
+        analysis = self._format_result(result)
+        self._cache_store(mpn, description, max_results, result)
+        return analysis
+    
+    def failed_analysis(self, error: Exception) -> PartAnalysis:
+        """
+        Result recorded for a part whose analysis failed
+        
+        Args:
+            error (Exception): The failure
+            
+        Returns:
+            PartAnalysis: Error result, rendered as the error columns
+        """
+        return self._error_info(error)
+    
+    def merge_results(self, rows: List, row_keys: List, analyses: Dict) -> List[Dict]:
+        """
+        Merge each part's analysis back into its original rows
+        
+        Args:
+            rows (List): (idx, row) tuples in input order, from group_parts()
+            row_keys (List): Part key of each row, from group_parts()
+            analyses (Dict): PartAnalysis by part key
+            
+        Returns:
+            List[Dict]: Enriched rows, each keeping its own ID and Quantity
+        """
+        return self._fan_out(rows, row_keys, analyses)
+    
+    def _yield_results(self, results: Iterator[Tuple[int, Dict, PartAnalysis]],
+                       ordered: bool) -> Iterator[Tuple[Dict, PartAnalysis]]:
+        """
+        Yield enriched rows from _iter_results, optionally restoring input order
+        
+        Args:
+            results (Iterator[Tuple[int, Dict, PartAnalysis]]): (position, row, analysis)
+                in completion order
+            ordered (bool): Yield rows in input order instead of completion order
+            
+        Yields:
+            Tuple[Dict, PartAnalysis]: Enriched row and its analysis
+        """
+        if not ordered:
+            for position, result_row, analysis in results:
+                yield result_row, analysis
+            return
+        
+        # Hold back rows that finish early until every row before them is out
+        buffered = {}
+        next_position = 0
+        for position, result_row, analysis in results:
+            buffered[position] = (result_row, analysis)
+            while next_position in buffered:
+                yield buffered.pop(next_position)
+                next_position += 1
+    
+    def _iter_results(self, df: pd.DataFrame, max_manufacturers: int, dedupe: bool,
+                      dedupe_on_description: bool,
+                      memo: Optional[Dict] = None) -> Iterator[Tuple[int, Dict, PartAnalysis]]:
+        """
+        Run the query engine, yielding (input position, enriched row, analysis) in completion order
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            max_manufacturers (int): Maximum number of manufacturers to find per item
+            dedupe (bool): Query each normalized MPN once and share the result across its rows
+            dedupe_on_description (bool): Also require matching normalized descriptions to share a result
+            memo (Dict, optional): PartAnalysis by part key from earlier calls.
+                Parts found here are not queried again, and new successful results are added
+            
+        Yields:
+            Tuple[int, Dict, PartAnalysis]: Row position in df, the enriched row and its analysis
+        """
+        rows, row_keys, unique_rows = self._group_parts(df, dedupe, dedupe_on_description)
+        
+        # Positions of the rows sharing each part key, for fan-out
+        positions_by_key = {}
+        for position, key in enumerate(row_keys):
+            positions_by_key.setdefault(key, []).append(position)
+        
+        if memo:
+            for key in [key for key in unique_rows if key in memo]:
+                del unique_rows[key]
+                analysis = memo[key]
+                info = analysis.to_columns()
+                for position in positions_by_key[key]:
+                    result_row = rows[position][1].to_dict()
+                    result_row.update(info)
+                    yield position, result_row, analysis
+        
+        total = len(unique_rows)
+        keys = list(unique_rows.keys())
+        items = list(enumerate(unique_rows.values()))
+        pack_size = self._effective_pack_size(max_manufacturers)
+        
+        # Unique parts (or packs of them) are processed by a bounded thread pool.
+        # Work is submitted in a sliding window so queued futures stay bounded
+        starts = iter(range(0, len(items), pack_size))
+        window = self.concurrency * 2
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        in_flight = {}
+        
+        def submit_next():
+            for start in starts:
+                future = executor.submit(
+                    self._process_unit, items[start:start + pack_size], pack_size, total, max_manufacturers
+                )
+                in_flight[future] = keys[start:start + pack_size]
+                if len(in_flight) >= window:
+                    return
+        
+        try:
+            submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for key, analysis in zip(in_flight.pop(future), future.result()):
+                        # Failed parts are left out so a later chunk can retry them
+                        if memo is not None and analysis.error is None:
+                            memo[key] = analysis
+                        info = analysis.to_columns()
+                        for position in positions_by_key[key]:
+                            result_row = rows[position][1].to_dict()
+                            result_row.update(info)
+                            yield position, result_row, analysis
+                submit_next()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _group_parts(self, df: pd.DataFrame, dedupe: bool = True, dedupe_on_description: bool = False):
+        """
+        Group rows by part key so each unique part is queried only once
+        
+        Args:
+            df (pd.DataFrame): DataFrame with MPN, Model_Description, Quantity
+            dedupe (bool): Share one query between rows with the same normalized MPN
+            dedupe_on_description (bool): Also require matching normalized descriptions
+            
+        Returns:
+            Tuple of (rows, row_keys, unique_rows) where unique_rows maps each
+            part key to its first (idx, row) in input order
+        """
+        rows = list(df.iterrows())
+        row_keys = []
+        unique_rows = {}
+        for position, (idx, row) in enumerate(rows):
+            key = self._part_key(row, dedupe_on_description) if dedupe else position
+            row_keys.append(key)
+            unique_rows.setdefault(key, (idx, row))
+        
+        if dedupe and rows:
+            saved = len(rows) - len(unique_rows)
+            logger.info(
+                f"Deduplicated {len(rows)} rows into {len(unique_rows)} unique parts "
+                f"(dedup ratio {len(rows) / len(unique_rows):.2f}x, {saved} API calls saved)"
+            )
+        
+        return rows, row_keys, unique_rows
+    
+    def _fan_out(self, rows: List, row_keys: List, info_by_key: Dict) -> List[Dict]:
+        """
+        Merge each part's manufacturer information back into its original rows
+        
+        Args:
+            rows (List): (idx, row) tuples in input order
+            row_keys (List): Part key of each row
+            info_by_key (Dict): PartAnalysis by part key
+            
+        Returns:
+            List[Dict]: Enriched rows, each keeping its own ID and Quantity
+        """
+        columns_by_key = {key: analysis.to_columns() for key, analysis in info_by_key.items()}
+        results = []
+        for (idx, row), key in zip(rows, row_keys):
+            result_row = row.to_dict()
+            result_row.update(columns_by_key[key])
+            results.append(result_row)
+        return results
+    
+    def _part_key(self, row: pd.Series, include_description: bool = False):
+        """
+        Build the deduplication key for a row
+        
+        Args:
+            row: Row (pd.Series or dict) with MPN and Model_Description
+            include_description (bool): Include the normalized description in the key
+            
+        Returns:
+            Hashable key identifying the part
+        """
+        if include_description:
+            return (normalize_text(row['MPN']), normalize_text(row['Model_Description']))
+        return normalize_text(row['MPN'])
+    
+    def _process_unit(self, unit: List, pack_size: int, total: int, max_manufacturers: int) -> List[PartAnalysis]:
+        """
+        Process one unit of work: a single part, or a pack of parts in packed mode
+        
+        Args:
+            unit (List): (position, (idx, row)) tuples of the parts to analyse
+            pack_size (int): Effective pack size (1 disables packing)
+            total (int): Total number of unique parts (for logging)
+            max_manufacturers (int): Maximum number of manufacturers to find
+            
+        Returns:
+            List[PartAnalysis]: Analysis of each part, in unit order
+        """
+        if pack_size > 1:
+            return self._process_pack(unit, total, max_manufacturers)
+        
+        position, (idx, row) = unit[0]
+        return [self._process_part(position, idx, row, total, max_manufacturers)]
+    
+    def _process_part(self, position: int, idx, row: pd.Series, total: int,
+                      max_manufacturers: int) -> PartAnalysis:
+        """
+        Query manufacturers for a single part, converting failures into error results
+        
+        Args:
+            position (int): Position of the part among the unique parts (for logging)
+            idx: DataFrame index label of the representative row
+            row (pd.Series): Row with MPN, Model_Description, Quantity
+            total (int): Total number of unique parts (for logging)
+            max_manufacturers (int): Maximum number of manufacturers to find
+            
+        Returns:
+            PartAnalysis: Analysis shared by every row of the part
+        """
+        logger.info(f"Processing part {position + 1}/{total}: {row['MPN']}")
+        
+        try:
+            return self._query_manufacturers(
+                mpn=row['MPN'],
+                description=row['Model_Description'],
+                quantity=row['Quantity'],
+                max_results=max_manufacturers
+            )
+            
+        except Exception as e:
+            logger.error(f"Error processing row {idx}: {str(e)}")
+            return self._error_info(e)
+    
+    def _error_info(self, error: Exception) -> PartAnalysis:
+        """
+        Build the result recorded for a part whose analysis failed
+        
+        Args:
+            error (Exception): The failure
+            
+        Returns:
+            PartAnalysis: Error result, rendered as the error columns
+        """
+        return PartAnalysis.from_error(error)
+    
+    def _effective_pack_size(self, max_results: int) -> int:
+        """
+        Work out how many parts to pack into each request
+        
+        The configured pack size is reduced so the expected completion fits
+        within PACKED_MAX_TOKENS and a whole request fits in one minute of the
+        rate limiter's token budget.
+        
+        Args:
+            max_results (int): Maximum manufacturers requested per part
+            
+        Returns:
+            int: Parts per request (1 disables packing)
+        """
+        if self.pack_size <= 1:
+            return 1
+        
+        completion_per_part = PACKED_TOKENS_PER_PART + PACKED_TOKENS_PER_MANUFACTURER * max_results
+        pack_size = min(self.pack_size, PACKED_MAX_TOKENS // completion_per_part)
+        
+        token_bucket = self.rate_limiter.tokens
+        if token_bucket is not None:
+            prompt_overhead = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(PACKED_PROMPT_TEMPLATE)
+            prompt_per_part = estimate_tokens(PACKED_PART_TEMPLATE) + 50
+            budget = int(token_bucket.capacity) - prompt_overhead
+            pack_size = min(pack_size, budget // (prompt_per_part + completion_per_part))
+        
+        if pack_size < self.pack_size:
+            logger.info(f"Pack size reduced from {self.pack_size} to {max(pack_size, 1)} to fit the token budget")
+        
+        return max(pack_size, 1)
+    
+    def _process_pack(self, pack: List, total: int, max_manufacturers: int) -> List[PartAnalysis]:
+        """
+        Query manufacturers for several parts in one request
+        
+        Parts found in the cache are answered from it. Parts whose entry in the
+        packed response is missing or malformed, or every part if the packed
+        request itself fails, are retried on their own.
+        
+        Args:
+            pack (List): (position, (idx, row)) tuples of the parts to analyse
+            total (int): Total number of unique parts (for logging)
+            max_manufacturers (int): Maximum number of manufacturers to find
+            
+        Returns:
+            List[PartAnalysis]: Analysis of each part, in pack order
+        """
+        infos = [None] * len(pack)
+        pending = {}
+        
+        for i, (position, (idx, row)) in enumerate(pack):
+            # A failed lookup only sends its own part to the API again
             try:
-                manufacturer_info = self._query_manufacturers(
-                    mpn=row['MPN'],
-                    description=row['Model_Description'],
-                    quantity=row['Quantity'],
-                    max_results=max_manufacturers
+                cached = self._cache_lookup(row['MPN'], row['Model_Description'], max_manufacturers)
+            except Exception as e:
+                logger.warning(f"Cache lookup failed for {row['MPN']}: {str(e)}")
+                cached = None
+            
+            if cached is not None:
+                infos[i] = cached
+            else:
+                pending[str(i + 1)] = i
+        
+        if pending:
+            first_position = pack[0][0]
+            logger.info(
+                f"Processing parts {first_position + 1}-{first_position + len(pack)}/{total} "
+                f"({len(pending)} packed into one request)"
+            )
+            
+            parts = '\n\n'.join(
+                PACKED_PART_TEMPLATE.format(
+                    part_id=part_id,
+                    mpn=pack[i][1][1]['MPN'],
+                    description=pack[i][1][1]['Model_Description'],
+                    quantity=pack[i][1][1]['Quantity']
                 )
+                for part_id, i in pending.items()
+            )
+            prompt = PACKED_PROMPT_TEMPLATE.format(parts=parts, max_results=max_manufacturers)
+            completion_per_part = PACKED_TOKENS_PER_PART + PACKED_TOKENS_PER_MANUFACTURER * max_manufacturers
+            max_tokens = min(PACKED_MAX_TOKENS, completion_per_part * len(pending))
+            
+            try:
+                response = self._create_completion(prompt, max_tokens=max_tokens, kind='packed')
+                entries = json.loads(response.choices[0].message.content).get('results', [])
+            except Exception as e:
+                logger.warning(f"Packed request failed, retrying {len(pending)} parts individually: {str(e)}")
+                entries = []
+            
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict) or not isinstance(entry.get('manufacturers'), list):
+                    continue
+                i = pending.get(str(entry.get('part_id')))
+                if i is None:
+                    continue
                 
-                # Add manufacturer info to row
-                result_row = row.to_dict()
-                result_row.update(manufacturer_info)
-                results.append(result_row)
-                
-                # Rate limiting - avoid hitting API too fast
-                time.sleep(0.5)
+                result = {k: v for k, v in entry.items() if k != 'part_id'}
+                try:
+                    infos[i] = self._format_result(result)
+                except Exception as e:
+                    # Left pending, so the part is retried on its own
+                    logger.warning(f"Malformed packed entry for part {entry.get('part_id')}: {str(e)}")
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Error processing row {idx}: {str(e)}")
-                result_row = row.to_dict()
-                result_row.update({
-                    'Manufacturers': 'Error',
-                    'Credibility_Score': 0,
-                    'Recommendation': f'Error: {str(e)}',
-                    'Details': ''
-                })
-                results.append(result_row)
+                del pending[str(entry.get('part_id'))]
+                row = pack[i][1][1]
+                self._cache_store(row['MPN'], row['Model_Description'], max_manufacturers, result)
         
-        return pd.DataFrame(results)
+        # Missing or malformed entries are split out and retried on their own
+        if pending:
+            logger.info(f"Retrying {len(pending)} parts missing from the packed response")
+        for i in pending.values():
+            position, (idx, row) = pack[i]
+            infos[i] = self._process_part(position, idx, row, total, max_manufacturers)
+        
+        return infos
     
-    def _query_manufacturers(self, mpn: str, description: str, quantity: int, max_results: int = 5) -> Dict:
+    def _cache_key(self, mpn: str, description: str, max_results: int) -> str:
+        """Build the response cache key for a part"""
+        return make_cache_key(normalize_text(mpn), normalize_text(description), max_results, MODEL, PROMPT_VERSION)
+    
+    def _cache_lookup(self, mpn: str, description: str, max_results: int) -> Optional[PartAnalysis]:
+        """
+        Look a part up in the response cache
+        
+        An entry that no longer turns into an analysis is deleted and treated
+        as a miss, so the part is queried again.
+        
+        Returns:
+            PartAnalysis: Analysis from the cached response, or None if not cached
+        """
+        if self.cache is None:
+            return None
+        
+        key = self._cache_key(mpn, description, max_results)
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        
+        try:
+            analysis = self._format_result(cached)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {mpn}: {str(e)}")
+            self.cache.delete(key)
+            return None
+        
+        logger.info(f"Cache hit for {mpn}")
+        self.recorder.record_cache_hit()
+        return analysis
+    
+    def _cache_store(self, mpn: str, description: str, max_results: int, result: Dict):
+        """Store a parsed API response in the response cache (only once _format_result accepted it)"""
+        if self.cache is not None:
+            self.cache.put(self._cache_key(mpn, description, max_results), result)
+    
+    def _query_manufacturers(self, mpn: str, description: str, quantity: int,
+                             max_results: int = 5) -> PartAnalysis:
         """
         Query OpenAI to find credible manufacturers
         
@@ -89,92 +851,145 @@ class ManufacturerFinder:
             max_results (int): Maximum manufacturers to return
             
         Returns:
-            Dict: Manufacturer information
+            PartAnalysis: Typed manufacturer analysis
         """
-        prompt = f"""Given the following manufacturing part information, identify the most credible manufacturers:
-
-Manufacturing Part Number (MPN): {mpn}
-Model/Product Description: {description}
-Quantity Required: {quantity}
-
-Please provide:
-1. Top {max_results} credible manufacturers for this part
-2. A credibility score (0-100) for each manufacturer based on:
-   - Industry reputation
-   - Product quality
-   - Supply chain reliability
-   - Market presence
-3. Brief reasoning for your recommendation
-4. Any important considerations (minimum order quantities, lead times, certifications)
-
-Format your response as a JSON object with the following structure:
-{{
-    "manufacturers": [
-        {{
-            "name": "Manufacturer Name",
-            "credibility_score": 95,
-            "strengths": ["strength1", "strength2"],
-            "considerations": "Any important notes"
-        }}
-    ],
-    "overall_recommendation": "Your top recommendation and why",
-    "additional_info": "Any other relevant information"
-}}
-"""
+        cached = self._cache_lookup(mpn, description, max_results)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_prompt(mpn, description, quantity, max_results)
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert in manufacturing and supply chain management. You have deep knowledge of credible manufacturers across various industries, their reputations, and product quality. Provide accurate, detailed recommendations based on industry standards."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=1500,
-                response_format={"type": "json_object"}
-            )
+            response = self._create_completion(prompt)
             
-            # Parse the response
-            result = json.loads(response.choices[0].message.content)
-            
-            # Extract and format manufacturer information
-            manufacturers = result.get('manufacturers', [])
-            
-            # Create formatted output
-            manufacturer_names = [m.get('name', 'Unknown') for m in manufacturers]
-            credibility_scores = [m.get('credibility_score', 0) for m in manufacturers]
-            
-            # Calculate average credibility
-            avg_credibility = sum(credibility_scores) / len(credibility_scores) if credibility_scores else 0
-            
-            # Format detailed information
-            details = []
-            for m in manufacturers:
-                name = m.get('name', 'Unknown')
-                score = m.get('credibility_score', 0)
-                strengths = ', '.join(m.get('strengths', []))
-                considerations = m.get('considerations', '')
-                details.append(f"{name} (Score: {score})\nStrengths: {strengths}\nNotes: {considerations}")
-            
-            return {
-                'Top_Manufacturer': manufacturer_names[0] if manufacturer_names else 'Not Found',
-                'All_Manufacturers': ' | '.join(manufacturer_names),
-                'Avg_Credibility_Score': round(avg_credibility, 2),
-                'Recommendation': result.get('overall_recommendation', 'No recommendation available'),
-                'Detailed_Analysis': '\n\n'.join(details),
-                'Additional_Info': result.get('additional_info', '')
-            }
+            # Malformed responses raise here and are never cached
+            return self.parse_analysis(mpn, description, max_results, response.choices[0].message.content)
             
         except Exception as e:
             logger.error(f"Error querying OpenAI: {str(e)}")
             raise
     
+    def _build_prompt(self, mpn: str, description: str, quantity: int, max_results: int) -> str:
+        """
+        Render the analysis prompt for a single part
+        
+        Args:
+            mpn (str): Manufacturing Part Number
+            description (str): Model/product description
+            quantity (int): Quantity needed
+            max_results (int): Maximum manufacturers to return
+            
+        Returns:
+            str: User prompt
+        """
+        return PROMPT_TEMPLATE.format(
+            mpn=mpn,
+            description=description,
+            quantity=quantity,
+            max_results=max_results
+        )
+    
+    def _format_result(self, result: Dict) -> PartAnalysis:
+        """
+        Turn a parsed API response into a typed analysis
+        
+        Args:
+            result (Dict): Parsed JSON response
+            
+        Returns:
+            PartAnalysis: Manufacturer analysis (to_columns() renders the flat result columns)
+        """
+        return PartAnalysis.from_response(result)
+    
+    def _request_body(self, prompt: str, max_tokens: int = MAX_TOKENS) -> Dict:
+        """
+        Build the chat completion request parameters for a prompt
+        
+        Args:
+            prompt (str): User prompt
+            max_tokens (int): Completion token limit for the request
+            
+        Returns:
+            Dict: Keyword arguments for chat.completions.create (also used as Batch API request bodies)
+        """
+        return {
+            "model": MODEL,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _create_completion(self, prompt: str, max_tokens: int = MAX_TOKENS, kind: str = 'single'):
+        """
+        Send a chat completion request through the shared rate limiter
+        
+        Rate-limit (429) responses pause every worker for the time given in
+        Retry-After; connection and server errors are retried with
+        exponential backoff. With a recorder, the request's latency (across
+        retries), token usage, retries and outcome are recorded; with a tracer,
+        the request is timed as a 'request' span.
+        
+        Args:
+            prompt (str): User prompt
+            max_tokens (int): Completion token limit for the request
+            kind (str): Request kind for the recorder ('single' or 'packed')
+            
+        Returns:
+            OpenAI chat completion response
+        """
+        request = self._request_body(prompt, max_tokens)
+        estimated_tokens = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(prompt) + max_tokens
+        
+        recording = self.recorder.enabled
+        if recording:
+            started_at, started = time.time(), time.perf_counter()
+        
+        with self.tracer.span('request', kind=kind):
+            attempt = 0
+            try:
+                for attempt in range(self.max_retries + 1):
+                    self.rate_limiter.acquire(estimated_tokens)
+                    
+                    try:
+                        response = self.client.chat.completions.create(**request)
+                    except RateLimitError as e:
+                        # The request never ran, so hand its tokens back
+                        self.rate_limiter.reconcile(estimated_tokens, 0)
+                        if attempt == self.max_retries:
+                            raise
+                        retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
+                        self.rate_limiter.backoff(retry_after if retry_after is not None else 2 ** attempt)
+                        continue
+                    except (APIConnectionError, InternalServerError) as e:
+                        self.rate_limiter.reconcile(estimated_tokens, 0)
+                        if attempt == self.max_retries:
+                            raise
+                        logger.warning(f"Retrying after API error: {str(e)}")
+                        time.sleep(2 ** attempt)
+                        continue
+                    
+                    usage = getattr(response, 'usage', None)
+                    if usage is not None and getattr(usage, 'total_tokens', None) is not None:
+                        self.rate_limiter.reconcile(estimated_tokens, usage.total_tokens)
+                    
+                    if recording:
+                        self.recorder.record_call(kind, started_at, time.perf_counter() - started, attempt, usage=usage)
+                    return response
+            except Exception as e:
+                if recording:
+                    self.recorder.record_call(kind, started_at, time.perf_counter() - started, attempt, error=e)
+                raise
+    
     def analyze_single_part(self, mpn: str, description: str, quantity: int = 1) -> Dict:
         """
         Analyze a single part and return manufacturer recommendations
@@ -187,4 +1002,4 @@ Format your response as a JSON object with the following structure:
         Returns:
             Dict: Manufacturer analysis
         """
-        return self._query_manufacturers(mpn, description, quantity)
+        return self._query_manufacturers(mpn, description, quantity).to_columns()
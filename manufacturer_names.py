@@ -0,0 +1,281 @@
+"""
+Manufacturer Names Module
+Maps the manufacturer names returned by the model ("TI", "Texas Instruments Inc.", ...)
+to canonical manufacturer IDs using an alias dictionary and a trigram index
+"""
+
+import re
+import json
+import math
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Minimum trigram (Dice) similarity for two names to be treated as the same manufacturer
+DEFAULT_SIMILARITY = 0.8
+
+# Names shorter than this (after normalization) are only matched exactly or by alias
+MIN_FUZZY_LENGTH = 4
+
+# Trailing legal-form words ignored when comparing names
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'ltd', 'limited',
+    'llc', 'plc', 'gmbh', 'ag', 'sa', 'se', 'nv', 'bv', 'kg', 'spa', 'oy', 'ab',
+    'kk', 'pty', 'international', 'intl', 'group', 'holdings'
+}
+
+# Common abbreviations and former names, keyed by normalized name
+DEFAULT_ALIASES = {
+    'ti': 'Texas Instruments',
+    'adi': 'Analog Devices',
+    'st': 'STMicroelectronics',
+    'stm': 'STMicroelectronics',
+    'st micro': 'STMicroelectronics',
+    'stmicro': 'STMicroelectronics',
+    'on semi': 'onsemi',
+    'on semiconductor': 'onsemi',
+    'nxp semiconductors': 'NXP',
+    'freescale': 'NXP',
+    'freescale semiconductor': 'NXP',
+    'linear technology': 'Analog Devices',
+    'maxim integrated': 'Analog Devices',
+    'microchip technology': 'Microchip',
+    'atmel': 'Microchip',
+    'te': 'TE Connectivity',
+    'tyco electronics': 'TE Connectivity',
+    'ge': 'General Electric',
+    'allen bradley': 'Rockwell Automation',
+    'schneider': 'Schneider Electric',
+    'abb': 'ABB',
+    'mitsubishi': 'Mitsubishi Electric',
+    'omron automation': 'Omron'
+}
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalize_name(name) -> str:
+    """
+    Normalize a manufacturer name for matching
+    
+    Lower-cases, turns '&' into 'and', drops punctuation and trailing
+    legal-form words ("Inc.", "GmbH", ...) and collapses whitespace.
+    
+    Args:
+        name: Raw manufacturer name
+    
+    Returns:
+        str: Normalized name (empty for missing names)
+    """
+    if name is None or (isinstance(name, float) and name != name):
+        return ''
+    
+    words = _PUNCTUATION.sub(' ', str(name).lower().replace('&', ' and ')).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of a normalized name, padded so word edges count"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def load_aliases(path: str) -> Dict[str, str]:
+    """
+    Load extra aliases from a JSON object of {"alias": "Canonical Name"}
+    
+    Args:
+        path (str): JSON file path
+    
+    Returns:
+        Dict[str, str]: Canonical name by normalized alias
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        aliases = json.load(f)
+    return {normalize_name(alias): canonical for alias, canonical in aliases.items()}
+
+
+class ManufacturerCanonicalizer:
+    """
+    Assigns canonical manufacturer IDs to raw names
+    
+    Each name is resolved by, in order: its normalized form seen before, the
+    alias dictionary, then the most similar canonical name in a trigram index
+    (if above the similarity threshold). Names that match nothing become new
+    canonical manufacturers, so the index grows as a run proceeds.
+    """
+    
+    def __init__(self, aliases: Optional[Dict[str, str]] = None,
+                 similarity: float = DEFAULT_SIMILARITY, aliases_path: Optional[str] = None):
+        """
+        Initialize ManufacturerCanonicalizer
+        
+        Args:
+            aliases (Dict[str, str], optional): Canonical name by alias. Defaults to DEFAULT_ALIASES
+            similarity (float): Minimum trigram similarity (0-1) for a fuzzy match
+            aliases_path (str, optional): JSON file of extra aliases, applied on top
+        """
+        if not 0 < similarity <= 1:
+            raise ValueError("similarity must be between 0 and 1")
+        
+        self.similarity = similarity
+        self.aliases = {normalize_name(alias): canonical
+                        for alias, canonical in (DEFAULT_ALIASES if aliases is None else aliases).items()}
+        if aliases_path:
+            self.aliases.update(load_aliases(aliases_path))
+        
+        self.names: List[str] = []
+        self._ids_by_normalized: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._trigram_sets: List[set] = []
+        
+        # Alias targets are registered up front so they are the names shown
+        for canonical in dict.fromkeys(self.aliases.values()):
+            if normalize_name(canonical) not in self._ids_by_normalized:
+                self._add(canonical, normalize_name(canonical))
+    
+    def resolve(self, name) -> int:
+        """
+        Get the canonical manufacturer ID of one raw name
+        
+        Args:
+            name: Raw manufacturer name
+        
+        Returns:
+            int: Canonical manufacturer ID (-1 for a missing name)
+        """
+        normalized = normalize_name(name)
+        if not normalized:
+            return -1
+        
+        manufacturer_id = self._ids_by_normalized.get(normalized)
+        if manufacturer_id is not None:
+            return manufacturer_id
+        
+        alias = self.aliases.get(normalized)
+        if alias is not None:
+            alias_normalized = normalize_name(alias)
+            manufacturer_id = self._ids_by_normalized.get(alias_normalized)
+            if manufacturer_id is None:
+                manufacturer_id = self._add(alias, alias_normalized)
+        else:
+            manufacturer_id = self._best_match(normalized)
+            if manufacturer_id is None:
+                manufacturer_id = self._add(str(name).strip(), normalized)
+        
+        self._ids_by_normalized[normalized] = manufacturer_id
+        return manufacturer_id
+    
+    def resolve_many(self, names: Iterable) -> np.ndarray:
+        """
+        Get canonical manufacturer IDs for many raw names at once
+        
+        Only distinct spellings are matched (most frequent first, so the
+        common spelling becomes the canonical name); the IDs are then
+        broadcast back to every mention.
+        
+        Args:
+            names (Iterable): Raw manufacturer names
+        
+        Returns:
+            np.ndarray: Canonical manufacturer ID per name (-1 for missing names)
+        """
+        codes, uniques = pd.factorize(pd.Series(list(names) if not isinstance(names, pd.Series) else names))
+        if len(uniques) == 0:
+            return np.full(len(codes), -1, dtype=np.int64)
+        
+        unique_ids = np.empty(len(uniques), dtype=np.int64)
+        frequency = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        for code in np.argsort(-frequency, kind='stable'):
+            unique_ids[code] = self.resolve(uniques[code])
+        
+        ids = unique_ids[np.maximum(codes, 0)]
+        ids[codes < 0] = -1
+        return ids
+    
+    def name_of(self, manufacturer_id: int) -> Optional[str]:
+        """Canonical name of a manufacturer ID (None for -1)"""
+        return self.names[manufacturer_id] if manufacturer_id >= 0 else None
+    
+    def canonical_names(self, ids: np.ndarray) -> np.ndarray:
+        """Canonical names for an array of manufacturer IDs (None for -1)"""
+        names = np.array(self.names + [None], dtype=object)
+        return names[np.where(ids >= 0, ids, len(self.names))]
+    
+    def _add(self, name: str, normalized: str) -> int:
+        """Register a new canonical manufacturer and index its trigrams"""
+        manufacturer_id = len(self.names)
+        self.names.append(name)
+        self._ids_by_normalized[normalized] = manufacturer_id
+        
+        trigrams = _trigrams(normalized)
+        self._trigram_sets.append(trigrams)
+        if len(normalized) >= MIN_FUZZY_LENGTH:
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, []).append(manufacturer_id)
+        return manufacturer_id
+    
+    def _best_match(self, normalized: str) -> Optional[int]:
+        """
+        Find the most similar canonical name in the trigram index
+        
+        Any name with a Dice similarity of at least t shares at least
+        t*|A|/(2-t) of the query's |A| trigrams, so it must contain one of the
+        query's rarest |A| - that + 1 trigrams. Only those posting lists are
+        scanned, which keeps lookups cheap even when common trigrams
+        ("inc", "ele", ...) are shared by thousands of names.
+        
+        Args:
+            normalized (str): Normalized name
+        
+        Returns:
+            int: Canonical manufacturer ID, or None if nothing reaches the threshold
+        """
+        if len(normalized) < MIN_FUZZY_LENGTH:
+            return None
+        
+        trigrams = _trigrams(normalized)
+        min_shared = math.ceil(self.similarity * len(trigrams) / (2 - self.similarity) - 1e-9)
+        rarest = sorted(trigrams, key=lambda trigram: len(self._postings.get(trigram, ())))
+        
+        candidates = set()
+        for trigram in rarest[:len(trigrams) - min_shared + 1]:
+            candidates.update(self._postings.get(trigram, ()))
+        
+        # Highest Dice coefficient over the two trigram sets; ties go to the older name
+        best_id, best_score = None, 0.0
+        for manufacturer_id in sorted(candidates):
+            other = self._trigram_sets[manufacturer_id]
+            score = 2 * len(trigrams & other) / (len(trigrams) + len(other))
+            if score > best_score:
+                best_id, best_score = manufacturer_id, score
+        return best_id if best_score >= self.similarity else None
+
+
+def canonicalize_table(table: pd.DataFrame, canonicalizer: Optional[ManufacturerCanonicalizer] = None,
+                       column: str = 'manufacturer') -> pd.DataFrame:
+    """
+    Add manufacturer_id and canonical_manufacturer columns to a table of raw names
+    
+    Args:
+        table (pd.DataFrame): Table with a raw manufacturer name column
+            (e.g. from analysis_results.manufacturer_table)
+        canonicalizer (ManufacturerCanonicalizer, optional): Shared canonicalizer. A new one
+            with the default aliases is used if not provided
+        column (str): Raw name column
+    
+    Returns:
+        pd.DataFrame: The table with the two columns added
+    """
+    canonicalizer = canonicalizer or ManufacturerCanonicalizer()
+    ids = canonicalizer.resolve_many(table[column])
+    
+    logger.info(f"Canonicalized {len(ids)} manufacturer mentions into {len(np.unique(ids[ids >= 0]))} manufacturers")
+    return table.assign(manufacturer_id=ids, canonical_manufacturer=canonicalizer.canonical_names(ids))
@@ -0,0 +1,198 @@
+"""
+Multi Loader Module
+Loads every sheet of many input files (a directory or glob) in parallel worker processes
+"""
+
+import os
+import glob
+import logging
+import pandas as pd
+from functools import partial
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+from data_loader import DataLoader, REQUIRED_COLUMNS, SUPPORTED_EXTENSIONS
+from tracing import NullTracer, Tracer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Columns identifying where each row came from
+SOURCE_COLUMNS = ['Source_File', 'Source_Sheet']
+GLOB_CHARACTERS = ('*', '?', '[')
+
+
+def is_multi_input(path: str) -> bool:
+    """
+    Check whether an input path names several files rather than one
+    
+    Args:
+        path (str): Input path given on the command line
+    
+    Returns:
+        bool: True for a directory or a glob pattern
+    """
+    if os.path.isfile(path):
+        return False
+    return os.path.isdir(path) or any(c in path for c in GLOB_CHARACTERS)
+
+
+def resolve_inputs(path: str) -> List[str]:
+    """
+    Expand an input path into the list of files to load
+    
+    A directory yields its supported files (not recursively), a glob pattern
+    yields its matches (``**`` recurses) and a file yields itself. Excel lock
+    files (``~$...``) are skipped. Files are sorted so IDs are stable between runs.
+    
+    Args:
+        path (str): File, directory or glob pattern
+    
+    Returns:
+        List[str]: Input files, sorted (empty if nothing matches)
+    """
+    if os.path.isfile(path):
+        return [path]
+    
+    if os.path.isdir(path):
+        candidates = [
+            os.path.join(path, name) for name in os.listdir(path)
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+        ]
+    else:
+        candidates = glob.glob(path, recursive=True)
+    
+    return sorted(
+        candidate for candidate in candidates
+        if os.path.isfile(candidate) and not os.path.basename(candidate).startswith('~$')
+    )
+
+
+def _load_file(path: str, trace_origin: Optional[float] = None):
+    """
+    Load every sheet of one file, tagging rows with their source (runs in a worker process)
+    
+    The workbook is opened once for all its sheets. Sheets that cannot be read
+    as parts data (e.g. notes or empty sheets) are skipped with a warning, and
+    so is the whole file if it cannot be opened.
+    
+    Args:
+        path (str): Input file
+        trace_origin (float, optional): Origin of the parent's tracer; the sheets'
+            'read' and 'clean' spans are recorded and returned when given
+    
+    Returns:
+        Tuple of (frame, events, thread_names): cleaned rows of all sheets, with
+        Source_File and Source_Sheet, and the recorded spans (empty without an origin)
+    """
+    tracer = Tracer(trace_origin) if trace_origin is not None else None
+    frames = []
+    with ExitStack() as stack:
+        try:
+            loaders = stack.enter_context(DataLoader(path, tracer=tracer).open_sheets())
+        except Exception as e:
+            logger.warning(f"Skipping {path}: {str(e)}")
+            loaders = []
+        
+        for loader in loaders:
+            try:
+                df = loader.load()
+            except Exception as e:
+                logger.warning(f"Skipping {path} [{loader.sheet_name}]: {str(e)}")
+                continue
+            
+            frames.append(df.assign(Source_File=path, Source_Sheet=loader.sheet_name))
+    
+    if frames:
+        frame = pd.concat(frames, ignore_index=True)
+    else:
+        frame = pd.DataFrame(columns=['ID'] + REQUIRED_COLUMNS + SOURCE_COLUMNS)
+    
+    if tracer is None:
+        return frame, [], {}
+    return frame, tracer.events, tracer.thread_names
+
+
+def load_many(paths: List[str], workers: Optional[int] = None,
+              tracer: Optional[NullTracer] = None) -> pd.DataFrame:
+    """
+    Load every sheet of every file into one frame, parsing files in parallel
+    
+    Args:
+        paths (List[str]): Input files
+        workers (int, optional): Worker processes. Defaults to the number of CPUs;
+            1 loads the files in this process
+        tracer (Tracer, optional): Receives each sheet's 'read' and 'clean' spans,
+            recorded in the worker processes
+    
+    Returns:
+        pd.DataFrame: ID, MPN, Model_Description, Quantity, Source_File and Source_Sheet,
+            with IDs numbered across all files
+    """
+    logger.info(f"Loading {len(paths)} files with {workers or os.cpu_count()} worker processes")
+    
+    tracer = tracer or NullTracer()
+    load_file = partial(_load_file, trace_origin=tracer.origin if tracer.enabled else None)
+    if workers == 1:
+        loaded = [load_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            loaded = list(executor.map(load_file, paths))
+    
+    if tracer.enabled:
+        for _, events, thread_names in loaded:
+            tracer.extend(events, thread_names)
+    
+    frames = [frame for frame, _, _ in loaded if len(frame)]
+    if not frames:
+        return pd.DataFrame(columns=['ID'] + REQUIRED_COLUMNS + SOURCE_COLUMNS)
+    
+    df = pd.concat(frames, ignore_index=True)
+    df['ID'] = range(1, len(df) + 1)
+    
+    logger.info(f"Loaded {len(df)} rows from {len(frames)} of {len(paths)} files")
+    return df
+
+
+def iter_many_chunks(paths: List[str], chunk_rows: int,
+                     tracer: Optional[NullTracer] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream every sheet of every file in chunks, one file at a time
+    
+    Each workbook is opened once for all its sheets. A file that cannot be
+    opened, or a sheet that fails before its first chunk (e.g. notes or empty
+    sheets), is skipped with a warning. Once part of a sheet has been yielded, skipping the
+    rest would silently drop rows, so later errors are raised.
+    
+    Args:
+        paths (List[str]): Input files
+        chunk_rows (int): Maximum number of input rows per chunk
+        tracer (Tracer, optional): Times each chunk's cleaning as a 'clean' span
+    
+    Yields:
+        pd.DataFrame: Cleaned chunk with Source_File and Source_Sheet, IDs numbered across all files
+    """
+    next_id = 1
+    for path in paths:
+        with ExitStack() as stack:
+            try:
+                loaders = stack.enter_context(DataLoader(path, tracer=tracer).open_sheets(streaming=True))
+            except Exception as e:
+                logger.warning(f"Skipping {path}: {str(e)}")
+                continue
+            
+            for loader in loaders:
+                chunks = loader.iter_chunks(chunk_rows)
+                try:
+                    chunk = next(chunks, None)
+                except Exception as e:
+                    logger.warning(f"Skipping {path} [{loader.sheet_name}]: {str(e)}")
+                    continue
+                
+                while chunk is not None:
+                    chunk = chunk.assign(ID=range(next_id, next_id + len(chunk)),
+                                         Source_File=path, Source_Sheet=loader.sheet_name)
+                    next_id += len(chunk)
+                    yield chunk
+                    chunk = next(chunks, None)
@@ -0,0 +1,180 @@
+"""
+Rate Limiter Module
+Token-bucket throttling for OpenAI requests-per-minute (RPM) and tokens-per-minute (TPM) limits
+"""
+
+import math
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English prompts (OpenAI's rule of thumb)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a piece of text
+    
+    Args:
+        text (str): Prompt text
+    
+    Returns:
+        int: Estimated token count
+    """
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """
+    Read the server-requested wait time from response headers
+    
+    Honours OpenAI's ``retry-after-ms`` header first, then the standard
+    ``Retry-After`` header (either seconds or an HTTP date).
+    
+    Args:
+        headers: Mapping of response headers
+    
+    Returns:
+        float: Seconds to wait, or None if the headers do not say
+    """
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get('retry-after-ms')
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    
+    retry_after = headers.get('retry-after')
+    if not retry_after:
+        return None
+    
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to one minute of capacity"""
+    
+    def __init__(self, per_minute: float):
+        """
+        Initialize TokenBucket
+        
+        Args:
+            per_minute (float): Capacity replenished every minute
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float):
+        """Top the bucket up for the time elapsed since the last refill"""
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now)"""
+        # Requests larger than the whole bucket are let through once it is full
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+    
+    def take(self, amount: float):
+        """Remove ``amount`` from the bucket"""
+        self.level -= min(amount, self.capacity)
+    
+    def give(self, amount: float):
+        """Return ``amount`` to the bucket (may be negative to charge extra)"""
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Thread-safe limiter shared by every request a ManufacturerFinder makes"""
+    
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        """
+        Initialize RateLimiter
+        
+        Args:
+            requests_per_minute (int, optional): Account RPM limit. Unlimited if not provided
+            tokens_per_minute (int, optional): Account TPM limit. Unlimited if not provided
+        """
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.paused_until = 0.0
+        self._condition = threading.Condition()
+    
+    def acquire(self, estimated_tokens: int = 0):
+        """
+        Block until one request of ``estimated_tokens`` fits within both limits
+        
+        Args:
+            estimated_tokens (int): Expected prompt plus completion tokens
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = self.paused_until - now
+                
+                if self.requests:
+                    self.requests.refill(now)
+                    wait = max(wait, self.requests.wait_time(1))
+                if self.tokens:
+                    self.tokens.refill(now)
+                    wait = max(wait, self.tokens.wait_time(estimated_tokens))
+                
+                if wait <= 0:
+                    if self.requests:
+                        self.requests.take(1)
+                    if self.tokens:
+                        self.tokens.take(estimated_tokens)
+                    return
+                
+                self._condition.wait(wait)
+    
+    def reconcile(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the token bucket once the real usage of a request is known
+        
+        Args:
+            estimated_tokens (int): Tokens charged by acquire()
+            actual_tokens (int): Tokens reported by response.usage
+        """
+        if not self.tokens:
+            return
+        
+        with self._condition:
+            self.tokens.refill(time.monotonic())
+            self.tokens.give(estimated_tokens - actual_tokens)
+            self._condition.notify_all()
+    
+    def backoff(self, seconds: float):
+        """
+        Pause all requests for ``seconds`` (used when the API answers 429)
+        
+        Args:
+            seconds (float): Time to wait, normally taken from Retry-After
+        """
+        with self._condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        logger.warning(f"Rate limited by API, pausing requests for {seconds:.2f}s")
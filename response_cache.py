@@ -0,0 +1,183 @@
+"""
+Response Cache Module
+Persistent SQLite cache of OpenAI manufacturer analyses with TTL and LRU eviction
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = '.manufacturer_cache.sqlite'
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_SIZE_MB = 256
+
+
+def make_cache_key(*parts) -> str:
+    """
+    Build a stable cache key from the given parts
+    
+    Returns:
+        str: SHA-256 hex digest of the parts
+    """
+    return hashlib.sha256(json.dumps([str(p) for p in parts]).encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Stores parsed API responses on disk, keyed by part and prompt version"""
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: Optional[float] = DEFAULT_TTL_DAYS * 86400,
+                 max_size_bytes: Optional[int] = DEFAULT_MAX_SIZE_MB * 1024 * 1024, refresh: bool = False):
+        """
+        Initialize ResponseCache
+        
+        Args:
+            path (str): SQLite database file
+            ttl_seconds (float, optional): Entry lifetime. Entries never expire if None
+            max_size_bytes (int, optional): Size limit; least recently used entries are evicted beyond it
+            refresh (bool): Ignore existing entries but store fresh responses
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        logger.info(f"Response cache opened at {path} ({self._size / 1024 / 1024:.1f} MB)")
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached response
+        
+        Args:
+            key (str): Cache key from make_cache_key()
+        
+        Returns:
+            Dict: Cached response, or None on a miss, expiry or refresh
+        """
+        if self.refresh:
+            self.misses += 1
+            return None
+        
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            value, size, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= size
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        
+        return json.loads(value)
+    
+    def put(self, key: str, value: Dict):
+        """
+        Store a response, evicting least recently used entries if over the size limit
+        
+        Args:
+            key (str): Cache key from make_cache_key()
+            value (Dict): JSON-serializable response
+        """
+        payload = json.dumps(value)
+        size = len(payload)
+        now = time.time()
+        
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now)
+            )
+            self._size += size - (old[0] if old else 0)
+            
+            if self.max_size_bytes is not None and self._size > self.max_size_bytes:
+                self._evict()
+            
+            self._conn.commit()
+    
+    def delete(self, key: str):
+        """
+        Remove one entry (e.g. a response that can no longer be read)
+        
+        Args:
+            key (str): Cache key from make_cache_key()
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            self._size -= row[0]
+    
+    def _evict(self):
+        """Delete least recently used entries until the cache fits its size limit"""
+        evicted = 0
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_used ASC")
+        to_delete = []
+        for key, size in rows:
+            if self._size <= self.max_size_bytes:
+                break
+            to_delete.append((key,))
+            self._size -= size
+            evicted += 1
+        rows.close()
+        
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", to_delete)
+        logger.info(f"Evicted {evicted} least recently used cache entries")
+    
+    def purge(self):
+        """Remove every entry from the cache"""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+            self._size = 0
+        logger.info(f"Purged response cache at {self.path}")
+    
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
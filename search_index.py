@@ -0,0 +1,270 @@
+"""
+Search Index Module
+Case-insensitive substring and prefix search over the MPN and Model Description of
+analysis results, with a command line for looking parts up in a saved results file
+"""
+
+import os
+import sys
+import argparse
+import logging
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Columns searched, joined with a separator no query can contain
+SEARCH_COLUMNS = ['MPN', 'Model_Description']
+FIELD_SEPARATOR = '\n'
+
+# Code points fit in 21 bits, so a trigram packs into one int64 (3 x 21 bits)
+_CODE_SPACE = 0x110000
+
+# Columns printed by the command line
+RESULT_COLUMNS = ['ID', 'MPN', 'Model_Description', 'Top_Manufacturer', 'Avg_Credibility_Score']
+
+
+def _code_points(text: str) -> np.ndarray:
+    """Unicode code points of a string as int64"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+
+
+class SearchIndex:
+    """
+    Positional trigram index over the MPN and description of each results row
+    
+    The lower-cased texts of all rows are laid end to end, each followed by
+    two NUL characters, and every character position is filed under the
+    trigram starting there (packed into an integer). A query matches at
+    position p when each of its trigrams occurs at p plus that trigram's
+    offset, which is checked with binary searches on the posting arrays, so
+    matches are exact without re-reading any text. Queries of one or two
+    characters use the contiguous range of trigrams that start with them.
+    """
+    
+    def __init__(self, mpns: List, descriptions: List):
+        """
+        Build the index
+        
+        Args:
+            mpns (List): MPN of each row
+            descriptions (List): Model description of each row
+        """
+        texts = [
+            f"{mpn}{FIELD_SEPARATOR}{description}".lower().replace('\0', '')
+            for mpn, description in zip(mpns, descriptions)
+        ]
+        self.size = len(texts)
+        
+        # Sorted MPN keys for prefix lookups
+        mpn_keys = np.array([str(mpn).lower() for mpn in mpns], dtype=str)
+        self._mpn_order = np.argsort(mpn_keys, kind='stable')
+        self._mpn_keys = mpn_keys[self._mpn_order]
+        
+        # Row of each position in the concatenated text
+        self._position_rows = np.repeat(np.arange(self.size, dtype=np.int32), [len(text) + 2 for text in texts])
+        
+        codes = _code_points(''.join(text + '\0\0' for text in texts))
+        
+        # One trigram per real character; the NUL padding keeps trigrams within a row
+        starts = np.flatnonzero(codes[:-2] != 0) if len(codes) > 2 else np.array([], dtype=np.int64)
+        trigrams = (codes[starts] * _CODE_SPACE + codes[starts + 1]) * _CODE_SPACE + codes[starts + 2]
+        
+        # Posting list i is _positions[_offsets[i]:_offsets[i + 1]], ascending
+        order = np.argsort(trigrams, kind='stable')
+        self._positions = starts[order]
+        self._trigrams, first = np.unique(trigrams[order], return_index=True)
+        self._offsets = np.append(first, len(order))
+        
+        logger.info(f"Indexed {self.size} rows ({len(self._trigrams)} distinct trigrams)")
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'SearchIndex':
+        """
+        Build the index over a results DataFrame's MPN and Model_Description columns
+        
+        Args:
+            df (pd.DataFrame): Results DataFrame
+        
+        Returns:
+            SearchIndex: Index whose row positions are positions in df
+        """
+        return cls(df['MPN'].astype(str).tolist(), df['Model_Description'].astype(str).tolist())
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def search(self, query: str) -> np.ndarray:
+        """
+        Find the rows whose MPN or description contains the query (case-insensitive)
+        
+        Args:
+            query (str): Text to find
+        
+        Returns:
+            np.ndarray: Matching row positions, ascending (every row for an empty query)
+        """
+        query = query.lower()
+        if not query:
+            return np.arange(self.size)
+        if FIELD_SEPARATOR in query or '\0' in query:
+            return np.array([], dtype=np.int64)
+        
+        codes = _code_points(query)
+        if len(codes) < 3:
+            return self._rows_of(self._range_positions(codes))
+        
+        # Trigrams every third character (plus the last) cover the whole query
+        trigrams = (codes[:-2] * _CODE_SPACE + codes[1:-1]) * _CODE_SPACE + codes[2:]
+        offsets = sorted(set(range(0, len(trigrams), 3)) | {len(trigrams) - 1})
+        
+        postings = []
+        for offset in offsets:
+            posting = self._posting(trigrams[offset])
+            if len(posting) == 0:
+                return np.array([], dtype=np.int64)
+            postings.append((posting, offset))
+        postings.sort(key=lambda item: len(item[0]))
+        
+        # Candidate match starts from the rarest trigram, confirmed against the others
+        posting, offset = postings[0]
+        candidates = posting - offset
+        for posting, offset in postings[1:]:
+            wanted = candidates + offset
+            found = np.minimum(np.searchsorted(posting, wanted), len(posting) - 1)
+            candidates = candidates[posting[found] == wanted]
+            if len(candidates) == 0:
+                break
+        
+        return self._rows_of(candidates)
+    
+    def prefix(self, query: str) -> np.ndarray:
+        """
+        Find the rows whose MPN starts with the query (case-insensitive)
+        
+        Args:
+            query (str): MPN prefix
+        
+        Returns:
+            np.ndarray: Matching row positions, ascending
+        """
+        query = query.lower()
+        low = np.searchsorted(self._mpn_keys, query, side='left')
+        high = np.searchsorted(self._mpn_keys, query + '\U0010ffff', side='left')
+        return np.sort(self._mpn_order[low:high])
+    
+    def _posting(self, trigram: int) -> np.ndarray:
+        """Text positions where a trigram starts, ascending"""
+        i = np.searchsorted(self._trigrams, trigram)
+        if i == len(self._trigrams) or self._trigrams[i] != trigram:
+            return np.array([], dtype=np.int64)
+        return self._positions[self._offsets[i]:self._offsets[i + 1]]
+    
+    def _range_positions(self, codes: np.ndarray) -> np.ndarray:
+        """Text positions of every trigram starting with one or two given characters"""
+        low = codes[0] * _CODE_SPACE * _CODE_SPACE
+        if len(codes) == 2:
+            low += codes[1] * _CODE_SPACE
+            high = low + _CODE_SPACE
+        else:
+            high = low + _CODE_SPACE * _CODE_SPACE
+        
+        first, last = np.searchsorted(self._trigrams, [low, high])
+        return self._positions[self._offsets[first]:self._offsets[last]]
+    
+    def _rows_of(self, positions: np.ndarray) -> np.ndarray:
+        """Distinct rows containing the given text positions, ascending"""
+        hits = np.zeros(self.size, dtype=bool)
+        hits[self._position_rows[positions]] = True
+        return np.flatnonzero(hits)
+
+
+def load_results(path: str) -> pd.DataFrame:
+    """
+    Read a saved results file
+    
+    Args:
+        path (str): Results file (.xlsx, .parquet, .arrow, .ndjson or .csv)
+    
+    Returns:
+        pd.DataFrame: The results
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.parquet':
+        return pd.read_parquet(path)
+    if extension == '.arrow':
+        return pd.read_feather(path)
+    if extension == '.ndjson':
+        return pd.read_json(path, lines=True, dtype={column: str for column in SEARCH_COLUMNS})
+    if extension == '.csv':
+        return pd.read_csv(path, dtype={column: str for column in SEARCH_COLUMNS})
+    
+    # Excel reports keep the results on their first sheet
+    return pd.read_excel(path, sheet_name=0, dtype={column: str for column in SEARCH_COLUMNS})
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command line interface"""
+    parser = argparse.ArgumentParser(
+        description='Look up parts in a saved results file by MPN or description',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Parts whose MPN or description contains "lm317"
+  python search_index.py results.xlsx lm317
+  
+  # Parts whose MPN starts with "ad"
+  python search_index.py results.parquet ad --prefix
+        """
+    )
+    
+    parser.add_argument(
+        'results_file',
+        help='Results file written by main.py (.xlsx, .parquet, .arrow, .ndjson or .csv)'
+    )
+    
+    parser.add_argument(
+        'query',
+        help='Text to find (case-insensitive)'
+    )
+    
+    parser.add_argument(
+        '--prefix',
+        action='store_true',
+        help='Match MPNs starting with the query instead of MPNs or descriptions containing it'
+    )
+    
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=50,
+        help='Maximum number of rows to print (default: 50, 0 for all)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        df = load_results(args.results_file)
+        index = SearchIndex.from_frame(df)
+        rows = index.prefix(args.query) if args.prefix else index.search(args.query)
+        
+        matches = df.iloc[rows]
+        columns = [column for column in RESULT_COLUMNS if column in matches.columns]
+        shown = matches if args.limit == 0 else matches.head(args.limit)
+        
+        if len(shown):
+            print(shown[columns].to_string(index=False))
+        print(f"\n{len(matches)} of {len(df)} parts match '{args.query}'")
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Search error: {str(e)}")
+        print(f"\n✗ Error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Tracing Module
+Timing spans around the stages of a run (load, clean, validate, query, export),
+written as Chrome trace JSON, plus a cProfile hook
+"""
+
+import os
+import json
+import time
+import cProfile
+import logging
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Shared do-nothing span, so a disabled tracer allocates nothing per span
+_NULL_SPAN = nullcontext()
+
+
+class NullTracer:
+    """Tracer that records nothing; used when tracing is off"""
+    
+    enabled = False
+    
+    def span(self, name: str, **args):
+        """
+        Time a block of code (does nothing here)
+        
+        Args:
+            name (str): Span name
+            **args: Extra details shown with the span
+        """
+        return _NULL_SPAN
+
+
+class Tracer(NullTracer):
+    """
+    Records named, nested timing spans from any thread
+    
+    Spans are written in the Chrome trace event format, which chrome://tracing,
+    Perfetto and speedscope all open. Spans on the finder's worker threads
+    show up as separate rows, so request concurrency is visible.
+    """
+    
+    enabled = True
+    
+    def __init__(self, origin: Optional[float] = None):
+        """
+        Initialize Tracer
+        
+        Args:
+            origin (float, optional): time.perf_counter() value span times are
+                relative to. Defaults to now; pass the parent tracer's origin
+                to record spans in a worker process and merge them with extend()
+        """
+        self.events: List[Dict] = []
+        self.thread_names: Dict[Tuple[int, int], str] = {}
+        self.origin = time.perf_counter() if origin is None else origin
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def span(self, name: str, **args):
+        """
+        Time a block of code
+        
+        Args:
+            name (str): Span name (e.g. 'load', 'query')
+            **args: Extra details shown with the span
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            event = {
+                'name': name,
+                'ph': 'X',
+                'ts': round((start - self.origin) * 1e6, 1),
+                'dur': round((end - start) * 1e6, 1),
+                'pid': os.getpid(),
+                'tid': thread.ident,
+                'args': args
+            }
+            with self._lock:
+                self.events.append(event)
+                self.thread_names[(event['pid'], thread.ident)] = thread.name
+    
+    def extend(self, events: List[Dict], thread_names: Dict[Tuple[int, int], str]):
+        """
+        Add spans recorded by another tracer with the same origin (e.g. in a worker process)
+        
+        Args:
+            events (List[Dict]): The other tracer's events
+            thread_names (Dict): The other tracer's thread names by (pid, tid)
+        """
+        with self._lock:
+            self.events.extend(events)
+            self.thread_names.update(thread_names)
+    
+    def stage_times(self) -> Dict[str, float]:
+        """
+        Total seconds spent in each span name
+        
+        Returns:
+            Dict[str, float]: Seconds by span name, in order of first appearance
+        """
+        totals = {}
+        with self._lock:
+            for event in self.events:
+                totals[event['name']] = totals.get(event['name'], 0.0) + event['dur'] / 1e6
+        return totals
+    
+    def log_summary(self):
+        """Log the time spent in each stage"""
+        stages = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in self.stage_times().items())
+        logger.info(f"Stage timings: {stages or 'none recorded'}")
+    
+    def write(self, path: str) -> str:
+        """
+        Write the spans as Chrome trace JSON
+        
+        Args:
+            path (str): Output file
+        
+        Returns:
+            str: The path written
+        """
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event['ts'])
+            thread_names = dict(self.thread_names)
+        
+        # Name the threads so the trace viewer labels its rows
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+            for (pid, tid), name in thread_names.items()
+        ]
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}, f)
+        
+        logger.info(f"Trace with {len(events)} spans written to {path}")
+        return path
+
+
+@contextmanager
+def profiled(path: Optional[str] = None):
+    """
+    Run a block under cProfile and dump the stats (does nothing without a path)
+    
+    cProfile only sees the thread that enters the block; work handed to
+    other threads appears as time spent waiting on them.
+    
+    Args:
+        path (str, optional): .prof file to write (open with snakeviz or pstats)
+    """
+    if not path:
+        yield
+        return
+    
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        logger.info(f"Profile written to {path}")